@@ -1,5 +1,6 @@
 import tkinter as tk
 from components.cardComponentAP import CardComponentAP  # Import the card component
+from codecrux.benchmark import SEARCHES, SORTS
 from PIL import Image, ImageTk
 
 
@@ -22,10 +23,16 @@ class AlgorithmPage:
         # Section for algorithm cards
         self.create_algorithm_cards()
 
+        # Sorts can race each other, and sorts and searches can show the
+        # charts of the benchmark suite
+        if self.algo_type in ("Sorting Algorithms", "Searching Algorithms"):
+            self.create_tool_buttons()
+
         # Add a button to go back to the home page or previous page
         self.create_previous_button()
 
-    def get_algo_options(self, algo_type):
+    @staticmethod
+    def get_algo_options(algo_type):
         """Returns the options available under each algorithm type."""
         options = {
             "Sorting Algorithms": [
@@ -119,6 +126,42 @@ class AlgorithmPage:
                     )
                     card.pack(side=tk.LEFT, padx=10)
 
+    def create_tool_buttons(self):
+        """Creates the 'Race' (sorts only) and 'Benchmarks' buttons."""
+        tool_frame = tk.Frame(self.root, bg="#1e1e1e")
+        tool_frame.pack(pady=(10, 0))
+        tools = [("Benchmarks", self.show_benchmarks)]
+        if self.algo_type == "Sorting Algorithms":
+            tools.insert(0, ("Race", self.show_race))
+        for text, command in tools:
+            tool_button = tk.Button(
+                tool_frame,
+                text=text,
+                font=("Helvetica", 14),
+                bg="#ffcc00",
+                fg="#1e1e1e",
+                cursor="hand2",
+                activebackground="#ffcc00",
+                activeforeground="#1e1e1e",
+                command=command,
+            )
+            tool_button.pack(side=tk.LEFT, padx=10)
+
+    def show_race(self):
+        """Opens the page that races several sorts on the same input."""
+        from screens.sorting_algorithms import race
+
+        for widget in self.root.winfo_children():
+            widget.destroy()  # Clear the current widgets from the window
+        race.create_algorithm_page(self.root, self.algo_type)
+
+    def show_benchmarks(self):
+        """Opens the benchmark charts of the algorithms on this page."""
+        from components.benchmarkWindow import open_benchmarks
+
+        algorithms = SORTS if self.algo_type == "Sorting Algorithms" else SEARCHES
+        open_benchmarks(self.root, algorithms)
+
     def create_previous_button(self):
         """Creates the 'Go to Previous Page' button."""
         previous_button = tk.Button(
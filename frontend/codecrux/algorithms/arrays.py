@@ -0,0 +1,36 @@
+from codecrux.algorithms.hooks import NO_HOOKS
+
+# Array operations that shift elements one at a time, as a fixed-size array
+# would, and report every write to ``hooks``. They change ``values`` in place.
+
+
+def insert_at(values, position, value, hooks=NO_HOOKS):
+    # Shift elements to make space for the new element
+    values.append(None)  # Add a placeholder at the end
+    for i in range(len(values) - 1, position, -1):
+        values[i] = values[i - 1]
+        hooks.write(i, values[i])
+
+    # Insert the new element
+    values[position] = value
+    hooks.write(position, value)
+    return values
+
+
+def delete_at(values, position, hooks=NO_HOOKS):
+    """Delete the element at ``position``; returns it."""
+    deleted = values[position]
+    hooks.read(position)
+
+    # Shift the following elements left over it
+    for i in range(position, len(values) - 1):
+        values[i] = values[i + 1]
+        hooks.write(i, values[i])
+    values.pop()
+    return deleted
+
+
+def update_at(values, index, value, hooks=NO_HOOKS):
+    values[index] = value
+    hooks.write(index, value)
+    return values
@@ -0,0 +1,142 @@
+class Hooks:
+    """Receives the elementary operations of an algorithm as it runs.
+
+    Every algorithm in ``codecrux.algorithms`` reports what it does to its
+    arrays through a hooks object: ``compare``, ``swap``, ``read`` and
+    ``write`` on an element of a buffer (0 is the input array, others are
+    auxiliary arrays numbered by ``allocate``), and a few markers that say
+    what the algorithm is working on. The methods here do nothing, so an
+    algorithm run with ``NO_HOOKS`` costs little more than one without
+    any instrumentation. Subclasses count the operations
+    (``OperationCounter``), log them (``EventLog``) or record them for
+    playback (``playback.trace.TraceHooks``).
+    """
+
+    def compare(self, i, j=None, buffer=0):
+        """Elements ``i`` and ``j`` are compared.
+
+        ``j`` is None when element ``i`` is compared with a value held aside,
+        such as a key or a search target.
+        """
+
+    def swap(self, i, j, buffer=0):
+        pass
+
+    def read(self, i, buffer=0):
+        """Element ``i`` is read on its own, e.g. as a key or to be counted."""
+
+    def write(self, i, value, buffer=0):
+        pass
+
+    def allocate(self, size, buffer=None):
+        """An auxiliary array of ``size`` elements is allocated.
+
+        ``buffer`` numbers it when its reads and writes are reported too.
+        """
+
+    def free(self, size):
+        """An auxiliary array of ``size`` elements is no longer needed."""
+
+    def focus(self, buffer):
+        """The algorithm moves on to work on ``buffer``."""
+
+    def pivot(self, i):
+        """Element ``i`` is the pivot or current minimum; -1 clears it."""
+
+    def window(self, low, high):
+        """Only elements ``low`` to ``high`` (inclusive) are still searched."""
+
+    def sorted_range(self, start, stop):
+        """Elements ``start`` to ``stop - 1`` are in their final position."""
+
+
+NO_HOOKS = Hooks()
+
+
+class OperationCounter(Hooks):
+    """Counts the operations of a run.
+
+    A comparison of two elements counts as two reads and a swap as two
+    reads and two writes. ``allocated`` is the total size of the auxiliary
+    arrays and ``peak`` the most auxiliary elements alive at once.
+    """
+
+    def __init__(self):
+        self.comparisons = 0
+        self.swaps = 0
+        self.reads = 0
+        self.writes = 0
+        self.allocated = 0
+        self.live = 0
+        self.peak = 0
+
+    def compare(self, i, j=None, buffer=0):
+        self.comparisons += 1
+        self.reads += 1 if j is None else 2
+
+    def swap(self, i, j, buffer=0):
+        self.swaps += 1
+        self.reads += 2
+        self.writes += 2
+
+    def read(self, i, buffer=0):
+        self.reads += 1
+
+    def write(self, i, value, buffer=0):
+        self.writes += 1
+
+    def allocate(self, size, buffer=None):
+        self.allocated += size
+        self.live += size
+        self.peak = max(self.peak, self.live)
+
+    def free(self, size):
+        self.live -= size
+
+    def counts(self):
+        """Return the counts as a dict, e.g. for a CSV row."""
+        return {
+            "comparisons": self.comparisons,
+            "swaps": self.swaps,
+            "reads": self.reads,
+            "writes": self.writes,
+            "allocated": self.allocated,
+            "peak": self.peak,
+        }
+
+
+class EventLog(Hooks):
+    """Keeps every reported operation as a ``(name, *arguments)`` tuple."""
+
+    def __init__(self):
+        self.events = []
+
+    def compare(self, i, j=None, buffer=0):
+        self.events.append(("compare", i, j, buffer))
+
+    def swap(self, i, j, buffer=0):
+        self.events.append(("swap", i, j, buffer))
+
+    def read(self, i, buffer=0):
+        self.events.append(("read", i, buffer))
+
+    def write(self, i, value, buffer=0):
+        self.events.append(("write", i, value, buffer))
+
+    def allocate(self, size, buffer=None):
+        self.events.append(("allocate", size, buffer))
+
+    def free(self, size):
+        self.events.append(("free", size))
+
+    def focus(self, buffer):
+        self.events.append(("focus", buffer))
+
+    def pivot(self, i):
+        self.events.append(("pivot", i))
+
+    def window(self, low, high):
+        self.events.append(("window", low, high))
+
+    def sorted_range(self, start, stop):
+        self.events.append(("sorted_range", start, stop))
@@ -0,0 +1,30 @@
+from codecrux.algorithms.hooks import NO_HOOKS
+
+# Every search returns the index of ``target`` in ``values``, or -1, reporting
+# each element it compares with the target to ``hooks``.
+
+
+def linear_search(values, target, hooks=NO_HOOKS):
+    for i in range(len(values)):
+        hooks.compare(i)
+        if values[i] == target:
+            return i
+    return -1
+
+
+def binary_search(values, target, hooks=NO_HOOKS):
+    """Search the sorted list ``values`` by halving the range still in play."""
+    left, right = 0, len(values) - 1
+
+    while left <= right:
+        mid = (left + right) // 2
+        hooks.window(left, right)
+        hooks.compare(mid)
+
+        if values[mid] == target:
+            return mid
+        elif values[mid] < target:
+            left = mid + 1
+        else:
+            right = mid - 1
+    return -1
@@ -0,0 +1,558 @@
+import random
+
+from codecrux.algorithms.hooks import NO_HOOKS
+
+# Every sort takes a list, sorts it in place and returns it, reporting its
+# operations to ``hooks`` (see ``codecrux.algorithms.hooks.Hooks``).
+
+
+def bubble_sort(values, hooks=NO_HOOKS):
+    n = len(values)
+    for i in range(n):
+        for j in range(0, n - i - 1):
+            hooks.compare(j, j + 1)
+            if values[j] > values[j + 1]:
+                values[j], values[j + 1] = values[j + 1], values[j]
+                hooks.swap(j, j + 1)
+    hooks.sorted_range(0, n)
+    return values
+
+
+def selection_sort(values, hooks=NO_HOOKS):
+    n = len(values)
+    for i in range(n):
+        min_idx = i
+        hooks.pivot(min_idx)
+        for j in range(i + 1, n):
+            hooks.compare(j, min_idx)
+            if values[j] < values[min_idx]:
+                min_idx = j
+                hooks.pivot(min_idx)
+
+        values[i], values[min_idx] = values[min_idx], values[i]
+        hooks.pivot(-1)
+        hooks.swap(i, min_idx)
+    hooks.sorted_range(0, n)
+    return values
+
+
+def insertion_sort(values, hooks=NO_HOOKS):
+    n = len(values)
+    for i in range(1, n):
+        key = values[i]
+        hooks.read(i)
+        j = i - 1
+        while j >= 0:
+            hooks.compare(j)
+            if values[j] <= key:
+                break
+            values[j + 1] = values[j]
+            hooks.write(j + 1, values[j])
+            j -= 1
+
+        values[j + 1] = key
+        hooks.write(j + 1, key)
+    hooks.sorted_range(0, n)
+    return values
+
+
+def merge_sort(values, hooks=NO_HOOKS):
+    def merge(l, m, r):
+        # The two halves are copied out, then merged back in place
+        hooks.allocate(r - l + 1)
+        for k in range(l, r + 1):
+            hooks.read(k)
+        left = values[l : m + 1]
+        right = values[m + 1 : r + 1]
+        i = j = 0
+        k = l
+
+        while i < len(left) and j < len(right):
+            hooks.compare(k)
+            if left[i] <= right[j]:
+                values[k] = left[i]
+                i += 1
+            else:
+                values[k] = right[j]
+                j += 1
+            hooks.write(k, values[k])
+            k += 1
+
+        while i < len(left):
+            values[k] = left[i]
+            hooks.write(k, values[k])
+            i += 1
+            k += 1
+
+        while j < len(right):
+            values[k] = right[j]
+            hooks.write(k, values[k])
+            j += 1
+            k += 1
+        hooks.free(r - l + 1)
+
+    def merge_sort_recursive(l, r):
+        if l < r:
+            m = (l + r) // 2
+            merge_sort_recursive(l, m)
+            merge_sort_recursive(m + 1, r)
+            merge(l, m, r)
+
+    merge_sort_recursive(0, len(values) - 1)
+    hooks.sorted_range(0, len(values))
+    return values
+
+
+def bottom_up_merge_sort(values, hooks=NO_HOOKS, natural=False):
+    """Iterative merge sort that merges back and forth between two arrays.
+
+    The input (buffer 0) and one auxiliary array of the same length
+    (buffer 1), allocated once, take turns as the source and destination
+    of a pass: each pass merges neighbouring runs of the source into the
+    destination, doubling the run length. The runs start one element long
+    and are found by stepping through the array, so no other array is
+    needed. With ``natural`` they start as the ascending stretches already
+    in the input, so sorted parts are merged as they are rather than split
+    up; their starts are kept in a list, one entry per run. If the last pass
+    ends in buffer 1 the result is copied back.
+    """
+    n = len(values)
+    buffers = [values, [0] * n]
+    hooks.allocate(n, buffer=1)
+
+    def merge(source, low, mid, high):
+        # Runs low..mid - 1 and mid..high - 1; a lone last run (mid == high)
+        # is copied over as it is
+        src, dst = buffers[source], buffers[1 - source]
+        i, j = low, mid
+        for out in range(low, high):
+            if i < mid and j < high:
+                hooks.compare(i, j, buffer=source)
+                take_left = src[i] <= src[j]
+            else:
+                take_left = i < mid
+                hooks.read(i if take_left else j, buffer=source)
+            if take_left:
+                dst[out] = src[i]
+                i += 1
+            else:
+                dst[out] = src[j]
+                j += 1
+            hooks.write(out, dst[out], buffer=1 - source)
+
+    source = 0
+    if natural:
+        # Start of every run, then n
+        bounds = [0]
+        for i in range(1, n):
+            hooks.compare(i - 1, i)
+            if values[i - 1] > values[i]:
+                bounds.append(i)
+        bounds.append(n)
+        while len(bounds) > 2:
+            merged = [0]
+            for k in range(0, len(bounds) - 1, 2):
+                low, mid = bounds[k], bounds[k + 1]
+                high = bounds[k + 2] if k + 2 < len(bounds) else mid
+                merge(source, low, mid, high)
+                merged.append(high)
+            bounds = merged
+            source = 1 - source
+    else:
+        width = 1
+        while width < n:
+            for low in range(0, n, 2 * width):
+                merge(source, low, min(low + width, n), min(low + 2 * width, n))
+            width *= 2
+            source = 1 - source
+
+    if source == 1:
+        for i in range(n):
+            values[i] = buffers[1][i]
+            hooks.write(i, values[i])
+    hooks.free(n)
+    hooks.sorted_range(0, n)
+    return values
+
+
+PIVOTS = ("last", "median-of-three", "random")
+
+
+def quick_sort(
+    values, hooks=NO_HOOKS, pivot="last", three_way=False, fallback=False, rng=random
+):
+    """Quick sort with a choice of pivot and partition scheme.
+
+    ``pivot`` is one of ``PIVOTS``: the last element of the range, the median
+    of its first, middle and last elements (which are sorted in place), or a
+    random one (from ``rng``).
+    The chosen pivot is swapped to the end for the Lomuto partition, or to
+    the front for the three-way (Bentley-McIlroy) partition, which gathers
+    all elements equal to the pivot in the middle so that runs of duplicates
+    are settled at once. Its scans from both ends keep sorted input balanced
+    where a Dutch national flag partition would reverse the upper part.
+
+    Only the smaller part is sorted recursively and the larger one by the
+    loop, so the recursion never goes deeper than ``log2(n)``. With
+    ``fallback`` a range that is still unsorted after ``2 * log2(n)``
+    partitions is heap sorted instead (as introsort does), which bounds the
+    run to O(n log n) whatever the pivots.
+    """
+    if pivot not in PIVOTS:
+        raise ValueError(f"Unknown pivot strategy: {pivot}")
+
+    def move(i, j):
+        if i != j:
+            values[i], values[j] = values[j], values[i]
+            hooks.swap(i, j)
+
+    def choose_pivot(low, high):
+        if pivot == "random":
+            return rng.randint(low, high)
+        if pivot == "last" or high - low < 2:
+            return high
+        # Sort the three candidates in place and keep the middle one; leaving
+        # the largest at the end stops a partition from handing the next
+        # range an extreme first element, which would be a candidate again
+        middle = (low + high) // 2
+        hooks.compare(middle, low)
+        if values[middle] < values[low]:
+            move(low, middle)
+        hooks.compare(high, middle)
+        if values[high] < values[middle]:
+            move(middle, high)
+            hooks.compare(middle, low)
+            if values[middle] < values[low]:
+                move(low, middle)
+        return middle
+
+    def partition(low, high):
+        move(choose_pivot(low, high), high)
+        pivot_value = values[high]
+        hooks.pivot(high)
+        i = low - 1
+        for j in range(low, high):
+            hooks.compare(j, high)
+            if values[j] < pivot_value:
+                i += 1
+                values[i], values[j] = values[j], values[i]
+                hooks.swap(i, j)
+
+        values[i + 1], values[high] = values[high], values[i + 1]
+        hooks.pivot(-1)
+        hooks.swap(i + 1, high)
+        return i + 1, i + 1
+
+    def partition_three_way(low, high):
+        # Bentley-McIlroy: two scans from the ends, as in Hoare's partition, that
+        # park the elements equal to the pivot at both ends of the range
+        # (values[low:p + 1] and values[q:high + 1]) and swap them into the
+        # middle at the end; values[low] keeps the pivot, so comparisons are
+        # made with it
+        move(choose_pivot(low, high), low)
+        pivot_value = values[low]
+        hooks.pivot(low)
+        i, j = low, high + 1
+        p, q = low, high + 1
+        while True:
+            i += 1
+            hooks.compare(i, low)
+            while values[i] < pivot_value and i < high:
+                i += 1
+                hooks.compare(i, low)
+            j -= 1
+            hooks.compare(j, low)
+            while values[j] > pivot_value:
+                j -= 1
+                hooks.compare(j, low)
+            if i >= j:
+                if i == j and values[i] == pivot_value:
+                    p += 1
+                    move(p, i)
+                break
+            move(i, j)
+            hooks.compare(i, low)
+            if values[i] == pivot_value:
+                p += 1
+                move(p, i)
+            hooks.compare(j, low)
+            if values[j] == pivot_value:
+                q -= 1
+                move(q, j)
+
+        # values[p + 1:j + 1] < pivot and values[j + 1:q] > pivot: swap the
+        # equal ends next to each other, the shorter side of each pair decides;
+        # the pivot leaves values[low] too, so its highlight is cleared first
+        hooks.pivot(-1)
+        size = min(p - low + 1, j - p)
+        for k in range(size):
+            move(low + k, j + 1 - size + k)
+        size = min(high - q + 1, q - j - 1)
+        for k in range(size):
+            move(j + 1 + k, high + 1 - size + k)
+        return j - (p - low), j + 1 + (high - q)
+
+    split = partition_three_way if three_way else partition
+
+    def quick_sort_helper(low, high, depth):
+        while low < high:
+            if fallback and depth == 0:
+                heap_sort_range(values, low, high, hooks)
+                return
+            depth -= 1
+            first, last = split(low, high)
+            # values[first..last] hold the pivot value and are in place
+            if first - low < high - last:
+                quick_sort_helper(low, first - 1, depth)
+                low = last + 1
+            else:
+                quick_sort_helper(last + 1, high, depth)
+                high = first - 1
+
+    n = len(values)
+    quick_sort_helper(0, n - 1, 2 * n.bit_length())
+    hooks.sorted_range(0, n)
+    return values
+
+
+def sift_down(values, low, root, size, hooks=NO_HOOKS):
+    """Sift heap node ``root`` down a max heap of ``size`` elements.
+
+    The heap is stored from ``values[low]`` on, node ``k`` at ``low + k``.
+    """
+    while True:
+        largest = root
+        left = 2 * root + 1
+        right = 2 * root + 2
+
+        if left < size:
+            hooks.compare(low + left, low + largest)
+            if values[low + left] > values[low + largest]:
+                largest = left
+
+        if right < size:
+            hooks.compare(low + right, low + largest)
+            if values[low + right] > values[low + largest]:
+                largest = right
+
+        if largest == root:
+            return
+        i, j = low + root, low + largest
+        values[i], values[j] = values[j], values[i]
+        hooks.swap(i, j)
+        root = largest
+
+
+def floyd_sift_down(values, low, root, size, hooks=NO_HOOKS):
+    """Floyd's variant of ``sift_down``: down to a leaf first, then back up.
+
+    Each level only compares the two children and swaps the larger one up,
+    without comparing it with the sifted element, which is then sifted up
+    from the leaf it reached. That element usually belongs near the bottom
+    (it was just taken from there), so the way back up is short and a sift
+    takes about half the comparisons of ``sift_down``.
+    """
+    i = root
+    while 2 * i + 1 < size:
+        child = 2 * i + 1
+        if child + 1 < size:
+            hooks.compare(low + child + 1, low + child)
+            if values[low + child + 1] > values[low + child]:
+                child += 1
+        values[low + i], values[low + child] = values[low + child], values[low + i]
+        hooks.swap(low + i, low + child)
+        i = child
+
+    while i > root:
+        parent = (i - 1) // 2
+        hooks.compare(low + i, low + parent)
+        if not values[low + i] > values[low + parent]:
+            return
+        values[low + i], values[low + parent] = values[low + parent], values[low + i]
+        hooks.swap(low + i, low + parent)
+        i = parent
+
+
+def heap_sort_range(values, low, high, hooks=NO_HOOKS, floyd=False):
+    """Heap sort ``values[low..high]`` (inclusive) in place.
+
+    With ``floyd`` the heap is sifted with ``floyd_sift_down``. Every element
+    moved past the end of the shrinking heap is reported as sorted, so the
+    heap is always ``values[low..]`` up to the first sorted index.
+    """
+    sift = floyd_sift_down if floyd else sift_down
+    n = high - low + 1
+
+    # Build max heap
+    for i in range(n // 2 - 1, -1, -1):
+        sift(values, low, i, n, hooks)
+
+    # Extract elements from heap one by one
+    for i in range(n - 1, 0, -1):
+        values[low], values[low + i] = values[low + i], values[low]
+        hooks.swap(low, low + i)
+        hooks.sorted_range(low + i, low + i + 1)
+        sift(values, low, 0, i, hooks)
+
+
+def heap_sort(values, hooks=NO_HOOKS, floyd=False):
+    heap_sort_range(values, 0, len(values) - 1, hooks, floyd)
+    hooks.sorted_range(0, len(values))
+    return values
+
+
+def counting_sort(values, hooks=NO_HOOKS):
+    n = len(values)
+    if n == 0:
+        return values
+    max_val = max(values)
+    min_val = min(values)
+    range_val = max_val - min_val + 1
+
+    # Buffer 1 is the count array, buffer 2 the output array
+    count = [0] * range_val
+    hooks.allocate(range_val, buffer=1)
+    hooks.focus(0)
+
+    for i in range(n):
+        hooks.read(i)
+        index = values[i] - min_val
+        count[index] += 1
+        hooks.write(index, count[index], buffer=1)
+
+    hooks.focus(1)
+    for i in range(1, range_val):
+        count[i] += count[i - 1]
+        hooks.write(i, count[i], buffer=1)
+
+    output = [0] * n
+    hooks.allocate(n, buffer=2)
+    for i in range(n - 1, -1, -1):
+        hooks.read(i)
+        index = values[i] - min_val
+        output[count[index] - 1] = values[i]
+        count[index] -= 1
+        hooks.write(index, count[index], buffer=1)
+        hooks.write(count[index], values[i], buffer=2)
+
+    for i in range(n):
+        values[i] = output[i]
+        hooks.write(i, output[i])
+    hooks.free(range_val + n)
+    hooks.sorted_range(0, n)
+    return values
+
+
+def radix_sort(values, hooks=NO_HOOKS):
+    """Least significant digit radix sort of non-negative integers."""
+
+    def counting_sort(exp):
+        n = len(values)
+        count = [0] * 10
+
+        hooks.focus(0)
+        for i in range(n):
+            hooks.read(i)
+            index = values[i] // exp
+            count[index % 10] += 1
+
+        for i in range(1, 10):
+            count[i] += count[i - 1]
+
+        # Buffer 1 is the output array of this pass
+        output = [0] * n
+        hooks.allocate(n, buffer=1)
+        i = n - 1
+        while i >= 0:
+            hooks.read(i)
+            index = values[i] // exp
+            output[count[index % 10] - 1] = values[i]
+            count[index % 10] -= 1
+            hooks.write(count[index % 10], values[i], buffer=1)
+            i -= 1
+
+        for i in range(n):
+            values[i] = output[i]
+            hooks.write(i, output[i])
+        hooks.free(n)
+
+    if not values:
+        return values
+    max_num = max(values)
+    exp = 1
+    while max_num // exp > 0:
+        counting_sort(exp)
+        exp *= 10
+
+    hooks.focus(0)
+    hooks.sorted_range(0, len(values))
+    return values
+
+
+def bucket_indices(values, count):
+    """Return the bucket (0 to ``count - 1``) of each value, by equal ranges.
+
+    The ranges split ``min(values)..max(values)``; the maximum falls into the
+    last bucket, and when every value is the same they all go to the first
+    one. ``rendering.buckets.BucketLayout`` lays the bars out with these too.
+    """
+    if len(values) == 0:
+        return []
+    low = min(values)
+    width = (max(values) - low) / count
+    if width == 0:
+        return [0] * len(values)
+    last = count - 1
+    return [min(int((value - low) // width), last) for value in values]
+
+
+def bucket_sort(values, hooks=NO_HOOKS, count=10):
+    """Bucket sort over ``count`` equal value ranges.
+
+    The bucket sizes are counted first, so that all buckets share one
+    auxiliary array (buffer 1): bucket ``k`` takes the slots from
+    ``offsets[k]`` on and nothing moves once dropped into its bucket. Each
+    bucket is then insertion sorted in place.
+    """
+    n = len(values)
+    if n == 0:
+        return values
+    index = bucket_indices(values, count)
+    offsets = [0] * (count + 1)
+    for k in index:
+        offsets[k + 1] += 1
+    for k in range(count):
+        offsets[k + 1] += offsets[k]
+
+    # Distribute elements into buckets
+    buckets = [0] * n
+    hooks.allocate(n, buffer=1)
+    filled = offsets[:count]
+    for i, k in enumerate(index):
+        hooks.read(i)
+        buckets[filled[k]] = values[i]
+        hooks.write(filled[k], values[i], buffer=1)
+        filled[k] += 1
+
+    # Sort individual buckets
+    for k in range(count):
+        for i in range(offsets[k] + 1, offsets[k + 1]):
+            key = buckets[i]
+            hooks.read(i, buffer=1)
+            j = i - 1
+            while j >= offsets[k]:
+                hooks.compare(j, buffer=1)
+                if buckets[j] <= key:
+                    break
+                buckets[j + 1] = buckets[j]
+                hooks.write(j + 1, buckets[j], buffer=1)
+                j -= 1
+            buckets[j + 1] = key
+            hooks.write(j + 1, key, buffer=1)
+        hooks.sorted_range(0, offsets[k + 1])
+
+    for i in range(n):
+        values[i] = buckets[i]
+        hooks.write(i, buckets[i])
+    hooks.free(n)
+    return values
@@ -0,0 +1,290 @@
+from codecrux.algorithms.hooks import NO_HOOKS
+
+# The structures report the positions they read and write to ``hooks``: the
+# index of an item in a stack or queue, or of a node counted from the head.
+
+
+class Stack:
+    def __init__(self, hooks=NO_HOOKS):
+        self.items = []
+        self.hooks = hooks
+
+    def push(self, item):
+        self.items.append(item)
+        self.hooks.write(len(self.items) - 1, item)
+
+    def pop(self):
+        if not self.is_empty():
+            self.hooks.read(len(self.items) - 1)
+            return self.items.pop()
+        return None
+
+    def peek(self):
+        if not self.is_empty():
+            self.hooks.read(len(self.items) - 1)
+            return self.items[-1]
+        return None
+
+    def is_empty(self):
+        return len(self.items) == 0
+
+    def size(self):
+        return len(self.items)
+
+    def get_items(self):
+        return self.items.copy()
+
+
+class Queue:
+    def __init__(self, hooks=NO_HOOKS):
+        self.items = []
+        self.hooks = hooks
+
+    def enqueue(self, item):
+        self.items.append(item)
+        self.hooks.write(len(self.items) - 1, item)
+
+    def dequeue(self):
+        if not self.is_empty():
+            self.hooks.read(0)
+            return self.items.pop(0)
+        return None
+
+    def front(self):
+        if not self.is_empty():
+            self.hooks.read(0)
+            return self.items[0]
+        return None
+
+    def rear(self):
+        if not self.is_empty():
+            self.hooks.read(len(self.items) - 1)
+            return self.items[-1]
+        return None
+
+    def is_empty(self):
+        return len(self.items) == 0
+
+    def size(self):
+        return len(self.items)
+
+    def get_items(self):
+        return self.items.copy()
+
+
+class Node:
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+
+class SinglyLinkedList:
+    def __init__(self, hooks=NO_HOOKS):
+        self.head = None
+        self.hooks = hooks
+
+    def insert_at_beginning(self, data):
+        new_node = Node(data)
+        new_node.next = self.head
+        self.head = new_node
+        self.hooks.write(0, data)
+
+    def insert_at_end(self, data):
+        new_node = Node(data)
+        if not self.head:
+            self.head = new_node
+            self.hooks.write(0, data)
+            return
+        current = self.head
+        position = 0
+        while current.next:
+            self.hooks.read(position)
+            current = current.next
+            position += 1
+        current.next = new_node
+        self.hooks.write(position + 1, data)
+
+    def insert_at_position(self, data, position):
+        if position == 0:
+            self.insert_at_beginning(data)
+            return
+        new_node = Node(data)
+        current = self.head
+        for index in range(position - 1):
+            if current is None:
+                raise IndexError("Position out of range")
+            self.hooks.read(index)
+            current = current.next
+        new_node.next = current.next
+        current.next = new_node
+        self.hooks.write(position, data)
+
+    def delete_at_beginning(self):
+        if not self.head:
+            return
+        self.head = self.head.next
+
+    def delete_at_end(self):
+        if not self.head:
+            return
+        if not self.head.next:
+            self.head = None
+            return
+        current = self.head
+        position = 0
+        while current.next.next:
+            self.hooks.read(position)
+            current = current.next
+            position += 1
+        current.next = None
+
+    def delete_at_position(self, position):
+        if not self.head:
+            return
+        if position == 0:
+            self.head = self.head.next
+            return
+        current = self.head
+        for index in range(position - 1):
+            if current is None or current.next is None:
+                raise IndexError("Position out of range")
+            self.hooks.read(index)
+            current = current.next
+        current.next = current.next.next
+
+    def traverse(self):
+        elements = []
+        current = self.head
+        while current:
+            self.hooks.read(len(elements))
+            elements.append(current.data)
+            current = current.next
+        return elements
+
+    def search(self, data):
+        current = self.head
+        position = 0
+        while current:
+            self.hooks.compare(position)
+            if current.data == data:
+                return position
+            current = current.next
+            position += 1
+        return -1
+
+
+class DoublyNode:
+    def __init__(self, data):
+        self.data = data
+        self.prev = None
+        self.next = None
+
+
+class DoublyLinkedList:
+    def __init__(self, hooks=NO_HOOKS):
+        self.head = None
+        self.tail = None
+        self.length = 0  # Kept to report the position of the tail
+        self.hooks = hooks
+
+    def insert_at_beginning(self, data):
+        new_node = DoublyNode(data)
+        if not self.head:
+            self.head = self.tail = new_node
+        else:
+            new_node.next = self.head
+            self.head.prev = new_node
+            self.head = new_node
+        self.length += 1
+        self.hooks.write(0, data)
+
+    def insert_at_end(self, data):
+        new_node = DoublyNode(data)
+        if not self.head:
+            self.head = self.tail = new_node
+        else:
+            new_node.prev = self.tail
+            self.tail.next = new_node
+            self.tail = new_node
+        self.length += 1
+        self.hooks.write(self.length - 1, data)
+
+    def insert_at_position(self, data, position):
+        if position == 0:
+            self.insert_at_beginning(data)
+            return
+        new_node = DoublyNode(data)
+        current = self.head
+        for index in range(position - 1):
+            if current is None:
+                raise IndexError("Position out of range")
+            self.hooks.read(index)
+            current = current.next
+        if current.next:
+            new_node.next = current.next
+            new_node.prev = current
+            current.next.prev = new_node
+            current.next = new_node
+            self.length += 1
+            self.hooks.write(position, data)
+        else:
+            self.insert_at_end(data)
+
+    def delete_at_beginning(self):
+        if not self.head:
+            return
+        if self.head == self.tail:
+            self.head = self.tail = None
+        else:
+            self.head = self.head.next
+            self.head.prev = None
+        self.length -= 1
+
+    def delete_at_end(self):
+        if not self.head:
+            return
+        if self.head == self.tail:
+            self.head = self.tail = None
+        else:
+            self.tail = self.tail.prev
+            self.tail.next = None
+        self.length -= 1
+
+    def delete_at_position(self, position):
+        if not self.head:
+            return
+        if position == 0:
+            self.delete_at_beginning()
+            return
+        current = self.head
+        for index in range(position):
+            if current is None:
+                raise IndexError("Position out of range")
+            self.hooks.read(index)
+            current = current.next
+        if current == self.tail:
+            self.delete_at_end()
+        else:
+            current.prev.next = current.next
+            current.next.prev = current.prev
+            self.length -= 1
+
+    def traverse(self):
+        elements = []
+        current = self.head
+        while current:
+            self.hooks.read(len(elements))
+            elements.append(current.data)
+            current = current.next
+        return elements
+
+    def search(self, data):
+        current = self.head
+        position = 0
+        while current:
+            self.hooks.compare(position)
+            if current.data == data:
+                return position
+            current = current.next
+            position += 1
+        return -1
@@ -0,0 +1,291 @@
+import argparse
+import csv
+import functools
+import math
+import os
+import random
+from time import perf_counter
+
+from codecrux.algorithms import searching, sorting
+from codecrux.algorithms.hooks import OperationCounter
+
+SORTS = (
+    "bubble_sort",
+    "selection_sort",
+    "insertion_sort",
+    "merge_sort",
+    "bottom_up_merge_sort",
+    "quick_sort",
+    "quick_sort_median3",
+    "quick_sort_random",
+    "quick_sort_3way",
+    "quick_sort_introsort",
+    "heap_sort",
+    "radix_sort",
+    "counting_sort",
+    "bucket_sort",
+)
+SEARCHES = ("linear_search", "binary_search")
+
+# Sorts of SORTS that run a sorting function with options: name -> (function,
+# keyword arguments)
+VARIANTS = {
+    "quick_sort_median3": ("quick_sort", {"pivot": "median-of-three"}),
+    "quick_sort_random": ("quick_sort", {"pivot": "random"}),
+    "quick_sort_3way": ("quick_sort", {"pivot": "median-of-three", "three_way": True}),
+    "quick_sort_introsort": (
+        "quick_sort",
+        {"pivot": "median-of-three", "fallback": True},
+    ),
+}
+SHAPES = ("random", "sorted", "reversed", "few-unique")
+SIZES = (128, 256, 512, 1024, 2048)
+
+FEW_UNIQUE = 8  # Distinct values of a few-unique input
+
+# Each timing repeats the call until it has run for this many seconds, and
+# reports the time per call
+MIN_TIME = 0.05
+
+RESULTS_DIR = "benchmarks"  # Default output directory, also read by the app
+COUNTS = ("comparisons", "swaps", "reads", "writes", "allocated", "peak")
+FIELDS = ("algorithm", "shape", "n", "seconds") + COUNTS
+FIT_FIELDS = ("algorithm", "shape", "seconds_exponent", "operations_exponent")
+
+
+def make_input(shape, n, rng):
+    """Return ``n`` non-negative integers (below ``n``) of the given shape."""
+    if shape == "random":
+        return [rng.randrange(n) for _ in range(n)]
+    if shape == "sorted":
+        return list(range(n))
+    if shape == "reversed":
+        return list(range(n - 1, -1, -1))
+    if shape == "few-unique":
+        return [rng.randrange(FEW_UNIQUE) for _ in range(n)]
+    raise ValueError(f"Unknown input shape: {shape}")
+
+
+def time_per_call(run, values, copy):
+    """Return the seconds ``run(values)`` takes, averaged over enough calls.
+
+    With ``copy`` every call gets its own copy of ``values`` (sorts change
+    their input), made before the clock starts.
+    """
+    number = 1
+    while True:
+        inputs = [list(values) for _ in range(number)] if copy else [values] * number
+        start = perf_counter()
+        for data in inputs:
+            run(data)
+        elapsed = perf_counter() - start
+        if elapsed >= MIN_TIME:
+            return elapsed / number
+        number *= 2
+
+
+def run_case(algorithm, shape, n, rng):
+    """Time one algorithm on one input and count its operations; returns a row.
+
+    ``algorithm`` names a function of ``sorting`` or ``searching``, or one of
+    ``VARIANTS``.
+    """
+    values = make_input(shape, n, rng)
+    counter = OperationCounter()
+    if algorithm in SEARCHES:
+        search = getattr(searching, algorithm)
+        if algorithm == "binary_search":
+            values.sort()
+        target = n  # Larger than every value, so the whole search runs
+
+        def run(data):
+            search(data, target)
+
+        seconds = time_per_call(run, values, copy=False)
+        search(values, target, counter)
+    else:
+        name, options = VARIANTS.get(algorithm, (algorithm, {}))
+        run = functools.partial(getattr(sorting, name), **options)
+        seconds = time_per_call(run, values, copy=True)
+        run(list(values), counter)
+    row = {"algorithm": algorithm, "shape": shape, "n": n, "seconds": seconds}
+    row.update(counter.counts())
+    return row
+
+
+def operations(row):
+    """The memory accesses of a run, the count its exponent is fitted to."""
+    return row["reads"] + row["writes"]
+
+
+def fit_exponent(sizes, values):
+    """Return the slope of ``log(values)`` over ``log(sizes)`` (least squares).
+
+    That is ``k`` in ``values ~ c * n ** k``; points with no cost are left
+    out and ``nan`` is returned with fewer than two points left.
+    """
+    points = [(math.log(n), math.log(y)) for n, y in zip(sizes, values) if y > 0]
+    if len(points) < 2:
+        return math.nan
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if spread == 0:
+        return math.nan
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def fit(rows):
+    """Return the fitted growth exponents of every algorithm and shape."""
+    groups = {}
+    for row in rows:
+        groups.setdefault((row["algorithm"], row["shape"]), []).append(row)
+    fits = []
+    for (algorithm, shape), group in groups.items():
+        group.sort(key=lambda row: row["n"])
+        sizes = [row["n"] for row in group]
+        fits.append(
+            {
+                "algorithm": algorithm,
+                "shape": shape,
+                "seconds_exponent": fit_exponent(
+                    sizes, [row["seconds"] for row in group]
+                ),
+                "operations_exponent": fit_exponent(
+                    sizes, [operations(row) for row in group]
+                ),
+            }
+        )
+    return fits
+
+
+def run_suite(
+    algorithms=SORTS + SEARCHES, shapes=SHAPES, sizes=SIZES, seed=0, progress=None
+):
+    """Run every algorithm on every shape and size; returns the result rows."""
+    rng = random.Random(seed)
+    rows = []
+    for algorithm in algorithms:
+        for shape in shapes:
+            for n in sizes:
+                rows.append(run_case(algorithm, shape, n, rng))
+                if progress is not None:
+                    progress(rows[-1])
+    return rows
+
+
+def write_csv(path, rows, fields):
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def read_results(directory=RESULTS_DIR):
+    """Read the rows that ``main`` wrote to ``directory/results.csv``."""
+    with open(os.path.join(directory, "results.csv"), newline="") as file:
+        rows = list(csv.DictReader(file))
+    for row in rows:
+        row["n"] = int(row["n"])
+        row["seconds"] = float(row["seconds"])
+        for name in COUNTS:
+            row[name] = int(row[name])
+    return rows
+
+
+def plot(axes, rows, shape="random", metric="seconds"):
+    """Draw ``metric`` (seconds or operations) over n on log-log ``axes``.
+
+    Every algorithm gets a line, labelled with its fitted growth exponent.
+    """
+    value = operations if metric == "operations" else (lambda row: row[metric])
+    algorithms = []
+    for row in rows:
+        if row["algorithm"] not in algorithms:
+            algorithms.append(row["algorithm"])
+    for algorithm in algorithms:
+        group = sorted(
+            (r for r in rows if r["algorithm"] == algorithm and r["shape"] == shape),
+            key=lambda row: row["n"],
+        )
+        points = [(row["n"], value(row)) for row in group if value(row) > 0]
+        if not points:
+            continue
+        sizes, values = zip(*points)
+        exponent = fit_exponent(sizes, values)
+        axes.plot(
+            sizes,
+            values,
+            marker="o",
+            linestyle="--" if algorithm in SEARCHES else "-",
+            label=f"{algorithm} (n^{exponent:.2f})",
+        )
+    axes.set_xscale("log")
+    axes.set_yscale("log")
+    axes.set_title(f"{shape} input")
+    axes.set_xlabel("n")
+    axes.set_ylabel("seconds per run" if metric == "seconds" else "reads + writes")
+    axes.grid(True, which="both", alpha=0.3)
+    axes.legend(fontsize="small")
+
+
+def save_chart(path, rows, shapes=SHAPES, metric="seconds"):
+    """Save a log-log chart with one panel per input shape, without a display."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    columns = min(len(shapes), 2)
+    lines = math.ceil(len(shapes) / columns)
+    figure = Figure(figsize=(7 * columns, 5 * lines))
+    FigureCanvasAgg(figure)
+    for index, shape in enumerate(shapes, 1):
+        plot(figure.add_subplot(lines, columns, index), rows, shape, metric)
+    figure.tight_layout()
+    figure.savefig(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m codecrux.benchmark",
+        description="Measure how the running time and operation counts of the "
+        "algorithms grow with the input size.",
+    )
+    parser.add_argument(
+        "--algorithms", nargs="+", choices=SORTS + SEARCHES, default=SORTS + SEARCHES
+    )
+    parser.add_argument("--shapes", nargs="+", choices=SHAPES, default=SHAPES)
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=RESULTS_DIR, help="directory to write to")
+    parser.add_argument("--no-chart", action="store_true", help="skip the PNG charts")
+    args = parser.parse_args(argv)
+
+    def progress(row):
+        print(
+            f"{row['algorithm']:20} {row['shape']:10} n={row['n']:<7} "
+            f"{row['seconds'] * 1000:10.3f} ms {operations(row):>12,} operations"
+        )
+
+    rows = run_suite(args.algorithms, args.shapes, args.sizes, args.seed, progress)
+    fits = fit(rows)
+
+    os.makedirs(args.output, exist_ok=True)
+    write_csv(os.path.join(args.output, "results.csv"), rows, FIELDS)
+    write_csv(os.path.join(args.output, "fit.csv"), fits, FIT_FIELDS)
+    if not args.no_chart:
+        for metric in ("seconds", "operations"):
+            path = os.path.join(args.output, f"loglog_{metric}.png")
+            save_chart(path, rows, args.shapes, metric)
+
+    print()
+    print(f"{'algorithm':20} {'shape':10} {'time ~ n^k':>10} {'ops ~ n^k':>10}")
+    for row in fits:
+        print(
+            f"{row['algorithm']:20} {row['shape']:10} "
+            f"{row['seconds_exponent']:10.2f} {row['operations_exponent']:10.2f}"
+        )
+    print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
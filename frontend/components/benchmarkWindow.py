@@ -0,0 +1,66 @@
+import tkinter as tk
+from tkinter import messagebox, ttk
+
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+
+from codecrux.benchmark import RESULTS_DIR, SHAPES, read_results, plot
+
+
+class BenchmarkWindow(tk.Toplevel):
+    """Log-log chart of the results of ``python -m codecrux.benchmark``.
+
+    The benchmark runs headless, outside the app; this window only reads the
+    results it wrote to ``RESULTS_DIR`` and lets the user pick the input
+    shape and whether to plot seconds or operation counts.
+    """
+
+    def __init__(self, parent, algorithms, directory=RESULTS_DIR):
+        # Read first, so that no empty window is left when there are no results
+        rows = read_results(directory)
+        super().__init__(parent, bg="#1e1e1e")
+        self.title("Benchmarks")
+        self.geometry("900x650")
+        self.rows = [row for row in rows if row["algorithm"] in algorithms]
+        shapes = [s for s in SHAPES if any(row["shape"] == s for row in self.rows)]
+
+        controls = tk.Frame(self, bg="#1e1e1e")
+        controls.pack(pady=10)
+        tk.Label(controls, text="Input:", fg="#ffffff", bg="#1e1e1e").pack(side="left")
+        self.shape = ttk.Combobox(controls, values=shapes, state="readonly", width=12)
+        self.shape.set(shapes[0] if shapes else "")
+        self.shape.pack(side="left", padx=(5, 20))
+        tk.Label(controls, text="Plot:", fg="#ffffff", bg="#1e1e1e").pack(side="left")
+        self.metric = ttk.Combobox(
+            controls, values=("seconds", "operations"), state="readonly", width=12
+        )
+        self.metric.set("seconds")
+        self.metric.pack(side="left", padx=5)
+        self.shape.bind("<<ComboboxSelected>>", lambda event: self.draw())
+        self.metric.bind("<<ComboboxSelected>>", lambda event: self.draw())
+
+        self.figure = Figure(figsize=(8, 5.5))
+        self.axes = self.figure.add_subplot()
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        self.draw()
+
+    def draw(self):
+        self.axes.clear()
+        plot(self.axes, self.rows, self.shape.get(), self.metric.get())
+        self.figure.tight_layout()
+        self.canvas.draw_idle()
+
+
+def open_benchmarks(parent, algorithms, directory=RESULTS_DIR):
+    """Open a ``BenchmarkWindow``, or explain how to run the benchmark first."""
+    try:
+        return BenchmarkWindow(parent, algorithms, directory)
+    except FileNotFoundError:
+        messagebox.showinfo(
+            "Benchmarks",
+            "No benchmark results yet. Run\n\n"
+            "    python -m codecrux.benchmark\n\n"
+            f"from the frontend directory; it writes them to {directory}/.",
+        )
+        return None
@@ -0,0 +1,76 @@
+import tkinter as tk
+
+
+class MetricsPanel(tk.Frame):
+    """Operation counts of the run a ``playback.player.Player`` is showing.
+
+    The counts come from the player's ``state`` (see
+    ``playback.timeline.ArrayState``), which counts every event it applies,
+    so they match the step on screen, also after seeking back. The panel
+    reads them a few times a second rather than on every step, so playback
+    pays nothing for it.
+
+    ``names`` picks the readings to show and ``columns`` how many go on a
+    row, e.g. to fit the narrow panels of a race.
+    """
+
+    REFRESH = 200  # Milliseconds between two readings of the counts
+    NAMES = ("Comparisons", "Swaps", "Writes", "Aux memory", "Steps/s")
+
+    def __init__(self, parent, names=NAMES, columns=None, bg="#1e1e1e"):
+        super().__init__(parent, bg=bg)
+        self.player = None
+        self.after_id = None
+        self.labels = {}
+        columns = columns or len(names)
+        for index, name in enumerate(names):
+            label = tk.Label(self, fg="#ffffff", bg=bg)
+            label.grid(row=index // columns, column=index % columns)
+            self.labels[name] = label
+        for column in range(columns):
+            self.columnconfigure(column, weight=1)
+        self.show()
+
+    def attach(self, player):
+        """Show the counts of ``player`` from now on."""
+        self.player = player
+        if self.after_id is None:
+            self.refresh()
+
+    def detach(self):
+        self.player = None
+        self._stop_refresh()
+        self.show()
+
+    def destroy(self):
+        self._stop_refresh()
+        super().destroy()
+
+    def refresh(self):
+        self.after_id = None
+        if self.player is None:
+            return
+        self.show()
+        self.after_id = self.after(self.REFRESH, self.refresh)
+
+    def show(self):
+        if self.player is None:
+            counts, rate = (0,) * 6, 0
+        else:
+            counts = self.player.state.counts()
+            rate = 0 if self.player.paused else self.player.measured_rate
+        comparisons, swaps, writes, allocated, live, peak = counts
+        texts = {
+            "Comparisons": f"Comparisons: {comparisons:,}",
+            "Swaps": f"Swaps: {swaps:,}",
+            "Writes": f"Writes: {writes:,}",
+            "Aux memory": f"Aux memory: {live:,} (peak {peak:,}, total {allocated:,})",
+            "Steps/s": f"Steps/s: {rate:,.0f}",
+        }
+        for name, label in self.labels.items():
+            label.config(text=texts[name])
+
+    def _stop_refresh(self):
+        if self.after_id is not None:
+            self.after_cancel(self.after_id)
+            self.after_id = None
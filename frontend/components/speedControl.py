@@ -0,0 +1,109 @@
+import math
+import tkinter as tk
+from tkinter import ttk
+
+
+class SpeedControl(tk.Frame):
+    """Speed slider, in steps per second, and an "End" button for a scheduler.
+
+    The slider is logarithmic, from one to a million steps per second. Above
+    the frame rate the scheduler takes several steps per frame and draws only
+    the state they reach (see ``playback.scheduler.Scheduler``), so large
+    inputs still play at a useful pace. Next to the rate asked for it shows
+    the rate the scheduler actually reaches, which falls short when drawing
+    cannot keep up. "End" runs the attached scheduler straight to the end.
+    """
+
+    MAX_EXPONENT = 6  # The slider goes up to 10 ** MAX_EXPONENT steps per second
+    REFRESH = 500  # Milliseconds between two readings of the measured rate
+
+    def __init__(self, parent, rate=2.0):
+        super().__init__(parent, bg="#1e1e1e")
+        self.rate = rate
+        self.scheduler = None
+        self.after_id = None
+
+        speed_label = tk.Label(self, text="Speed:", fg="#ffffff", bg="#1e1e1e")
+        speed_label.pack(side="left")
+        self.slider = ttk.Scale(
+            self,
+            from_=0,
+            to=self.MAX_EXPONENT,
+            orient="horizontal",
+            length=200,
+            value=math.log10(rate),
+            command=self.update_rate,
+        )
+        self.slider.pack(side="left", padx=(10, 0))
+
+        self.rate_label = tk.Label(self, fg="#ffffff", bg="#1e1e1e", width=16)
+        self.rate_label.pack(side="left", padx=5)
+        self.show_rate()
+
+        self.measured_label = tk.Label(self, fg="#aaaaaa", bg="#1e1e1e", width=18)
+        self.measured_label.pack(side="left", padx=5)
+
+        self.end_button = tk.Button(
+            self,
+            text="End",
+            font=("Helvetica", 12),
+            bg="#ffcc00",
+            fg="#1e1e1e",
+            activebackground="#ffcc00",
+            activeforeground="#1e1e1e",
+            cursor="hand2",
+            state="disabled",
+            command=self.run_to_end,
+        )
+        self.end_button.pack(side="left")
+
+    def attach(self, scheduler):
+        """Control ``scheduler`` from now on, starting at the chosen rate."""
+        self.scheduler = scheduler
+        scheduler.set_rate(self.rate)
+        self.end_button.config(state="normal")
+        if self.after_id is None:
+            self.show_measured()
+
+    def detach(self):
+        self.scheduler = None
+        self.end_button.config(state="disabled")
+        self._stop_refresh()
+        self.measured_label.config(text="")
+
+    def destroy(self):
+        self._stop_refresh()
+        super().destroy()
+
+    def update_rate(self, value):
+        self.rate = 10 ** float(value)
+        self.show_rate()
+        if self.scheduler is not None:
+            self.scheduler.set_rate(self.rate)
+
+    def show_rate(self):
+        self.rate_label.config(text=f"{format_rate(self.rate)} steps/s")
+
+    def show_measured(self):
+        self.after_id = None
+        if self.scheduler is None:
+            return
+        if self.scheduler.paused:
+            self.measured_label.config(text="")
+        else:
+            measured = format_rate(self.scheduler.measured_rate)
+            self.measured_label.config(text=f"(measured {measured})")
+        self.after_id = self.after(self.REFRESH, self.show_measured)
+
+    def run_to_end(self):
+        if self.scheduler is not None:
+            self.scheduler.run_to_end()
+
+    def _stop_refresh(self):
+        if self.after_id is not None:
+            self.after_cancel(self.after_id)
+            self.after_id = None
+
+
+def format_rate(rate):
+    return f"{rate:.1f}" if rate < 10 else f"{rate:,.0f}"
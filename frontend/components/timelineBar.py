@@ -0,0 +1,77 @@
+import tkinter as tk
+from tkinter import ttk
+
+
+class TimelineBar(tk.Frame):
+    """Step buttons and a slider over the steps of a recorded run.
+
+    Attach a ``playback.player.Player`` once its trace is ready; the slider
+    then seeks to any event and the arrow buttons step backward and forward.
+    Pass ``show_position`` to the player as its ``on_step`` callback to keep
+    the slider in sync while it plays.
+    """
+
+    def __init__(self, parent):
+        super().__init__(parent, bg="#1e1e1e")
+        self.player = None
+        self.moving = False  # True while the player itself moves the slider
+
+        button_options = dict(
+            font=("Helvetica", 12),
+            bg="#ffcc00",
+            fg="#1e1e1e",
+            activebackground="#ffcc00",
+            activeforeground="#1e1e1e",
+            cursor="hand2",
+            state="disabled",
+        )
+        self.back_button = tk.Button(
+            self, text="◀", command=self.step_back, **button_options
+        )
+        self.back_button.pack(side="left")
+        self.forward_button = tk.Button(
+            self, text="▶", command=self.step_forward, **button_options
+        )
+        self.forward_button.pack(side="right")
+
+        self.position_label = tk.Label(
+            self, text="Step 0 / 0", fg="#ffffff", bg="#1e1e1e", width=24
+        )
+        self.position_label.pack(side="right", padx=5)
+
+        self.slider = ttk.Scale(
+            self, from_=0, to=1, orient="horizontal", command=self.seek
+        )
+        self.slider.pack(side="left", expand=True, fill="x", padx=5)
+
+    def attach(self, player):
+        """Control ``player`` from now on."""
+        self.player = player
+        self.back_button.config(state="normal")
+        self.forward_button.config(state="normal")
+        self.show_position(player.position, player.total)
+
+    def detach(self):
+        """Stop controlling the player, e.g. while the next run is recorded."""
+        self.player = None
+        self.back_button.config(state="disabled")
+        self.forward_button.config(state="disabled")
+
+    def show_position(self, position, total):
+        self.moving = True
+        self.slider.config(to=max(total, 1))
+        self.slider.set(position)
+        self.moving = False
+        self.position_label.config(text=f"Step {position:,} / {total:,}")
+
+    def seek(self, value):
+        if self.player is not None and not self.moving:
+            self.player.seek(round(float(value)))
+
+    def step_back(self):
+        if self.player is not None:
+            self.player.step_back()
+
+    def step_forward(self):
+        if self.player is not None:
+            self.player.step()
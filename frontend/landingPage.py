@@ -2,6 +2,8 @@ import tkinter as tk
 from tkinter import messagebox
 from PIL import Image, ImageTk
 from components.cardComponentLP import CardComponent  # Import the card component
+from playback.scheduler import cancel_schedulers
+from rendering.backends import release_renderers
 
 
 class LandingPage:
@@ -199,8 +201,16 @@ class LandingPage:
         ContactUs(self.root)  # Load the ContactUs class
 
 
+def close_app(root):
+    """Stop the running visualization and free its figures, then close."""
+    cancel_schedulers(root)
+    release_renderers(root)
+    root.destroy()
+
+
 def run_app():
     root = tk.Tk()
+    root.protocol("WM_DELETE_WINDOW", lambda: close_app(root))
     app = LandingPage(root)
     root.mainloop()
 
@@ -0,0 +1,94 @@
+import math
+from collections import deque
+from time import perf_counter
+
+FPS = 60  # Most frames drawn per second
+
+# Rate of a clock that runs steps as fast as it can
+INSTANT = math.inf
+
+# Longest real time a single tick makes up for, in seconds; when Tk is blocked
+# for longer (e.g. while the window is dragged) the missed steps are dropped
+# rather than all taken at once
+MAX_LAG = 0.25
+
+# Seconds of recent ticks the measured rate is averaged over
+WINDOW = 1.0
+
+
+class PacingClock:
+    """Paces a scheduler's steps by ``perf_counter`` deadlines.
+
+    Steps are due at ``rate`` per second of real time, however long the
+    ticks take: ``due`` turns the time since the previous tick into a
+    number of steps, and ``delay`` is what is left of the time to the next
+    deadline once the tick has drawn its frame. A tick that takes longer
+    than a frame (a slow renderer, a large array) is not followed by a
+    sleep; the next tick is due at once and takes the steps that piled up,
+    drawing only one frame for them, so frames are skipped but steps are
+    not. ``measured_rate`` is the step rate actually reached, to show next
+    to the ``rate`` asked for.
+    """
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.credit = 0.0  # Steps due but not taken yet
+        self.last = None  # When the previous tick started
+        self.next = None  # When the next tick is due
+        self.ticks = deque()  # (time, steps) of the ticks within WINDOW
+
+    def start(self):
+        """Start counting from now, e.g. when playback starts or resumes."""
+        self.last = self.next = perf_counter()
+        self.ticks.clear()
+
+    def set_rate(self, rate):
+        self.rate = rate
+        self.credit = 0.0
+        self.ticks.clear()
+
+    def due(self):
+        """Return how many steps are due at the start of a tick."""
+        now = perf_counter()
+        if self.last is None:
+            self.start()
+        late = min(now - self.next, MAX_LAG)
+        elapsed, self.last = max(self.next - self.last + late, 0), now
+        if self.rate == INSTANT:
+            return math.inf
+        self.credit += self.rate * elapsed
+        steps = int(self.credit)
+        self.credit -= steps
+        return steps
+
+    def deadline(self):
+        """Return the ``perf_counter`` time by which a tick has to end.
+
+        Ticks of an ``INSTANT`` clock take steps until then, so that Tk
+        still draws and handles events once a frame.
+        """
+        return self.last + 1 / FPS
+
+    def delay(self, steps):
+        """Record that a tick took ``steps``; returns the ms to the next tick."""
+        now = perf_counter()
+        ticks = self.ticks
+        ticks.append((self.last, steps))
+        while ticks and ticks[0][0] < now - WINDOW:
+            ticks.popleft()
+        if self.rate == INSTANT:
+            self.next = now
+            return 0
+        # The next tick is due when its step is, but not within a frame
+        self.next = self.last + max((1 - self.credit) / self.rate, 1 / FPS)
+        return max(math.ceil((self.next - now) * 1000), 0)
+
+    @property
+    def measured_rate(self):
+        """Steps per second taken over the last ``WINDOW`` seconds of ticks."""
+        ticks = self.ticks
+        if len(ticks) < 2:
+            return 0.0
+        # The steps of the oldest tick were due before the window starts
+        span = perf_counter() - ticks[0][0]
+        return sum(steps for _, steps in list(ticks)[1:]) / span
@@ -0,0 +1,134 @@
+from playback.scheduler import Scheduler
+from playback.timeline import ArrayState
+
+HIGHLIGHT_COLOR = "r"
+PIVOT_COLOR = "g"
+SORTED_COLOR = "g"
+
+
+class Player(Scheduler):
+    """Animates a recorded trace on a bar renderer from the Tk thread.
+
+    The player rebuilds the arrays from the trace's initial data one event
+    at a time and draws a frame for every step, i.e. every event that
+    changes or highlights the displayed array; writes to an array that is
+    not on screen are applied silently. Pause, single stepping and the rate
+    (steps per second) come from ``Scheduler``; when several steps are taken
+    per tick only the last one is drawn. Since the trace is complete before
+    playback starts, ``total`` and ``position`` give the progress. The
+    ``timeline`` (see ``playback.timeline.Timeline``) lets it step backwards
+    and seek to any position.
+
+    ``colors`` maps indices to a color drawn under the highlights (e.g. the
+    buckets of bucket sort) and ``default`` is the color of every other bar.
+    ``second_renderer`` draws the trace's second row (see
+    ``playback.trace.row``), e.g. the auxiliary array of a merge sort; it
+    shows zeros while there is none. ``heap_renderer`` draws the displayed
+    array again as a heap (see ``rendering.base.TreeRenderer``); the heap
+    ends where the sorted tail starts, i.e. the run of indices marked by
+    ``sorted_range`` that reaches the end of the array.
+    ``on_step(position, total)`` is called after every frame and
+    ``on_finish()`` once, just before the final frame.
+    """
+
+    def __init__(
+        self,
+        master,
+        renderer,
+        timeline,
+        rate=2.0,
+        colors=None,
+        default=None,
+        on_step=None,
+        on_finish=None,
+        second_renderer=None,
+        heap_renderer=None,
+    ):
+        super().__init__(master, rate=rate, on_finish=on_finish)
+        self.renderer = renderer
+        self.second_renderer = second_renderer
+        self.heap_renderer = heap_renderer
+        self.timeline = timeline
+        self.trace = timeline.trace
+        self.colors = colors or {}
+        self.default = default
+        self.on_step = on_step
+        self.state = ArrayState(self.trace.initial)
+        self.position = 0  # Events applied so far
+
+    @property
+    def total(self):
+        return len(self.trace)
+
+    def advance(self):
+        """Apply the events up to and including the next step."""
+        highlight = None
+        while highlight is None and self.position < self.total:
+            op, a, b = self.trace[self.position]
+            self.position += 1
+            highlight = self.state.apply(op, a, b)
+        if highlight is None:
+            return False
+        self.pending = highlight
+        return True
+
+    def draw(self):
+        if self.pending is not None:
+            highlight, self.pending = self.pending, None
+            self._show(highlight)
+
+    def finish(self):
+        # The last steps are drawn and on_finish runs, so that it can e.g.
+        # retitle the chart, then the result is drawn without highlights
+        super().finish()
+        self._show(())
+
+    def run_to_end(self):
+        """Jump straight to the end, through the timeline, and finish."""
+        if not self.finished:
+            self.seek(self.total)
+            self.finish()
+
+    def step_back(self):
+        """Go back to the previous step and draw it."""
+        self.seek(self.timeline.previous_step(self.position))
+
+    def seek(self, position):
+        """Jump to the state after the first ``position`` events and draw it."""
+        if self.cancelled:
+            return
+        self.position = min(max(int(position), 0), self.total)
+        highlight = self.timeline.seek(self.state, self.position)
+        self.pending = None
+        self.finished = False
+        self._show(highlight or ())
+        if not self.paused:
+            self._schedule()
+
+    def _show(self, highlight):
+        state = self.state
+        on_second = state.second is not None and state.active == state.second
+        colors = dict(self.colors)
+        colors.update(dict.fromkeys(state.marks, SORTED_COLOR))
+        if not on_second:
+            for i in highlight:
+                colors[i] = HIGHLIGHT_COLOR
+        if state.pivot is not None:
+            colors[state.pivot] = PIVOT_COLOR
+        default = SORTED_COLOR if state.all_sorted else self.default
+        values = state.buffers[state.shown]
+        self.renderer.update(values, colors, default)
+        if self.heap_renderer is not None:
+            size = 0 if state.all_sorted else len(values)
+            while size and size - 1 in state.marks:
+                size -= 1
+            self.heap_renderer.update(values, colors, default, size)
+        if self.second_renderer is not None:
+            if state.second is None:
+                values = [0] * len(state.buffers[0])
+            else:
+                values = state.buffers[state.second]
+            marked = highlight if on_second else ()
+            self.second_renderer.update(values, dict.fromkeys(marked, HIGHLIGHT_COLOR))
+        if self.on_step is not None:
+            self.on_step(self.position, self.total)
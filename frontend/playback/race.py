@@ -0,0 +1,48 @@
+from playback.scheduler import Scheduler
+
+MAX_LANES = 6  # Most algorithms raced at once
+
+
+class Race(Scheduler):
+    """Plays several recorded runs of the same input side by side.
+
+    The race is a scheduler of its own whose steps drive one
+    ``playback.player.Player`` per lane: every step of the race advances
+    each lane that has not finished by one step, so a single clock (the
+    race's rate, pause and "End") keeps the lanes in sync and the lanes
+    compare by the number of steps they need. A lane finishes, calling its
+    player's ``on_finish``, as soon as its own trace is used up; the race
+    finishes with the last one. The lane players are never played
+    themselves.
+    """
+
+    def __init__(self, master, players, rate=2.0, on_finish=None):
+        super().__init__(master, rate=rate, on_finish=on_finish)
+        self.players = players
+
+    def advance(self):
+        running = False
+        for player in self.players:
+            if player.finished:
+                continue
+            if player.advance():
+                running = True
+            else:
+                player.finish()
+        return running
+
+    def draw(self):
+        for player in self.players:
+            player.draw()
+
+    def run_to_end(self):
+        """Jump every lane straight to its end, and finish."""
+        if not self.finished:
+            for player in self.players:
+                player.run_to_end()
+            self.finish()
+
+    def cancel(self):
+        super().cancel()
+        for player in self.players:
+            player.cancel()
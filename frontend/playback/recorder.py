@@ -0,0 +1,87 @@
+import multiprocessing
+
+from codecrux.algorithms import sorting
+from playback.scheduler import Scheduler
+from playback.timeline import Timeline
+from playback.trace import Trace, TraceHooks
+
+POLL = 50  # Milliseconds between two looks at the run being recorded
+
+
+def record(algorithm, numbers, second=None, **options):
+    """Run the sort named ``algorithm`` on ``numbers`` and return its timeline.
+
+    ``options`` go to the sort (e.g. ``pivot`` for ``quick_sort``) and
+    ``second`` to its ``playback.trace.TraceHooks``. This is what the worker
+    processes of a ``Recorder`` and of a race run. The timeline, keyframes
+    included, is pickled back whole; it is sealed (see
+    ``playback.trace.Trace.seal``) once it has arrived.
+    """
+    timeline = Timeline(Trace(numbers))
+    hooks = TraceHooks(timeline.append, second=second)
+    getattr(sorting, algorithm)(list(numbers), hooks, **options)
+    return timeline
+
+
+class Recorder(Scheduler):
+    """Records a sort run in a worker process while the Tk thread polls for it.
+
+    The ``codecrux.algorithms`` sorts report their operations to hooks rather
+    than yield them, so they cannot be stepped from ``root.after`` ticks.
+    Instead ``record`` runs in a process of its own, as the runs of a race
+    do, and the window goes on drawing and handling events; the recorder's
+    steps are looks at the worker, one every ``POLL`` milliseconds.
+
+    Once the timeline is back it is kept in ``timeline`` and ``on_finish()``
+    is called. If the run raised, ``on_error(error)`` is called instead, so
+    that the screen can give its controls back. ``cancel`` terminates the
+    worker.
+    """
+
+    def __init__(
+        self,
+        master,
+        algorithm,
+        numbers,
+        second=None,
+        on_finish=None,
+        on_error=None,
+        **options,
+    ):
+        super().__init__(master, rate=1000 / POLL, on_finish=on_finish)
+        self.args = (algorithm, list(numbers), second)
+        self.options = options
+        self.on_error = on_error
+        self.pool = None
+        self.job = None
+        self.timeline = None
+
+    def play(self):
+        if self.pool is None and not self.finished:
+            self.pool = multiprocessing.Pool(processes=1)
+            self.job = self.pool.apply_async(record, self.args, self.options)
+            self.pool.close()  # The worker exits once the run is back
+        super().play()
+
+    def advance(self):
+        return not self.job.ready()
+
+    def finish(self):
+        try:
+            timeline = self.job.get()
+        except Exception as error:
+            self.cancel()
+            if self.on_error is not None:
+                self.on_error(error)
+            return
+        self.pool.join()
+        self.pool = None
+        self.timeline = timeline
+        super().finish()
+
+    def cancel(self):
+        super().cancel()
+        if self.pool is not None:
+            self.pool.terminate()  # Also stops a run still being recorded
+            self.pool.join()
+            self.pool = None
@@ -0,0 +1,198 @@
+from time import perf_counter
+
+from playback.clock import INSTANT, PacingClock
+
+# Steps an instant scheduler takes between two looks at the clock
+INSTANT_CHUNK = 256
+
+# Schedulers with steps left, per top-level window (keyed by its Tk path name)
+_running = {}
+
+
+def cancel_schedulers(window):
+    """Cancel every scheduler still running in the window that contains ``window``.
+
+    Screens call this from ``go_back`` and the app when its window is closed,
+    so that no step of an abandoned run is taken after the widgets are gone.
+    """
+    for scheduler in list(_running.pop(str(window.winfo_toplevel()), ())):
+        scheduler.cancel()
+
+
+class Scheduler:
+    """Advances an algorithm core, a generator of step events, from the Tk thread.
+
+    The core yields ``(action, ...)`` events and every one of them is a step,
+    handed to ``handler(*event)``. The core never sleeps or waits: pausing
+    just stops the ``root.after`` ticks, ``step`` advances a single step and
+    nothing runs outside the Tk thread. Once the core is exhausted its return
+    value is kept in ``result`` and ``on_finish()`` is called.
+
+    The speed is a ``rate`` in steps per second, paced by a
+    ``playback.clock.PacingClock``. Up to ``FPS`` steps per second every tick
+    takes one step; above that the ticks come once per frame. Either way a
+    tick takes every step that is due by then, time spent drawing included,
+    and the events whose action is in ``coalesce`` (the frames)
+    are drawn only once per tick, for the state those steps reached. An
+    ``INSTANT`` scheduler takes steps until a frame's time is up and ticks
+    again at once; ``run_to_end`` switches to it. ``measured_rate`` is the
+    rate actually reached.
+
+    ``cancel`` stops a scheduler for good, e.g. when the user leaves the page
+    or starts another run. It is checked before every step, including the
+    steps of a tick that is already under way, and closes the core, so once
+    it returns nothing of the run is left behind.
+
+    Subclasses can override ``advance`` and ``draw`` to produce and show their
+    steps some other way (see ``playback.player.Player``).
+    """
+
+    def __init__(
+        self,
+        master,
+        events=None,
+        handler=None,
+        rate=2.0,
+        coalesce=(),
+        on_finish=None,
+    ):
+        self.master = master
+        self.events = iter(events) if events is not None else None
+        self.handler = handler
+        self.clock = PacingClock(rate)
+        self.coalesce = set(coalesce)
+        self.on_finish = on_finish
+        self.pending = None  # Newest coalesced event, not drawn yet
+        self.result = None
+        self.finished = False
+        self.cancelled = False
+        self.paused = True
+        self.after_id = None
+        self.window = str(master.winfo_toplevel())
+
+    @property
+    def rate(self):
+        return self.clock.rate
+
+    @property
+    def measured_rate(self):
+        return self.clock.measured_rate
+
+    def play(self):
+        self.paused = False
+        _running.setdefault(self.window, set()).add(self)
+        self.clock.start()
+        self._schedule()
+
+    def pause(self):
+        self.paused = True
+        self.stop()
+
+    def toggle(self):
+        """Pause a running scheduler or resume a paused one; returns ``paused``."""
+        if self.paused:
+            self.play()
+        else:
+            self.pause()
+        return self.paused
+
+    def stop(self):
+        if self.after_id is not None:
+            self.master.after_cancel(self.after_id)
+            self.after_id = None
+
+    def set_rate(self, rate):
+        """Take ``rate`` steps per second from now on."""
+        self.clock.set_rate(rate)
+        if self.after_id is not None:
+            # The next tick may be far off at the old rate
+            self.stop()
+            self.clock.start()
+            self._schedule()
+
+    def run_to_end(self):
+        """Take every remaining step as fast as possible."""
+        self.set_rate(INSTANT)
+        self.stop()
+        self.play()
+
+    def step(self):
+        """Advance by one step and draw it, finishing once there are none left."""
+        if self.finished:
+            return
+        if self.advance():
+            self.draw()
+        else:
+            self.finish()
+
+    def advance(self):
+        """Take the next step without drawing it; returns False when there is none."""
+        try:
+            event = next(self.events)
+        except StopIteration as stop:
+            self.result = stop.value
+            return False
+        if event[0] in self.coalesce:
+            self.pending = event
+        else:
+            self.draw()  # Other events come after the frame before them
+            self.handler(*event)
+        return True
+
+    def draw(self):
+        """Draw the state reached by the steps taken since the last draw."""
+        if self.pending is not None:
+            event, self.pending = self.pending, None
+            self.handler(*event)
+
+    def finish(self):
+        self.draw()
+        self.finished = True
+        self.paused = True  # Seeking back (see Player) does not restart it
+        self.stop()
+        self._forget()
+        if self.on_finish is not None:
+            self.on_finish()
+
+    def cancel(self):
+        """Stop for good; ``on_finish`` is not called."""
+        self.cancelled = True
+        self.finished = True
+        self.paused = True
+        self.stop()
+        self._forget()
+        close = getattr(self.events, "close", None)
+        if close is not None:
+            close()  # Runs the core's finally blocks and frees its frames
+
+    def _forget(self):
+        running = _running.get(self.window)
+        if running is not None:
+            running.discard(self)
+            if not running:
+                del _running[self.window]
+
+    def _schedule(self, delay=0):
+        if self.after_id is None and not self.finished:
+            self.after_id = self.master.after(delay, self._tick)
+
+    def _tick(self):
+        self.after_id = None
+        if self.paused or not self.master.winfo_exists():
+            return
+        due = self.clock.due()
+        chunk = INSTANT_CHUNK if due == INSTANT else due
+        deadline = self.clock.deadline()
+        taken = 0
+        while taken < due:
+            for _ in range(chunk):
+                if not self.advance():
+                    self.finish()
+                    return
+                if self.finished:
+                    return  # Cancelled by one of the steps
+            taken += chunk
+            if due == INSTANT and perf_counter() >= deadline:
+                break
+        self.draw()
+        self._schedule(self.clock.delay(taken))
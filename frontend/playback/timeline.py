@@ -0,0 +1,220 @@
+from playback.trace import (
+    ALLOCATE,
+    COMPARE,
+    HIGHLIGHT,
+    PIVOT,
+    ROW,
+    SHOW,
+    SORTED,
+    SWAP,
+    WRITE,
+    decode,
+)
+
+# Fewest events between two keyframes; longer arrays get sparser keyframes so
+# that the snapshots never take more memory than the trace itself
+MIN_INTERVAL = 1024
+
+
+class ArrayState:
+    """The arrays of a trace, and what is marked on them, after some events.
+
+    It also counts the operations so far: comparisons, swaps, writes (to
+    any buffer, two per swap, as ``codecrux.algorithms.hooks.OperationCounter``
+    counts them) and the auxiliary memory allocated, in elements, of which
+    ``live`` are still in use and at most ``peak`` were at once. The counts
+    are part of the snapshots, so they follow the timeline when it seeks.
+
+    Events on the ``second`` buffer, drawn on a row of its own under the
+    displayed one, are steps too; ``active`` is the buffer of the last step,
+    i.e. the row its highlight belongs on.
+    """
+
+    def __init__(self, initial):
+        self.buffers = {0: list(initial)}
+        self.shown = 0  # Buffer on display
+        self.second = None  # Buffer drawn on the second row, if any
+        self.active = 0
+        self.pivot = None
+        self.marks = set()  # Indices in their final position
+        self.all_sorted = False
+        self.comparisons = 0
+        self.swaps = 0
+        self.writes = 0
+        self.allocated = 0
+        self.live = 0
+        self.peak = 0
+
+    def apply(self, op, a, b):
+        """Apply one event; returns the indices to highlight if it is a step.
+
+        A step is an event that changes or highlights the displayed array;
+        for anything else (e.g. writes to an array that is not on screen)
+        ``None`` is returned.
+        """
+        kind, buffer = decode(op)
+        shown = buffer == self.shown or buffer == self.second
+        if shown and kind <= HIGHLIGHT:
+            self.active = buffer
+        if kind == COMPARE:
+            self.comparisons += 1
+            return (a, b) if shown and b >= 0 else None
+        if kind == SWAP:
+            self.swaps += 1
+            self.writes += 2
+            values = self.buffers[buffer]
+            values[a], values[b] = values[b], values[a]
+            return (a, b) if shown else None
+        if kind == WRITE:
+            self.writes += 1
+            self.buffers[buffer][a] = b
+            return (a,) if shown else None
+        if kind == HIGHLIGHT:
+            self.active = buffer
+            return (a,) if b < 0 else (a, b)
+        if kind == PIVOT:
+            self.pivot = a if a >= 0 else None
+            return None
+        if kind == SHOW:
+            if b >= 0:
+                self.buffers[a] = [0] * b
+                self._allocate(b)
+            self.shown = a
+            self.pivot = None
+            self.marks = set()
+            self.all_sorted = False
+            return None
+        if kind == SORTED:
+            if a <= 0 and b >= len(self.buffers[self.shown]):
+                self.all_sorted = True
+            else:
+                self.marks.update(range(a, b))
+            return ()
+        if kind == ROW:
+            if b >= 0:
+                self.buffers[a] = [0] * b
+                self._allocate(b)
+            self.second = a if a >= 0 else None
+            return None
+        if kind == ALLOCATE:
+            self._allocate(a)
+            return None
+        raise ValueError(f"Unknown trace event: {op}")
+
+    def _allocate(self, size):
+        if size > 0:
+            self.allocated += size
+        self.live += size
+        self.peak = max(self.peak, self.live)
+
+    def counts(self):
+        return (
+            self.comparisons,
+            self.swaps,
+            self.writes,
+            self.allocated,
+            self.live,
+            self.peak,
+        )
+
+    def snapshot(self):
+        """Return a copy of the state that ``restore`` can bring back."""
+        buffers = {buffer: list(values) for buffer, values in self.buffers.items()}
+        marks = set(self.marks)
+        return (
+            buffers,
+            self.shown,
+            self.second,
+            self.active,
+            self.pivot,
+            marks,
+            self.all_sorted,
+            self.counts(),
+        )
+
+    def restore(self, snapshot):
+        (
+            buffers,
+            self.shown,
+            self.second,
+            self.active,
+            self.pivot,
+            marks,
+            self.all_sorted,
+            counts,
+        ) = snapshot
+        self.buffers = {buffer: list(values) for buffer, values in buffers.items()}
+        self.marks = set(marks)
+        (
+            self.comparisons,
+            self.swaps,
+            self.writes,
+            self.allocated,
+            self.live,
+            self.peak,
+        ) = counts
+
+
+class Timeline:
+    """A trace with a full snapshot of its arrays every ``every`` events.
+
+    ``seek`` restores the nearest keyframe at or before the target and
+    replays at most ``every`` events from it, so any position of a trace
+    with millions of events is reached in constant time. The keyframes of
+    the events already in ``trace`` are built in one pass; later events are
+    recorded with ``append``, which adds keyframes as it goes. ``steps``
+    counts the events that are steps, i.e. the frames a full playback draws.
+    """
+
+    def __init__(self, trace, every=None):
+        self.trace = trace
+        self.every = every or max(MIN_INTERVAL, len(trace.initial))
+        self.keyframes = []
+        self.state = ArrayState(trace.initial)  # State after the last event
+        self.steps = 0
+        for position in range(len(trace)):
+            if position % self.every == 0:
+                self.keyframes.append(self.state.snapshot())
+            if self.state.apply(*trace[position]) is not None:
+                self.steps += 1
+
+    def append(self, op, a, b):
+        """Record one more event in the trace."""
+        if len(self.trace) % self.every == 0:
+            self.keyframes.append(self.state.snapshot())
+        self.trace.append(op, a, b)
+        if self.state.apply(op, a, b) is not None:
+            self.steps += 1
+
+    def __len__(self):
+        return len(self.trace)
+
+    def seek(self, state, position):
+        """Bring ``state`` to just after the first ``position`` events.
+
+        Returns the highlight of the last event applied, as ``apply`` does.
+        """
+        if position == 0:
+            state.restore(ArrayState(self.trace.initial).snapshot())
+            return ()
+        start = (position - 1) // self.every * self.every
+        state.restore(self.keyframes[start // self.every])
+        for index in range(start, position):
+            highlight = state.apply(*self.trace[index])
+        return highlight
+
+    def previous_step(self, position):
+        """Return the position of the last step that ends before ``position``."""
+        end = position - 1
+        state = ArrayState(())
+        while end > 0:
+            start = (end - 1) // self.every * self.every
+            state.restore(self.keyframes[start // self.every])
+            last = None
+            for index in range(start, end):
+                if state.apply(*self.trace[index]) is not None:
+                    last = index + 1
+            if last is not None:
+                return last
+            end = start
+        return 0
@@ -0,0 +1,250 @@
+import array
+import json
+import mmap
+import tempfile
+
+from codecrux.algorithms.hooks import Hooks
+
+# Event opcodes. The low four bits hold the event kind, the high bits the
+# buffer the event applies to (0 is the input array, others are auxiliary
+# arrays such as the count array of counting sort).
+COMPARE = 0  # a, b: indices being compared (b is -1 for a value held aside)
+SWAP = 1  # a, b: indices being swapped
+WRITE = 2  # a: index, b: value written to it
+HIGHLIGHT = 3  # a, b: indices to highlight (b is -1 for a single index)
+PIVOT = 4  # a: index of the pivot or current minimum, -1 to clear it
+SHOW = 5  # a: buffer to display; b: its length to allocate it, or -1
+SORTED = 6  # a, b: the range a..b - 1 is in its final position
+CONSTANT = 7  # A WRITE whose value does not fit an operand; b: its constant
+ALLOCATE = 8  # a: elements of auxiliary memory allocated, negative when freed
+ROW = 9  # a: buffer to draw on a second row (-1 for none); b: as for SHOW
+
+KIND_BITS = 4
+KIND_MASK = (1 << KIND_BITS) - 1
+
+# Traces longer than this are moved to a memory-mapped file once recorded
+SPILL_EVENTS = 1 << 22
+
+MAGIC = b"CCTRACE1"
+
+
+def opcode(kind, buffer=0):
+    """Combine an event kind and a buffer number into one opcode."""
+    return kind | buffer << KIND_BITS
+
+
+def decode(op):
+    """Split an opcode into its event kind and buffer number."""
+    return op & KIND_MASK, op >> KIND_BITS
+
+
+# Event constructors, e.g. ``trace.append(*swap(i, j))``; ``buffer`` selects
+# an auxiliary array that has been allocated with ``show``.
+
+
+def compare(i, j, buffer=0):
+    return opcode(COMPARE, buffer), i, j
+
+
+def swap(i, j, buffer=0):
+    return opcode(SWAP, buffer), i, j
+
+
+def write(i, value, buffer=0):
+    return opcode(WRITE, buffer), i, value
+
+
+def highlight(i, j=-1, buffer=0):
+    return opcode(HIGHLIGHT, buffer), i, j
+
+
+def pivot(i):
+    return PIVOT, i, -1
+
+
+def show(buffer, size=-1):
+    """Display ``buffer``, first filling it with ``size`` zeros if given."""
+    return SHOW, buffer, size
+
+
+def sorted_range(start, stop):
+    return SORTED, start, stop
+
+
+def row(buffer, size=-1):
+    """Draw ``buffer`` on a second row, first filling it with ``size`` zeros."""
+    return ROW, buffer, size
+
+
+def allocate(size):
+    """Auxiliary memory that is not displayed, e.g. the halves merge sort copies."""
+    return ALLOCATE, size, -1
+
+
+class TraceHooks(Hooks):
+    """Turns the operations of a ``codecrux.algorithms`` run into trace events.
+
+    Each event is passed to ``record(op, a, b)``, e.g. ``Trace.append`` or
+    ``playback.timeline.Timeline.append``. A numbered auxiliary array is
+    shown as soon as it is allocated and ``focus`` shows another buffer.
+    A read on its own highlights the element when its buffer is on
+    screen. A comparison with a value held aside and memory that is never
+    displayed are recorded for the operation counts only (see
+    ``playback.timeline.ArrayState``).
+
+    The auxiliary array numbered ``second`` is drawn on a second row, under
+    the displayed buffer, instead of taking its place, so that an algorithm
+    that moves elements back and forth between two arrays shows both.
+    """
+
+    def __init__(self, record, second=None):
+        self.record = record
+        self.shown = 0
+        self.second = second
+
+    def compare(self, i, j=None, buffer=0):
+        self.record(*compare(i, -1 if j is None else j, buffer))
+
+    def swap(self, i, j, buffer=0):
+        self.record(*swap(i, j, buffer))
+
+    def read(self, i, buffer=0):
+        if buffer == self.shown or buffer == self.second:
+            self.record(*highlight(i, buffer=buffer))
+
+    def write(self, i, value, buffer=0):
+        self.record(*write(i, value, buffer))
+
+    def allocate(self, size, buffer=None):
+        if buffer is None:
+            self.record(*allocate(size))
+        elif buffer == self.second:
+            self.record(*row(buffer, size))
+        else:
+            self.shown = buffer
+            self.record(*show(buffer, size))
+
+    def free(self, size):
+        self.record(*allocate(-size))
+
+    def focus(self, buffer):
+        self.shown = buffer
+        self.record(*show(buffer))
+
+    def pivot(self, i):
+        self.record(*pivot(i))
+
+    def sorted_range(self, start, stop):
+        self.record(*sorted_range(start, stop))
+
+
+class Trace:
+    """Events recorded from one run of an algorithm over ``data``.
+
+    The algorithm runs to completion at full speed and the trace keeps what it
+    did: comparisons, swaps, writes, highlights and pivot changes. Playing the
+    trace back (see ``playback.player.Player``) rebuilds every intermediate
+    array from the initial one, so nothing runs at animation speed.
+
+    The algorithm runs with ``TraceHooks(trace.append)``, which records its
+    operations in order as events built with the constructors above, e.g.
+    ``compare(j, j + 1)`` or ``swap(i, j)``. Indexing the trace returns
+    ``(opcode, a, b)`` tuples.
+
+    Events are packed into three columns, a one-byte opcode and two int32
+    operands, i.e. 9 bytes per event. Written values that do not fit an
+    int32 (floats, big integers) go to the ``constants`` table and the event
+    refers to them by index. ``save`` writes the columns to a file that
+    ``Trace.open`` maps back into memory without running the algorithm
+    again, and ``seal`` does the same with a temporary file for long traces.
+    """
+
+    def __init__(self, data):
+        self.initial = list(data)
+        self.constants = []
+        self.constant_index = {}
+        self.ops = array.array("B")
+        self.a = array.array("i")
+        self.b = array.array("i")
+        self.mapping = None
+
+    def __len__(self):
+        return len(self.ops)
+
+    def __getitem__(self, index):
+        op = self.ops[index]
+        if op & KIND_MASK == CONSTANT:
+            op = opcode(WRITE, op >> KIND_BITS)
+            return op, self.a[index], self.constants[self.b[index]]
+        return op, self.a[index], self.b[index]
+
+    def append(self, op, a, b):
+        """Record one event, e.g. ``trace.append(*compare(i, j))``."""
+        try:
+            self.b.append(b)
+        except (TypeError, OverflowError):
+            # Only a written value can fall outside the range of an operand
+            if b not in self.constant_index:
+                self.constant_index[b] = len(self.constants)
+                self.constants.append(b)
+            self.b.append(self.constant_index[b])
+            op = opcode(CONSTANT, op >> KIND_BITS)
+        self.ops.append(op)
+        self.a.append(a)
+
+    def seal(self):
+        """Finish recording; a long trace moves to a temporary mapped file."""
+        if len(self) > SPILL_EVENTS:
+            with tempfile.TemporaryFile() as file:
+                self._write(file)
+                self._map(file)
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            self._write(file)
+
+    @classmethod
+    def open(cls, path):
+        """Map a trace written by ``save`` back into memory."""
+        with open(path, "rb") as file:
+            header = cls._read_header(file)
+            trace = cls(header["initial"])
+            trace.constants = header["constants"]
+            trace._map(file)
+        return trace
+
+    def _write(self, file):
+        # Magic, header length, JSON header padded to a multiple of four bytes,
+        # then the a, b and opcode columns
+        header = json.dumps(
+            {"initial": self.initial, "constants": self.constants, "length": len(self)}
+        ).encode()
+        header += b" " * (-len(header) % 4)
+        file.write(MAGIC)
+        file.write(len(header).to_bytes(4, "little"))
+        file.write(header)
+        self.a.tofile(file)
+        self.b.tofile(file)
+        self.ops.tofile(file)
+        file.flush()
+
+    @staticmethod
+    def _read_header(file):
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not a trace file: {file.name}")
+        size = int.from_bytes(file.read(4), "little")
+        return json.loads(file.read(size))
+
+    def _map(self, file):
+        """Replace the columns with views of the mapped ``file``."""
+        file.seek(0)
+        length = self._read_header(file)["length"]
+        start = file.tell()
+        # The mapping stays valid after the file is closed (or deleted)
+        self.mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self.mapping)
+        width = self.a.itemsize * length
+        self.a = view[start : start + width].cast("i")
+        self.b = view[start + width : start + 2 * width].cast("i")
+        self.ops = view[start + 2 * width : start + 2 * width + length]
+        self.constant_index = None  # Nothing can be recorded any more
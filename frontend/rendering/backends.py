@@ -0,0 +1,44 @@
+import os
+import sys
+import importlib
+
+# Renderer backends: "matplotlib" keeps the original look, "tk" draws native
+# Canvas items and does not need matplotlib to be installed at all, "raster"
+# paints bar charts straight into a PhotoImage for very large arrays.
+BACKENDS = {
+    "matplotlib": "rendering.mpl_backend",
+    "tk": "rendering.tk_canvas",
+    "raster": "rendering.raster",
+}
+
+# Chosen at startup, e.g. ``CODECRUX_RENDERER=tk python landingPage.py``
+DEFAULT_BACKEND = os.environ.get("CODECRUX_RENDERER", "matplotlib")
+
+
+def create_renderer(kind, master, backend=None, **options):
+    """Create a renderer of ``kind`` ("bars", "cells", "nodes" or "tree") in ``master``.
+
+    All backends share the same interface per kind:
+
+    - bars: ``reset(data)``, ``update(data, colors=None, default=None)`` and
+      ``set_title(title, legend=None)``
+    - cells: ``update(items, colors=None)``
+    - nodes: ``update(values, highlight=None)``
+    - tree: as bars, drawing the array as the binary heap it encodes
+    """
+    backend = backend or DEFAULT_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown renderer backend: {backend}")
+    module = importlib.import_module(BACKENDS[backend])
+    return module.RENDERERS[kind](master, **options)
+
+
+def release_renderers(window):
+    """Free what the loaded backends hold for ``window`` (e.g. pooled figures).
+
+    Screens call this from ``go_back`` before destroying their widgets.
+    """
+    for name in BACKENDS.values():
+        module = sys.modules.get(name)
+        if module is not None and hasattr(module, "release"):
+            module.release(window)
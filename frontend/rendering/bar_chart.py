@@ -0,0 +1,153 @@
+import math
+
+from matplotlib.transforms import Bbox
+
+from rendering.base import BASE_COLOR, BarRenderer
+
+
+class BarChartRenderer(BarRenderer):
+    """Draws an array as a bar chart whose bars are created once per run.
+
+    Instead of clearing the axis and rebuilding every Rectangle on each step,
+    the renderer keeps the BarContainer alive and only touches the bars whose
+    height or color actually changed.
+
+    With ``blit`` enabled the bars are animated artists: the axes, ticks,
+    labels and legend are rendered once into a cached background and each
+    step only restores and repaints the columns of the bars that changed.
+    """
+
+    def __init__(
+        self, ax, canvas, title, xlabel="Index", ylabel="Value", legend=None, blit=True
+    ):
+        super().__init__(title, xlabel, ylabel, legend)
+        self.ax = ax
+        self.canvas = canvas
+        self.blit = blit and canvas.supports_blit
+        self.background = None
+        if self.blit:
+            # A full draw (first frame, resize, title change) refreshes the cache
+            self.canvas.mpl_connect("draw_event", self._on_draw)
+            self.canvas.mpl_connect("resize_event", self._on_resize)
+
+    def _create_bars(self):
+        self.ax.clear()
+        self.bars = self.ax.bar(
+            range(len(self.heights)), self.heights, color=BASE_COLOR, animated=self.blit
+        )
+        self.background = None
+
+        self.ax.set_xlabel(self.xlabel)
+        self.ax.set_ylabel(self.ylabel)
+        self.ax.set_title(self.title)
+        if self.legend:
+            self._add_legend(self.legend)
+
+    def set_title(self, title, legend=None):
+        """Change the title (and optionally the legend) shown above the bars."""
+        self.title = title
+        self.ax.set_title(title)
+        if legend is not None:
+            self.legend = legend
+            self._add_legend(legend)
+        self.background = None
+
+    def _set_height(self, i, height):
+        self.bars[i].set_height(height)
+
+    def _set_color(self, i, color):
+        self.bars[i].set_facecolor(color)
+
+    def _rescale(self):
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.background = None
+
+    def _render(self, dirty):
+        """Repaint the bars in ``dirty``, falling back to a full draw if needed."""
+        if not self.blit or self.background is None:
+            self.canvas.draw()
+            return
+
+        if len(dirty) * 2 > len(self.bars):
+            # Most bars changed: one restore of the whole axes is cheaper
+            self.canvas.restore_region(self.background)
+            self._draw_animated(self.bars)
+            self.canvas.blit(self.ax.bbox)
+            return
+
+        for lo, hi in self._strips(dirty):
+            self._repaint(lo, hi)
+
+    def _on_draw(self, event):
+        """Cache the static background and paint the animated bars on top."""
+        if not self.bars or self.bars[0].axes is not self.ax:
+            return  # No bars yet, or another view cleared the axis
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_animated(self.bars)
+
+    def _add_legend(self, labels):
+        # The legend sits above the bars, so it has to be animated with them
+        legend = self.ax.legend(labels, loc="upper right")
+        legend.set_animated(self.blit)
+
+    def _draw_animated(self, bars, legend=True):
+        for bar in bars:
+            self.ax.draw_artist(bar)
+        if legend and self.ax.get_legend() is not None:
+            self.ax.draw_artist(self.ax.get_legend())
+
+    def _on_resize(self, event):
+        # The cached pixels no longer line up with the axes
+        self.background = None
+
+    def _strips(self, dirty):
+        """Group dirty indices into runs of neighbouring bars, widened to
+        cover the legend whenever a run reaches underneath it."""
+        legend = self.ax.get_legend()
+        if legend is not None:
+            x0, x1 = self.ax.transData.inverted().transform(
+                legend.get_window_extent().get_points()
+            )[:, 0]
+            first = max(math.floor(x0 + 0.5), 0)
+            last = min(math.floor(x1 + 0.5), len(self.bars) - 1)
+            covered = range(first, last + 1)
+        else:
+            covered = range(0)
+
+        strips = []
+        for i in sorted(dirty):
+            lo, hi = (covered.start, covered.stop - 1) if i in covered else (i, i)
+            if strips and lo <= strips[-1][1] + 1:
+                strips[-1] = (strips[-1][0], max(hi, strips[-1][1]))
+            else:
+                strips.append((lo, hi))
+        return strips
+
+    def _repaint(self, lo, hi):
+        """Restore the background under bars ``lo..hi`` and paint them again."""
+        (x0, _), (x1, _) = self.ax.transData.transform([(lo - 0.5, 0), (hi + 0.5, 0)])
+        x0, x1 = round(x0), round(x1)
+
+        legend = self.ax.get_legend()
+        overlaps = False
+        if legend is not None:
+            extent = legend.get_window_extent()
+            overlaps = extent.x0 < x1 and extent.x1 > x0
+            if overlaps:
+                x0 = min(x0, math.floor(extent.x0))
+                x1 = max(x1, math.ceil(extent.x1) + 1)
+
+        left, top, right, bottom = self.background.get_extents()
+        x0, x1 = max(x0, left), min(x1, right)
+
+        # The saved region uses Agg's top-left origin, blit uses the display origin
+        self.canvas.restore_region(
+            self.background, bbox=(x0, top, x1, bottom), xy=(left, top)
+        )
+        # Neighbours are repainted too: their snapped edges can share a pixel
+        # column with the strip, and opaque bars redraw onto themselves exactly
+        self._draw_animated(self.bars[max(lo - 1, 0) : hi + 2], legend=overlaps)
+
+        height = self.canvas.figure.bbox.height
+        self.canvas.blit(Bbox.from_extents(x0, height - bottom, x1, height - top))
@@ -0,0 +1,306 @@
+from collections import deque
+from functools import lru_cache
+
+import numpy as np
+
+BASE_COLOR = "C0"  # Matplotlib's default bar color
+
+LEGEND_COLORS = [BASE_COLOR, "r", "g"]  # Swatch colors for legend rows, in order
+
+DIM_COLOR = "lightgray"  # Heap tree nodes that are no longer part of the heap
+
+
+def bar_height(value):
+    """Return a drawable bar height (placeholders such as None are drawn empty)."""
+    return 0 if value is None else value
+
+
+def as_values(data):
+    """Return ``data`` as a float array (placeholders such as None become 0)."""
+    try:
+        return np.asarray(data, dtype=float)
+    except TypeError:
+        return np.array([bar_height(value) for value in data], dtype=float)
+
+
+class BarRenderer:
+    """Backend-independent bookkeeping shared by the bar-chart renderers.
+
+    The renderer keeps the previous frame as two arrays, the height of every
+    bar and the index of its color in ``palette``. ``update`` builds the
+    next frame's arrays, compares them with NumPy and hands only the bars
+    that differ to the backend; ``touched`` counts them for profiling.
+    Backends implement ``_create_bars``, ``_set_height``, ``_set_color``,
+    ``_rescale``, ``_render`` and ``set_title``.
+    """
+
+    def __init__(self, title, xlabel="Index", ylabel="Value", legend=None):
+        self.title = title
+        self.xlabel = xlabel
+        self.ylabel = ylabel
+        self.legend = legend
+        self.bars = None
+        self.heights = np.zeros(0)
+        self.palette = [BASE_COLOR]  # Colors seen so far, indexed by ``codes``
+        self.codes = np.zeros(0, dtype=np.int64)  # Palette index of every bar
+        self.default_color = BASE_COLOR
+        self.low = 0  # Value range the bars are currently scaled to
+        self.high = 1
+        self.touched = 0  # Bars handed to the backend by the last update
+        self.frames = 0
+        self.touched_total = 0
+
+    def reset(self, data):
+        """Create the bars for ``data`` and draw the static parts of the chart."""
+        self.heights = as_values(data)
+        self.codes = np.zeros(len(self.heights), dtype=np.int64)
+        self.default_color = BASE_COLOR
+        self.low = min(0, self.heights.min(initial=0))
+        self.high = max(1, self.heights.max(initial=1))
+        self._create_bars()
+
+    def detach(self):
+        """Forget the drawn bars; another renderer has taken the canvas."""
+        self.bars = None
+
+    def update(self, data, colors=None, default=None):
+        """Bring the bars in line with ``data`` and redraw.
+
+        ``colors`` maps bar indices to a color; every other bar is painted with
+        ``default`` (the base bar color when omitted).
+        """
+        if self.bars is None or len(data) != len(self.heights):
+            self.reset(data)
+
+        heights = as_values(data)
+        resized = np.flatnonzero(heights != self.heights)
+        for i in resized:
+            self._set_height(i, heights[i])
+        self.heights = heights
+
+        self.default_color = default or BASE_COLOR
+        codes = self._encode(colors or {})
+        recolored = np.flatnonzero(codes != self.codes)
+        for i in recolored:
+            self._set_color(i, self.palette[codes[i]])
+        self.codes = codes
+
+        if len(resized):
+            low, high = heights[resized].min(), heights[resized].max()
+            if low < self.low or high > self.high:
+                self.low, self.high = min(self.low, low), max(self.high, high)
+                self._rescale()
+
+        dirty = np.union1d(resized, recolored)
+        self.touched = len(dirty)
+        self.frames += 1
+        self.touched_total += self.touched
+        self._render(dirty)
+
+    def _encode(self, colors):
+        """Return the palette index of every bar's color in the next frame."""
+        codes = np.full(len(self.heights), self._code(self.default_color))
+        indices = np.fromiter(colors, dtype=np.int64, count=len(colors))
+        inside = (indices >= 0) & (indices < len(codes))
+        if inside.any():
+            values = [self._code(color) for color in colors.values()]
+            codes[indices[inside]] = np.asarray(values)[inside]
+        return codes
+
+    def _code(self, color):
+        if color not in self.palette:
+            self.palette.append(color)
+        return self.palette.index(color)
+
+
+class CellRenderer:
+    """Backend-independent bookkeeping shared by the stack and queue renderers.
+
+    Every item owns a cell at a fixed slot: ``items[i]`` sits in slot
+    ``first + i``. ``update`` recognizes a push (one item appended), a pop
+    (the last item removed) and a dequeue (the first item removed) and hands
+    the backend exactly one cell to add or remove, so existing cells never
+    move or get rebuilt. The view is a window of ``CAPACITY`` slots that
+    follows the top of a vertical stack or the front of a horizontal queue;
+    a dequeue shifts it by one slot.
+
+    Backends implement ``_add_cell``, ``_remove_cell``, ``_set_color``,
+    ``_set_visible``, ``_set_window``, ``_set_ends`` and ``_render``.
+    """
+
+    CAPACITY = 10  # Slots visible at once
+    FILL = "lightblue"
+
+    def __init__(self, title, orientation="vertical", empty_text="", ends=None):
+        self.title = title
+        self.orientation = orientation
+        self.empty_text = empty_text
+        self.ends = ends  # Labels under the first and last cell, e.g. Front/Rear
+        self.items = []
+        self.cells = deque()  # Backend handles, one per item
+        self.fills = deque()
+        self.painted = set()  # Slots currently drawn in a non-default color
+        self.first = 0  # Slot of items[0]
+        self.start = 0  # First slot of the view window
+
+    def update(self, items, colors=None):
+        """Draw ``items`` as cells; ``colors`` maps cell indices to a fill color."""
+        items = list(items)
+        old = self.items
+        if items == old:
+            pass
+        elif items[:-1] == old:
+            self._append(items[-1])
+        elif items == old[:-1]:
+            self._remove_cell(self.cells.pop())
+            self.fills.pop()
+        elif items == old[1:]:
+            self._remove_cell(self.cells.popleft())
+            self.fills.popleft()
+            self.first += 1
+        else:
+            # Not a single push, pop or dequeue: rebuild every cell
+            while self.cells:
+                self._remove_cell(self.cells.pop())
+            self.fills.clear()
+            self.painted = set()
+            self.first = self.start = 0
+            self._set_window(0)
+            for item in items:
+                self._append(item)
+        self.items = items
+
+        self._move_window()
+        self._paint(colors or {})
+        if self.ends:
+            self._set_ends()
+        self._render()
+
+    def _append(self, item):
+        slot = self.first + len(self.cells)
+        visible = self.start <= slot < self.start + self.CAPACITY
+        self.cells.append(self._add_cell(slot, item, visible))
+        self.fills.append(self.FILL)
+
+    def _move_window(self):
+        n = len(self.items)
+        if self.orientation == "vertical":
+            start = self.first + max(n - self.CAPACITY, 0)  # Keep the top in view
+        else:
+            start = self.first  # Keep the front in view
+        if start == self.start:
+            return
+
+        old, self.start = self.start, start
+        self._set_window(start)
+        # Only the cells between the old and the new window edges change
+        low, high = min(old, start), max(old, start)
+        edges = list(range(low, high)) + list(
+            range(low + self.CAPACITY, high + self.CAPACITY)
+        )
+        for slot in edges:
+            i = slot - self.first
+            if 0 <= i < n:
+                self._set_visible(self.cells[i], start <= slot < start + self.CAPACITY)
+
+    def _paint(self, colors):
+        slots = {self.first + i: color for i, color in colors.items()}
+        painted = set()
+        for slot in self.painted.union(slots):
+            i = slot - self.first
+            if not 0 <= i < len(self.cells):
+                continue
+            color = slots.get(slot, self.FILL)
+            if color != self.FILL:
+                painted.add(slot)
+            if color != self.fills[i]:
+                self.fills[i] = color
+                self._set_color(self.cells[i], color)
+        self.painted = painted
+
+    def rear_slot(self):
+        """Slot under which the rear label goes: the last cell if it is in view."""
+        last = self.first + len(self.items) - 1
+        return min(last, self.start + self.CAPACITY - 1)
+
+
+@lru_cache(maxsize=None)
+def tree_layout(count):
+    """Return the positions of ``count`` binary heap nodes in the unit square.
+
+    Node ``i`` sits on level ``floor(log2(i + 1))``, centered in its share
+    of the width; ``y`` grows downwards from the root. The arrays are
+    computed once per ``count`` and shared, so they must not be modified.
+    """
+    index = np.arange(count)
+    level = np.floor(np.log2(index + 1)).astype(np.int64)
+    levels = int(level[-1]) + 1 if count else 1
+    slot = index + 1 - 2**level
+    x = (slot + 0.5) / 2.0**level
+    y = (level + 0.5) / levels
+    for array in (x, y):
+        array.flags.writeable = False
+    return x, y
+
+
+class TreeRenderer:
+    """Backend-independent bookkeeping shared by the heap tree renderers.
+
+    Draws an array as the binary heap it encodes: element ``i`` is a node
+    whose children are ``2i + 1`` and ``2i + 2``. Node positions only depend
+    on the length (see ``tree_layout``), so ``reset`` creates the nodes and
+    edges once and ``update`` relabels and recolors only the nodes whose
+    value or color changed: a swap touches two nodes and nothing moves.
+    Only the first ``MAX_NODES`` elements (the top levels) are drawn, and
+    those past the end of the heap, e.g. the sorted tail of a heap sort, are
+    dimmed.
+
+    Backends implement ``_create_nodes(x, y)``, ``_set_label``,
+    ``_set_color``, ``_render`` and ``set_title``.
+    """
+
+    MAX_NODES = 127  # Seven levels
+
+    def __init__(self, title):
+        self.title = title
+        self.length = None  # Length of the array the nodes were created for
+        self.labels = []
+        self.colors = []
+        self.touched = 0  # Nodes handed to the backend by the last update
+
+    def reset(self, data):
+        """Create the nodes for ``data`` and draw them."""
+        self.length = len(data)
+        count = min(len(data), self.MAX_NODES)
+        self.labels = [None] * count
+        self.colors = [None] * count
+        self._create_nodes(*tree_layout(count))
+        self.update(data)
+
+    def update(self, data, colors=None, default=None, size=None):
+        """Bring the nodes in line with ``data`` and redraw.
+
+        ``colors`` maps indices to a color; every other node is painted with
+        ``default`` (the base bar color when omitted). Only the first
+        ``size`` elements (all of them when omitted) are in the heap; the
+        nodes of the others are painted ``DIM_COLOR``.
+        """
+        if len(data) != self.length:
+            self.reset(data)
+        colors = colors or {}
+        default = default or BASE_COLOR
+        size = len(data) if size is None else size
+        touched = 0
+        for i in range(len(self.labels)):
+            label = str(data[i])
+            color = colors.get(i, default) if i < size else DIM_COLOR
+            if label != self.labels[i]:
+                self.labels[i] = label
+                self._set_label(i, label)
+                touched += 1
+            if color != self.colors[i]:
+                self.colors[i] = color
+                self._set_color(i, color)
+                touched += 1
+        self.touched = touched
+        self._render()
@@ -0,0 +1,30 @@
+import numpy as np
+
+from codecrux.algorithms.sorting import bucket_indices
+
+
+class BucketLayout:
+    """Fixed bar slots for the buckets of a bucket sort.
+
+    All values are known before the distribution starts, so the size of every
+    bucket is computed up front and each bucket gets its own run of slots,
+    ``offsets[k]:offsets[k + 1]``. An element dropped into a bucket fills
+    the next free slot of that run and nothing else moves, so the bar
+    renderer only repaints the bars of the bucket that changed. ``stripes``
+    colors every other bucket so that neighbouring buckets stand apart.
+    """
+
+    COLORS = ("b", "cyan")
+
+    def __init__(self, values, count=10):
+        self.count = count
+        self.index = np.asarray(bucket_indices(values, count), dtype=np.int64)
+        sizes = np.bincount(self.index, minlength=count)
+        self.offsets = np.concatenate([[0], np.cumsum(sizes)])
+
+        # Slots of the odd buckets, painted in the second color
+        odd = np.flatnonzero(np.arange(count) % 2 == 1)
+        slots = np.concatenate(
+            [np.arange(self.offsets[k], self.offsets[k + 1]) for k in odd] or [[]]
+        )
+        self.stripes = dict.fromkeys(slots.astype(np.int64).tolist(), self.COLORS[1])
@@ -0,0 +1,134 @@
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+from matplotlib.patches import Patch
+
+from rendering.base import LEGEND_COLORS
+from rendering.lod import EnvelopeRenderer
+
+
+class EnvelopeChartRenderer(EnvelopeRenderer):
+    """Draws per-pixel column envelopes with a handful of matplotlib artists.
+
+    The faint bars and the min/max envelopes are each one Line2D whose
+    vertical strokes are separated by NaNs, so all columns are replaced with
+    a single ``set_data`` and drawn as a single path; a step costs the same
+    whether the array has ten thousand or a million elements. Highlights are
+    a small LineCollection. With ``blit`` enabled the artists are animated
+    over a cached background, like the bars of ``BarChartRenderer``.
+    """
+
+    def __init__(
+        self, ax, canvas, title, xlabel="Index", ylabel="Value", legend=None, blit=True
+    ):
+        super().__init__(title, xlabel, ylabel, legend)
+        self.ax = ax
+        self.canvas = canvas
+        self.blit = blit and canvas.supports_blit
+        self.background = None
+        self.artists = []
+        if self.blit:
+            self.canvas.mpl_connect("draw_event", self._on_draw)
+            self.canvas.mpl_connect("resize_event", self._on_resize)
+
+    def _columns(self):
+        return max(int(self.ax.bbox.width), 1)
+
+    def _create_columns(self):
+        self.ax.clear()
+        pixel = 72 / self.ax.figure.dpi  # One pixel in points
+        options = dict(linewidth=pixel, antialiased=False, animated=self.blit)
+
+        (self.base,) = self.ax.plot([], [], **options)
+        # Projecting caps keep a column visible when its minimum equals its maximum
+        (self.band,) = self.ax.plot([], [], solid_capstyle="projecting", **options)
+        (self.mean_line,) = self.ax.plot(
+            [], [], color="black", linewidth=0.8, animated=self.blit
+        )
+        self.overlay_lines = LineCollection(
+            [], linewidths=3 * pixel, antialiased=False, animated=self.blit
+        )
+        self.ax.add_collection(self.overlay_lines)
+        self.artists = [self.base, self.band, self.mean_line, self.overlay_lines]
+        self.background = None
+
+        self.ax.set_xlim(-0.5, len(self.values) - 0.5)
+        self.ax.set_ylim(self.low, self.high)
+        self.ax.set_xlabel(self.xlabel)
+        self.ax.set_ylabel(self.ylabel)
+        self.ax.set_title(self.title)
+        if self.legend:
+            self._add_legend(self.legend)
+
+    def set_title(self, title, legend=None):
+        """Change the title (and optionally the legend) shown above the columns."""
+        self.title = title
+        self.ax.set_title(title)
+        if legend is not None:
+            self.legend = legend
+            self._add_legend(legend)
+        self.background = None
+
+    def _draw_columns(self, low, high, mean):
+        x = self.column_centers()
+        zero = np.zeros_like(low)
+        self.base.set_data(*self._strokes(x, zero, low))
+        self.base.set_color(to_rgba(self.default_color, 0.35))
+        self.band.set_data(*self._strokes(x, low, high))
+        self.band.set_color(self.default_color)
+        self.mean_line.set_data(x, mean)
+
+        columns = np.fromiter(self.overlay, dtype=np.int64, count=len(self.overlay))
+        self.overlay_lines.set_segments(
+            self._segments(x[columns], zero[columns], high[columns])
+        )
+        self.overlay_lines.set_color([self.overlay[c] for c in self.overlay])
+
+    @staticmethod
+    def _strokes(x, y0, y1):
+        """Vertical strokes from ``y0`` to ``y1`` at ``x`` as one NaN-broken line."""
+        gaps = np.full_like(x, np.nan)
+        xs = np.column_stack([x, x, gaps]).ravel()
+        ys = np.column_stack([y0, y1, gaps]).ravel()
+        return xs, ys
+
+    @staticmethod
+    def _segments(x, y0, y1):
+        """Vertical segments from ``y0`` to ``y1`` at ``x``, as a (n, 2, 2) array."""
+        return np.stack([np.column_stack([x, y0]), np.column_stack([x, y1])], axis=1)
+
+    def _rescale(self):
+        self.ax.set_ylim(self.low, self.high)
+        self.background = None
+
+    def _render(self):
+        if not self.blit or self.background is None:
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self.background)
+        self._draw_animated()
+        self.canvas.blit(self.ax.bbox)
+
+    def _on_draw(self, event):
+        """Cache the static background and paint the animated columns on top."""
+        if not self.artists or self.band.axes is not self.ax or self.edges is None:
+            return  # No columns yet, or another view took over the axis
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_animated()
+
+    def _on_resize(self, event):
+        self.background = None
+
+    def _add_legend(self, labels):
+        handles = [
+            Patch(color=LEGEND_COLORS[row % len(LEGEND_COLORS)])
+            for row in range(len(labels))
+        ]
+        legend = self.ax.legend(handles, labels, loc="upper right")
+        legend.set_animated(self.blit)
+
+    def _draw_animated(self):
+        for artist in self.artists:
+            self.ax.draw_artist(artist)
+        if self.ax.get_legend() is not None:
+            self.ax.draw_artist(self.ax.get_legend())
@@ -0,0 +1,86 @@
+import tkinter as tk
+
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+
+
+class FigurePool:
+    """Matplotlib figures embedded in one window.
+
+    Figures are built with ``matplotlib.figure.Figure`` rather than pyplot, so
+    nothing outside the pool keeps them alive. ``release`` does not destroy
+    them: it clears every figure, unpacks its canvas and keeps it idle for
+    the next ``acquire``, so a page that rebuilds its charts (every new
+    race) reuses the same figures rather than growing new ones. The canvases
+    are children of the window, only packed into the frames that show them,
+    so they outlive those frames; the ones destroyed with the rest of the
+    window's widgets when the user leaves a page are dropped.
+
+    New canvases are made with ``canvas_class(figure, master=window)``; any
+    matplotlib canvas with a ``get_tk_widget`` will do, which is how the
+    bookkeeping is tested without a display.
+    """
+
+    def __init__(self, canvas_class=FigureCanvasTkAgg):
+        self.canvas_class = canvas_class
+        self.figures = []  # (figure, canvas, callback ids) in use
+        self.idle = []  # Released figures, ready to be packed again
+
+    def acquire(self, master, figsize, size=None):
+        """Return a figure with one empty axis, its Tk canvas packed into ``master``."""
+        self.idle = [entry for entry in self.idle if _alive(entry[1])]
+        if self.idle:
+            fig, canvas, builtin = self.idle.pop()
+            fig.set_size_inches(figsize)
+        else:
+            fig = Figure(figsize=figsize)
+            canvas = self.canvas_class(fig, master=master.winfo_toplevel())
+            builtin = _connections(canvas)
+        ax = fig.add_subplot()
+        canvas_widget = canvas.get_tk_widget()
+        if size is None:
+            size = (int(fig.bbox.width), int(fig.bbox.height))
+        canvas_widget.configure(width=size[0], height=size[1])
+        canvas_widget.pack(in_=master, fill=tk.BOTH, expand=True)
+        canvas_widget.lift()  # Over the frames of the page, which may be newer
+        self.figures.append((fig, canvas, builtin))
+        return fig, ax, canvas
+
+    def release(self):
+        """Clear every figure in use, unpack its canvas and keep it idle."""
+        for fig, canvas, builtin in self.figures:
+            if not _alive(canvas):
+                continue
+            # Drop what the renderer hooked up, such as resize handlers
+            for cid in _connections(canvas) - builtin:
+                canvas.mpl_disconnect(cid)
+            fig.clear()
+            canvas.get_tk_widget().pack_forget()
+            self.idle.append((fig, canvas, builtin))
+        self.figures = []
+
+
+def _alive(canvas):
+    return bool(canvas.get_tk_widget().winfo_exists())
+
+
+def _connections(canvas):
+    """The ids of the callbacks connected to ``canvas``."""
+    return {cid for ids in canvas.callbacks.callbacks.values() for cid in ids}
+
+
+# One pool per top-level window, keyed by its Tk path name
+_pools = {}
+
+
+def pool_for(widget):
+    """Return the figure pool of the window that contains ``widget``."""
+    return _pools.setdefault(str(widget.winfo_toplevel()), FigurePool())
+
+
+def release(widget):
+    """Release the figures of the window that contains ``widget`` for reuse."""
+    pool = _pools.get(str(widget.winfo_toplevel()))
+    if pool is not None:
+        pool.release()
+
@@ -0,0 +1,168 @@
+import numpy as np
+
+from rendering.base import BASE_COLOR, as_values
+
+
+def column_edges(n, columns):
+    """Split ``n`` elements into ``columns`` near-equal buckets.
+
+    Returns ``columns + 1`` indices: bucket ``c`` holds the elements
+    ``edges[c]:edges[c + 1]``. Every bucket is non-empty when ``n >= columns``.
+    """
+    return np.arange(columns + 1, dtype=np.int64) * n // columns
+
+
+def column_envelopes(values, edges):
+    """Return the per-bucket minimum, maximum and mean of ``values``."""
+    starts = edges[:-1]
+    low = np.minimum.reduceat(values, starts)
+    high = np.maximum.reduceat(values, starts)
+    mean = np.add.reduceat(values, starts) / np.diff(edges)
+    return low, high, mean
+
+
+def column_of(indices, edges):
+    """Return the bucket that holds each element index in ``indices``."""
+    return np.searchsorted(edges, indices, side="right") - 1
+
+
+class EnvelopeRenderer:
+    """Draws an array too large for one bar per element as pixel columns.
+
+    Elements are bucketed into one column per pixel of plot width. Each
+    column shows the minimum-to-maximum envelope of its bucket on top of a
+    faint bar from 0 to the minimum, and a line joins the bucket means, so a
+    sorted run still reads as a staircase and a shuffled one as a band.
+    Highlighted indices are painted over their column in their own color.
+
+    Backends implement ``_columns``, ``_create_columns``, ``_draw_columns``,
+    ``_rescale``, ``_render`` and ``set_title``.
+    """
+
+    def __init__(self, title, xlabel="Index", ylabel="Value", legend=None):
+        self.title = title
+        self.xlabel = xlabel
+        self.ylabel = ylabel
+        self.legend = legend
+        self.values = np.zeros(0)
+        self.edges = None  # Bucket boundaries, None until the columns exist
+        self.envelopes = None
+        self.overlay = {}
+        self.default_color = BASE_COLOR
+        self.low = 0
+        self.high = 1
+        self.touched = 0  # Columns whose envelope or highlight changed last update
+
+    def reset(self, data):
+        """Bucket ``data`` into one column per pixel and create the artists."""
+        self.values = as_values(data)
+        self.edges = column_edges(len(self.values), self._columns())
+        self.envelopes = column_envelopes(self.values, self.edges)
+        self.overlay = {}
+        self.default_color = BASE_COLOR
+        self.low = min(0, self.values.min())
+        self.high = max(1, self.values.max())
+        self._create_columns()
+        self._draw_columns(*self.envelopes)
+
+    def detach(self):
+        """Forget the drawn columns; another renderer has taken the canvas."""
+        self.edges = None
+
+    def update(self, data, colors=None, default=None):
+        """Bring the columns in line with ``data`` and redraw.
+
+        ``colors`` maps element indices to a highlight color; every other
+        element is drawn with ``default`` (the base bar color when omitted).
+        """
+        values = as_values(data)
+        fresh = (
+            self.edges is None
+            or len(values) != len(self.values)
+            or len(self.edges) - 1 != self._columns()
+        )
+        if fresh:
+            self.reset(values)
+
+        default = default or BASE_COLOR
+        overlay = {}
+        if colors:
+            indices = np.fromiter(colors, dtype=np.int64, count=len(colors))
+            for i, column in zip(colors, column_of(indices, self.edges)):
+                if colors[i] != default and 0 <= column < len(self.edges) - 1:
+                    overlay[int(column)] = colors[i]
+
+        changed = not np.array_equal(values, self.values)
+        restyled = overlay != self.overlay or default != self.default_color
+        if not (fresh or changed or restyled):
+            self.touched = 0
+            return
+
+        moved = set()
+        if changed:
+            self.values = values
+            envelopes = column_envelopes(values, self.edges)
+            differs = [new != old for new, old in zip(envelopes, self.envelopes)]
+            moved.update(np.flatnonzero(np.logical_or.reduce(differs)).tolist())
+            self.envelopes = envelopes
+            low, high = min(self.low, values.min()), max(self.high, values.max())
+            if (low, high) != (self.low, self.high):
+                self.low, self.high = low, high
+                self._rescale()
+
+        if fresh or default != self.default_color:
+            self.touched = len(self.edges) - 1
+        else:
+            self.touched = len(moved.union(overlay, self.overlay))
+        self.overlay = overlay
+        self.default_color = default
+        self._draw_columns(*self.envelopes)
+        self._render()
+
+    def column_centers(self):
+        """Return the element index at the middle of every column."""
+        return (self.edges[:-1] + self.edges[1:] - 1) / 2
+
+
+class LevelOfDetail:
+    """Bar renderer that switches between exact bars and pixel columns.
+
+    While every element gets at least one pixel of plot width the ``exact``
+    renderer draws one bar per element. Larger arrays are handed to the
+    ``aggregated`` renderer, which buckets them into per-pixel columns. The
+    choice is re-evaluated on every reset and update, so resizing the window
+    switches modes too. ``columns`` returns the current plot width in pixels.
+    """
+
+    def __init__(self, exact, aggregated, columns):
+        self.exact = exact
+        self.aggregated = aggregated
+        self.columns = columns
+        self.active = exact
+
+    def reset(self, data):
+        self._choose(len(data))
+        self.active.reset(data)
+
+    def update(self, data, colors=None, default=None):
+        self._choose(len(data))
+        self.active.update(data, colors, default)
+
+    @property
+    def touched(self):
+        """Bars or columns the active renderer repainted in its last update."""
+        return self.active.touched
+
+    def set_title(self, title, legend=None):
+        """Change the title (and optionally the legend) shown above the chart."""
+        self.active.set_title(title, legend)
+        for renderer in (self.exact, self.aggregated):
+            renderer.title = title
+            if legend is not None:
+                renderer.legend = legend
+
+    def _choose(self, n):
+        renderer = self.aggregated if n > self.columns() else self.exact
+        if renderer is not self.active:
+            self.active.detach()
+            self.active = renderer
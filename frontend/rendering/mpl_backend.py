@@ -0,0 +1,298 @@
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.patches import Rectangle
+
+from rendering.base import BASE_COLOR, CellRenderer, TreeRenderer
+from rendering.bar_chart import BarChartRenderer
+from rendering.envelope_chart import EnvelopeChartRenderer
+from rendering.figure_pool import pool_for, release
+from rendering.lod import LevelOfDetail
+
+
+def embed_figure(master, figsize, size=None):
+    """Create a pooled figure with one axis and pack its canvas into ``master``."""
+    return pool_for(master).acquire(master, figsize, size)
+
+
+class MatplotlibBars(LevelOfDetail):
+    """Bar chart drawn with matplotlib (the original look of the screens).
+
+    Arrays wider than the axes are drawn as per-pixel column envelopes.
+    """
+
+    def __init__(
+        self, master, title, xlabel="Index", ylabel="Value", legend=None, blit=True
+    ):
+        self.fig, ax, canvas = embed_figure(master, figsize=(8, 4))
+        labels = (title, xlabel, ylabel, legend, blit)
+        super().__init__(
+            BarChartRenderer(ax, canvas, *labels),
+            EnvelopeChartRenderer(ax, canvas, *labels),
+            columns=lambda: int(ax.bbox.width),
+        )
+
+
+class MatplotlibCells(CellRenderer):
+    """Stack or queue cells drawn as labelled rectangles.
+
+    Each cell is a Rectangle and a Text created once, at a fixed slot in
+    data coordinates; moving the view window only changes the axis limits.
+    """
+
+    BOX = 0.6  # Width of a queue cell in data units
+
+    def __init__(self, master, title, orientation="vertical", empty_text="", ends=None):
+        super().__init__(title, orientation, empty_text, ends)
+        figsize = (6, 8) if orientation == "vertical" else (8, 4)
+        self.fig, self.ax, self.canvas = embed_figure(master, figsize, size=(400, 400))
+        self.ax.axis("off")
+        self.ax.set_title(title)
+        self.empty_label = self.ax.text(
+            0.5,
+            0.5,
+            empty_text,
+            ha="center",
+            va="center",
+            fontsize=12,
+            transform=self.ax.transAxes,
+        )
+        self.end_labels = [
+            self.ax.text(0, 0, label, ha="center", va="center", fontsize=10)
+            for label in ends or []
+        ]
+        self._set_window(0)
+
+    def _add_cell(self, slot, item, visible):
+        if self.orientation == "vertical":
+            xy, width, height = (0.2, slot), 0.6, 0.8
+            center, fontsize = (0.5, slot + 0.4), 12
+        else:
+            xy, width, height = (slot * self.BOX, 0.2), self.BOX, self.BOX
+            center, fontsize = ((slot + 0.5) * self.BOX, 0.5), 10
+        rect = Rectangle(
+            xy,
+            width,
+            height,
+            fill=True,
+            facecolor=self.FILL,
+            edgecolor="black",
+            linewidth=2,
+        )
+        text = self.ax.text(
+            *center,
+            str(item),
+            ha="center",
+            va="center",
+            fontsize=fontsize,
+            fontweight="bold",
+        )
+        self.ax.add_patch(rect)
+        for artist in (rect, text):
+            artist.set_visible(visible)
+        return rect, text
+
+    def _remove_cell(self, cell):
+        for artist in cell:
+            artist.remove()
+
+    def _set_color(self, cell, color):
+        cell[0].set_facecolor(color)
+
+    def _set_visible(self, cell, visible):
+        for artist in cell:
+            artist.set_visible(visible)
+
+    def _set_window(self, start):
+        if self.orientation == "vertical":
+            self.ax.set_xlim(0, 1)
+            self.ax.set_ylim(start - 0.1, start + self.CAPACITY)
+        else:
+            left = start * self.BOX
+            self.ax.set_xlim(left - 0.2, left + self.CAPACITY * self.BOX + 0.2)
+            self.ax.set_ylim(0, 1)
+
+    def _set_ends(self):
+        slots = (self.first, self.rear_slot())
+        for label, slot in zip(self.end_labels, slots):
+            label.set_position(((slot + 0.5) * self.BOX, 0.05))
+            label.set_visible(bool(self.items))
+
+    def _render(self):
+        self.empty_label.set_visible(not self.items)
+        self.canvas.draw()
+
+
+class MatplotlibNodes:
+    """Linked-list nodes drawn as circles joined by arrows.
+
+    The whole list is a fixed set of artists: one PathCollection for the
+    nodes, one LineCollection for the edges, one marker collection per arrow
+    end and a pool of Text labels that grows with the longest list seen.
+    A traversal step only rewrites the halo color array, and the layout is
+    recomputed only when the length of the list or the axis size changes.
+    """
+
+    NODE = 500 ** 0.5  # Diameter of a node in points (the original marker size)
+    MIN_LABEL = 12  # Nodes smaller than this many points are drawn unlabelled
+
+    def __init__(self, master, title, arrow="->"):
+        self.fig, self.ax, self.canvas = embed_figure(master, figsize=(8, 4))
+        self.title = title
+        self.arrow = arrow
+        self.values = []
+        self.highlight = set()
+        self.layout = None  # (length, axis width) the artists are placed for
+
+        ax = self.ax
+        self.nodes = ax.scatter([], [], s=[], facecolors="lightblue", zorder=2)
+        self.edges = LineCollection([], colors="gray", linewidths=1, zorder=1)
+        ax.add_collection(self.edges)
+        self.heads = ax.scatter([], [], marker=">", c="gray", zorder=1)
+        self.tails = ax.scatter([], [], marker="<", c="gray", zorder=1)
+        self.tails.set_visible(arrow == "<->")
+        self.labels = []  # Text pool; labels past the list length are hidden
+        self.show_labels = True
+        ax.set_ylim(-0.5, 0.5)
+        ax.axis("off")
+        ax.set_title(title)
+        self.canvas.mpl_connect("resize_event", lambda event: self._layout())
+
+    def update(self, values, highlight=None):
+        """Draw ``values`` as a chain of nodes, haloing the ``highlight`` indices."""
+        values = list(values)
+        relabel = values != self.values
+        self.values = values
+        self.highlight = set(highlight or [])
+        if self.layout != (len(values), self.ax.bbox.width):
+            self._layout()
+        elif relabel:
+            self._label()
+
+        halo = [i in self.highlight for i in range(len(values))]
+        self.nodes.set_edgecolors(["yellow" if h else "none" for h in halo])
+        self.canvas.draw()
+
+    def _layout(self):
+        """Place the nodes, edges and labels for the current length and size."""
+        n = len(self.values)
+        self.layout = (n, self.ax.bbox.width)
+        self.ax.set_xlim(-0.5, max(n, 1) - 0.5)
+
+        # Shrink the nodes once the list no longer fits at the original size
+        points_per_node = self.ax.bbox.width * 72 / self.fig.dpi / max(n, 1)
+        diameter = min(self.NODE, points_per_node * 0.6)
+        radius = diameter / 2 / points_per_node  # In data units
+
+        x = np.arange(n, dtype=float)
+        y = np.zeros(n)
+        self.nodes.set_offsets(np.column_stack([x, y]))
+        self.nodes.set_sizes([diameter**2])
+        self.nodes.set_linewidths(max(diameter * 0.1, 1))
+
+        tail, head = x[:-1] + radius, x[1:] - radius
+        starts, ends = np.column_stack([tail, y[1:]]), np.column_stack([head, y[1:]])
+        self.edges.set_segments(np.stack([starts, ends], axis=1))
+        arrow = (diameter * 0.3) ** 2
+        self.heads.set_offsets(np.column_stack([head - radius * 0.2, y[1:]]))
+        self.heads.set_sizes([arrow])
+        self.tails.set_offsets(np.column_stack([tail + radius * 0.2, y[1:]]))
+        self.tails.set_sizes([arrow])
+
+        while len(self.labels) < n:
+            self.labels.append(
+                self.ax.text(0, 0, "", ha="center", va="center", fontweight="bold")
+            )
+        for i, label in enumerate(self.labels):
+            label.set_position((i, 0))
+            label.set_fontsize(min(10, diameter * 0.45))
+        self.show_labels = diameter >= self.MIN_LABEL
+        self._label()
+
+    def _label(self):
+        for i, label in enumerate(self.labels):
+            shown = self.show_labels and i < len(self.values)
+            label.set_visible(shown)
+            if shown:
+                label.set_text(str(self.values[i]))
+
+
+class MatplotlibHeapTree(TreeRenderer):
+    """Binary heap drawn as one PathCollection of nodes over a LineCollection.
+
+    The node positions are set once per length; an update rewrites the
+    labels and face colors of the nodes that changed and redraws, and a
+    resize only rescales the markers.
+    """
+
+    NODE = 30  # Largest node diameter in points
+    MIN_LABEL = 12  # Nodes smaller than this many points are drawn unlabelled
+
+    def __init__(self, master, title):
+        super().__init__(title)
+        self.fig, self.ax, self.canvas = embed_figure(master, figsize=(4, 4))
+        self.fig.subplots_adjust(left=0.02, right=0.98, bottom=0.02, top=0.9)
+        self.ax.set_xlim(0, 1)
+        self.ax.set_ylim(1, 0)
+        self.ax.axis("off")
+        self.ax.set_title(title)
+        self.edges = LineCollection([], colors="gray", zorder=1)
+        self.ax.add_collection(self.edges)
+        self.nodes = self.ax.scatter([], [], zorder=2)
+        self.texts = []
+        self.facecolors = []
+        self.canvas.mpl_connect("resize_event", lambda event: self._size_nodes())
+
+    def set_title(self, title, legend=None):
+        self.title = title
+        self.ax.set_title(title)
+        self.canvas.draw()
+
+    def _create_nodes(self, x, y):
+        self.nodes.set_offsets(np.column_stack([x, y]))
+        parents = (np.arange(1, len(x)) - 1) // 2
+        self.edges.set_segments(
+            [((x[i], y[i]), (x[p], y[p])) for i, p in enumerate(parents, 1)]
+        )
+        for text in self.texts:
+            text.remove()
+        self.texts = [
+            self.ax.text(
+                x[i], y[i], "", ha="center", va="center", color="white", zorder=3
+            )
+            for i in range(len(x))
+        ]
+        self.facecolors = [BASE_COLOR] * len(x)
+        self._size_nodes()
+
+    def _size_nodes(self):
+        """Fit the markers to the room the bottom level leaves each node."""
+        levels = len(self.texts).bit_length()
+        if levels == 0:
+            return
+        width = self.ax.bbox.width * 72 / self.fig.dpi
+        height = self.ax.bbox.height * 72 / self.fig.dpi
+        diameter = min(
+            self.NODE, 0.8 * width / 2 ** (levels - 1), 0.6 * height / levels
+        )
+        self.nodes.set_sizes([diameter**2])
+        for text in self.texts:
+            text.set_fontsize(min(10, diameter * 0.45))
+            text.set_visible(diameter >= self.MIN_LABEL)
+
+    def _set_label(self, i, label):
+        self.texts[i].set_text(label)
+
+    def _set_color(self, i, color):
+        self.facecolors[i] = color
+
+    def _render(self):
+        self.nodes.set_facecolors(self.facecolors)
+        self.canvas.draw()
+
+
+RENDERERS = {
+    "bars": MatplotlibBars,
+    "cells": MatplotlibCells,
+    "nodes": MatplotlibNodes,
+    "tree": MatplotlibHeapTree,
+}
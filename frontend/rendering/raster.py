@@ -0,0 +1,271 @@
+import tkinter as tk
+
+import numpy as np
+
+from rendering.base import BASE_COLOR, as_values
+from rendering.lod import column_edges, column_envelopes, column_of
+from rendering.tk_canvas import (
+    TkAxes,
+    TkCells,
+    TkHeapTree,
+    TkNodes,
+    create_canvas,
+    tk_color,
+)
+
+WHITE = np.array([255, 255, 255], dtype=np.uint8)
+
+# Value colormap of the "strip" style, from low to high values (viridis)
+STRIP_COLORS = np.array(
+    [[68, 1, 84], [59, 82, 139], [33, 145, 140], [94, 201, 98], [253, 231, 37]],
+    dtype=float,
+)
+
+# Beyond this many separate dirty runs one put() of their whole span is cheaper
+MAX_RUNS = 8
+
+
+def ppm(pixels):
+    """Encode an (height, width, 3) uint8 array as binary PPM image data."""
+    height, width, _ = pixels.shape
+    header = b"P6 %d %d 255\n" % (width, height)
+    return header + np.ascontiguousarray(pixels).tobytes()
+
+
+def tint(rgb, amount=0.65):
+    """Blend the (n, 3) uint8 colors ``rgb`` towards white by ``amount``."""
+    return (rgb + (255 - rgb.astype(float)) * amount).astype(np.uint8)
+
+
+class Raster:
+    """An array drawn into an RGB pixel buffer, one pixel column at a time.
+
+    Every pixel column is described by a solid span ``start..stop`` (in
+    value units) and a color; in the "bars" style a faint tint fills the
+    space between 0 and ``start``, in the "strip" style the whole column is
+    painted in a color picked from the value. Arrays narrower than the buffer
+    give each element a slot of several columns; wider arrays are bucketed
+    into per-column min/max envelopes as in ``rendering.lod``.
+
+    ``update`` only repaints the columns whose span or color changed and
+    returns their indices so that callers can copy just those to the screen.
+    """
+
+    def __init__(self, width, height, style="bars"):
+        self.width = width
+        self.height = height
+        self.style = style
+        self.pixels = np.empty((height, width, 3), dtype=np.uint8)
+        self.pixels[:] = WHITE
+        self.state = None  # (start, stop, rgb) per column as last painted
+        self.low = 0
+        self.high = 1
+
+    def update(self, values, colors, default_rgb):
+        """Repaint ``values`` with ``colors`` mapping indices to (3,) RGB arrays.
+
+        Returns the indices of the pixel columns that changed, in order.
+        """
+        n = len(values)
+        low, high = min(self.low, values.min()), max(self.high, values.max())
+        if (low, high) != (self.low, self.high):
+            self.low, self.high = low, high
+            self.state = None  # Every column moves on a new scale
+
+        columns = np.arange(self.width)
+        rgb = np.empty((self.width, 3), dtype=np.uint8)
+        rgb[:] = default_rgb
+        if n >= self.width:
+            edges = column_edges(n, self.width)
+            start, stop, mean = column_envelopes(values, edges)
+            marked = column_of(list(colors), edges)
+            for column, color in zip(marked, colors.values()):
+                rgb[column] = color
+                start[column] = 0  # Highlights cover their column from 0
+        else:
+            slots = column_edges(self.width, n)  # First column of every element
+            element = column_of(columns, slots)
+            stop = mean = values[element]
+            start = np.zeros(self.width)
+            for i, color in colors.items():
+                rgb[slots[i] : slots[i + 1]] = color
+            if self.width >= 4 * n:
+                # Wide slots get a blank first column to separate the bars
+                rgb[slots[:-1]] = WHITE
+
+        if self.style == "strip":
+            rgb = np.where(
+                (rgb == default_rgb).all(axis=1)[:, None], self._strip_color(mean), rgb
+            )
+
+        if self.state is None:
+            dirty = columns
+        else:
+            old_start, old_stop, old_rgb = self.state
+            dirty = np.flatnonzero(
+                (start != old_start) | (stop != old_stop) | (rgb != old_rgb).any(axis=1)
+            )
+        self.state = (start, stop, rgb)
+        self._paint(dirty)
+        return dirty
+
+    def _strip_color(self, values):
+        anchors = np.arange(len(STRIP_COLORS))
+        position = (values - self.low) / (self.high - self.low) * anchors[-1]
+        return np.column_stack(
+            [np.interp(position, anchors, STRIP_COLORS[:, k]) for k in range(3)]
+        ).astype(np.uint8)
+
+    def _row(self, values):
+        """Pixel row (0 at the top) of each value on the current scale."""
+        scale = (self.height - 1) / (self.high - self.low)
+        rows = np.rint((self.high - values) * scale).astype(np.int64)
+        return np.clip(rows, 0, self.height - 1)
+
+    def _paint(self, dirty):
+        if len(dirty) == 0:
+            return
+        start, stop, rgb = (part[dirty] for part in self.state)
+        if self.style == "strip":
+            self.pixels[:, dirty] = rgb
+            return
+
+        rows = np.arange(self.height)[:, None]
+        top, bottom = self._row(stop), self._row(start)
+        zero = self._row(np.zeros(1))
+        solid = (rows >= np.minimum(top, bottom)) & (rows <= np.maximum(top, bottom))
+        faint = (rows >= np.minimum(bottom, zero)) & (rows <= np.maximum(bottom, zero))
+        self.pixels[:, dirty] = np.where(
+            solid[..., None], rgb, np.where(faint[..., None], tint(rgb), WHITE)
+        )
+
+    def runs(self, dirty):
+        """Group sorted column indices into (first, last + 1) runs to copy."""
+        if len(dirty) == 0:
+            return []
+        breaks = np.flatnonzero(np.diff(dirty) > 1) + 1
+        if len(breaks) >= MAX_RUNS:
+            return [(dirty[0], dirty[-1] + 1)]
+        return [(run[0], run[-1] + 1) for run in np.split(dirty, breaks)]
+
+
+class RasterBars(TkAxes):
+    """Bar chart rendered into a single Tk PhotoImage without matplotlib.
+
+    The array is painted into a NumPy RGB buffer (see ``Raster``) and only
+    the runs of pixel columns that changed are pushed into the PhotoImage as
+    binary PPM data, so a step of a sort over 100k elements costs a few
+    columns of pixels. ``style`` is "bars" for bar heights or "strip" for a
+    value-colored strip.
+    """
+
+    def __init__(
+        self, master, title, xlabel="Index", ylabel="Value", legend=None, style="bars"
+    ):
+        self.canvas = create_canvas(master, 800, 400)
+        self.title = title
+        self.xlabel = xlabel
+        self.ylabel = ylabel
+        self.legend = legend
+        self.style = style
+        self.raster = None
+        self.values = None
+        self.colors = {}
+        self.default_color = BASE_COLOR
+        self.rgb_cache = {}
+        self.touched = 0  # Pixel columns repainted by the last update
+        self.canvas.bind("<Configure>", self._on_resize)
+
+    @property
+    def low(self):
+        return self.raster.low if self.raster else 0
+
+    @property
+    def high(self):
+        return self.raster.high if self.raster else 1
+
+    def reset(self, data):
+        """Allocate a buffer the size of the plot area and draw ``data``."""
+        self.values = as_values(data)
+        self.colors = {}
+        self.default_color = BASE_COLOR
+        self._allocate()
+        self._draw()
+
+    def update(self, data, colors=None, default=None):
+        """Bring the image in line with ``data`` and push the changed columns.
+
+        ``colors`` maps element indices to a highlight color; every other
+        element is drawn with ``default`` (the base bar color when omitted).
+        """
+        values = as_values(data)
+        if self.raster is None or len(values) != len(self.values):
+            self.reset(values)
+        self.values = values
+        self.colors = colors or {}
+        self.default_color = default or BASE_COLOR
+        self._draw()
+
+    def detach(self):
+        """Forget the drawn image; another renderer has taken the canvas."""
+        self.raster = None
+
+    def _allocate(self):
+        x0, y0, x1, y1 = self._plot_area()
+        width, height = max(int(x1 - x0), 1), max(int(y1 - y0), 1)
+        self.raster = Raster(width, height, self.style)
+        self.raster.low = min(0, self.values.min(initial=0))
+        self.raster.high = max(1, self.values.max(initial=1))
+        self.photo = tk.PhotoImage(master=self.canvas, width=width, height=height)
+        self.canvas.delete("all")
+        self.canvas.create_image(x0, y0, image=self.photo, anchor="nw")
+        self._draw_static()
+
+    def _draw(self):
+        if len(self.values) == 0:
+            return
+        scale = (self.raster.low, self.raster.high)
+        colors = {
+            i: self._rgb(color)
+            for i, color in self.colors.items()
+            if 0 <= i < len(self.values) and color != self.default_color
+        }
+        dirty = self.raster.update(self.values, colors, self._rgb(self.default_color))
+        self.touched = len(dirty)
+        for x0, x1 in self.raster.runs(dirty):
+            self.photo.put(ppm(self.raster.pixels[:, x0:x1]), to=(int(x0), 0))
+        if (self.raster.low, self.raster.high) != scale:
+            self._draw_static()  # The value labels changed
+
+    def _rgb(self, color):
+        if color not in self.rgb_cache:
+            channels = self.canvas.winfo_rgb(tk_color(color))
+            self.rgb_cache[color] = np.array(channels) // 257
+        return self.rgb_cache[color].astype(np.uint8)
+
+    def _on_resize(self, event):
+        if self.raster is not None:
+            self._allocate()
+            self._draw()
+
+
+def thumbnail(master, data, width, height, style="bars", color=BASE_COLOR):
+    """Render ``data`` into a new ``width`` x ``height`` PhotoImage.
+
+    A cheap preview of an array state, e.g. for the algorithm cards.
+    """
+    values = as_values(data)
+    raster = Raster(width, height, style)
+    rgb = np.array(master.winfo_rgb(tk_color(color))) // 257
+    raster.update(values, {}, rgb.astype(np.uint8))
+    photo = tk.PhotoImage(master=master, width=width, height=height)
+    photo.put(ppm(raster.pixels), to=(0, 0))
+    return photo
+
+
+RENDERERS = {
+    "bars": RasterBars,
+    "cells": TkCells,
+    "nodes": TkNodes,
+    "tree": TkHeapTree,
+}
@@ -0,0 +1,512 @@
+import tkinter as tk
+
+import numpy as np
+
+from rendering.base import (
+    BASE_COLOR,
+    LEGEND_COLORS,
+    BarRenderer,
+    CellRenderer,
+    TreeRenderer,
+)
+from rendering.lod import EnvelopeRenderer, LevelOfDetail
+
+BACKGROUND = "#ffffff"
+
+# Matplotlib color shorthands used by the screens, translated for Tk
+TK_COLORS = {"C0": "#1f77b4", "r": "red", "g": "green", "b": "blue"}
+
+
+def tk_color(color):
+    """Return the Tk equivalent of a matplotlib color name."""
+    return TK_COLORS.get(color, color)
+
+
+def tk_tint(canvas, color, amount=0.65):
+    """Return ``color`` blended towards white by ``amount`` as a Tk hex color."""
+    red, green, blue = (
+        int(channel / 257 + (255 - channel / 257) * amount)
+        for channel in canvas.winfo_rgb(tk_color(color))
+    )
+    return f"#{red:02x}{green:02x}{blue:02x}"
+
+
+def create_canvas(master, width, height):
+    """Create a white Canvas that fills ``master``."""
+    canvas = tk.Canvas(
+        master, width=width, height=height, bg=BACKGROUND, highlightthickness=0
+    )
+    canvas.pack(fill=tk.BOTH, expand=True)
+    return canvas
+
+
+class TkAxes:
+    """Plot frame, title, axis labels, value range and legend of a Tk chart.
+
+    Subclasses provide ``canvas``, the labels and the ``low``/``high`` value
+    range, and tag everything they draw here as "static".
+    """
+
+    MARGIN = (60, 40, 20, 40)  # Left, top, right, bottom padding in pixels
+
+    def _plot_area(self):
+        left, top, right, bottom = self.MARGIN
+        width = max(self.canvas.winfo_width(), int(self.canvas["width"]))
+        height = max(self.canvas.winfo_height(), int(self.canvas["height"]))
+        return left, top, width - right, height - bottom
+
+    def plot_width(self):
+        """Return the width of the plot area in pixels."""
+        x0, _, x1, _ = self._plot_area()
+        return max(int(x1 - x0), 1)
+
+    def _value_scale(self):
+        """Return the pixel row of the value 0 and the pixels per unit value."""
+        _, y0, _, y1 = self._plot_area()
+        scale = (y1 - y0) / (self.high - self.low)
+        return y1 + self.low * scale, scale
+
+    def set_title(self, title, legend=None):
+        """Change the title (and optionally the legend) shown above the chart."""
+        self.title = title
+        if legend is not None:
+            self.legend = legend
+        self._draw_static()
+
+    def _draw_static(self):
+        self.canvas.delete("static")
+        x0, y0, x1, y1 = self._plot_area()
+        self.canvas.create_rectangle(x0, y0, x1, y1, outline="black", tags="static")
+        self.canvas.create_text(
+            (x0 + x1) / 2, y0 / 2, text=self.title, font=("Helvetica", 12), tags="static"
+        )
+        self.canvas.create_text(
+            (x0 + x1) / 2, y1 + 20, text=self.xlabel, tags="static"
+        )
+        self.canvas.create_text(
+            x0 / 3, (y0 + y1) / 2, text=self.ylabel, angle=90, tags="static"
+        )
+        self.canvas.create_text(x0 - 5, y1, text=str(self.low), anchor="e", tags="static")
+        self.canvas.create_text(
+            x0 - 5, y0, text=str(self.high), anchor="e", tags="static"
+        )
+
+        for row, label in enumerate(self.legend or []):
+            color = tk_color(LEGEND_COLORS[row % len(LEGEND_COLORS)])
+            y = y0 + 12 + row * 18
+            self.canvas.create_rectangle(
+                x1 - 110, y - 5, x1 - 100, y + 5, fill=color, width=0, tags="static"
+            )
+            self.canvas.create_text(x1 - 95, y, text=label, anchor="w", tags="static")
+
+
+class TkBars(TkAxes, BarRenderer):
+    """Bar chart drawn as native Canvas rectangles.
+
+    Bars are created once per run and moved with ``coords()`` and recolored
+    with ``itemconfig()``, so no rasterization happens outside of Tk itself.
+    """
+
+    def __init__(self, canvas, title, xlabel="Index", ylabel="Value", legend=None):
+        super().__init__(title, xlabel, ylabel, legend)
+        self.canvas = canvas
+        self.canvas.bind("<Configure>", self._on_resize, add="+")
+
+    def _create_bars(self):
+        self.canvas.delete("all")
+        fill = tk_color(BASE_COLOR)
+        self.bars = [
+            self.canvas.create_rectangle(0, 0, 0, 0, fill=fill, width=0)
+            for _ in self.heights
+        ]
+        self._layout()
+
+    def _set_height(self, i, height):
+        self.canvas.coords(self.bars[i], *self._bar_box(i, height))
+
+    def _set_color(self, i, color):
+        self.canvas.itemconfig(self.bars[i], fill=tk_color(color))
+
+    def _rescale(self):
+        self._layout()
+
+    def _render(self, dirty):
+        # Tk repaints changed items on its next idle cycle
+        pass
+
+    def _on_resize(self, event):
+        if self.bars is not None:
+            self._layout()
+
+    def _layout(self):
+        """Position every bar and redraw the title, axes and legend."""
+        for i, height in enumerate(self.heights):
+            self.canvas.coords(self.bars[i], *self._bar_box(i, height))
+        self._draw_static()
+
+    def _bar_box(self, i, height):
+        x0, _, x1, _ = self._plot_area()
+        slot = (x1 - x0) / max(len(self.heights), 1)
+        base, scale = self._value_scale()
+        left = x0 + slot * (i + 0.1)
+        return left, base, left + slot * 0.8, base - height * scale
+
+
+class TkEnvelope(TkAxes, EnvelopeRenderer):
+    """Per-pixel column envelopes drawn as one-pixel Canvas lines.
+
+    Each column owns a faint line from 0 to the bucket minimum and a solid
+    line from the minimum to the maximum; a step only moves the lines of the
+    columns whose envelope changed. Bucket means are joined by one polyline
+    and highlights are short-lived overlay lines.
+    """
+
+    def __init__(self, canvas, title, xlabel="Index", ylabel="Value", legend=None):
+        super().__init__(title, xlabel, ylabel, legend)
+        self.canvas = canvas
+        self.lines = []  # (base, band) line pairs, one per column
+        self.drawn = None  # Envelopes the lines currently show
+        self.canvas.bind("<Configure>", self._on_resize, add="+")
+
+    def _columns(self):
+        return self.plot_width()
+
+    def _create_columns(self):
+        self.canvas.delete("all")
+        self.lines = [
+            (
+                self.canvas.create_line(0, 0, 0, 0, width=1),
+                self.canvas.create_line(0, 0, 0, 0, width=1, capstyle=tk.PROJECTING),
+            )
+            for _ in range(len(self.edges) - 1)
+        ]
+        self.mean_line = self.canvas.create_line(0, 0, 0, 0, fill="black")
+        self.line_colors = None
+        self.drawn = None
+        self._draw_static()
+
+    def _draw_columns(self, low, high, mean):
+        x0, _, _, _ = self._plot_area()
+        base, scale = self._value_scale()
+        x = x0 + np.arange(len(low)) + 0.5
+        zero, y_low, y_high = base, base - low * scale, base - high * scale
+
+        if self.drawn is None:
+            changed = range(len(low))
+        else:
+            changed = np.flatnonzero(
+                (low != self.drawn[0]) | (high != self.drawn[1])
+            ).tolist()
+        for c in changed:
+            base_line, band_line = self.lines[c]
+            self.canvas.coords(base_line, x[c], zero, x[c], y_low[c])
+            self.canvas.coords(band_line, x[c], y_low[c], x[c], y_high[c])
+        self.drawn = (low, high)
+
+        color = self.default_color
+        colors = (tk_tint(self.canvas, color), tk_color(color))
+        if colors != self.line_colors:
+            self.line_colors = colors
+            for base_line, band_line in self.lines:
+                self.canvas.itemconfig(base_line, fill=colors[0])
+                self.canvas.itemconfig(band_line, fill=colors[1])
+
+        self.canvas.coords(
+            self.mean_line, *np.column_stack([x, base - mean * scale]).ravel()
+        )
+        self.canvas.tag_raise(self.mean_line)
+
+        self.canvas.delete("overlay")
+        for c, color in self.overlay.items():
+            self.canvas.create_line(
+                x[c], zero, x[c], y_high[c], fill=tk_color(color), width=3,
+                tags="overlay",
+            )
+
+    def _rescale(self):
+        self.drawn = None
+        self._draw_static()
+
+    def _render(self):
+        # Tk repaints changed items on its next idle cycle
+        pass
+
+    def _on_resize(self, event):
+        if self.edges is not None:
+            self.drawn = None
+            self._draw_columns(*self.envelopes)
+            self._draw_static()
+
+
+class TkBarChart(LevelOfDetail):
+    """Tk bar chart; arrays wider than the plot are drawn as column envelopes."""
+
+    def __init__(self, master, title, xlabel="Index", ylabel="Value", legend=None):
+        canvas = create_canvas(master, 800, 400)
+        exact = TkBars(canvas, title, xlabel, ylabel, legend)
+        aggregated = TkEnvelope(canvas, title, xlabel, ylabel, legend)
+        super().__init__(exact, aggregated, columns=exact.plot_width)
+
+
+class TkCells(CellRenderer):
+    """Stack or queue cells drawn as Canvas rectangles with text labels.
+
+    Cell items are created once per item and never rebuilt; moving the view
+    window shifts every cell with a single ``move()`` on their shared tag.
+    """
+
+    def __init__(self, master, title, orientation="vertical", empty_text="", ends=None):
+        super().__init__(title, orientation, empty_text, ends)
+        self.canvas = create_canvas(master, 400, 400)
+        self.offset = 0  # Window start the cell items are currently laid out for
+        self.canvas.bind("<Configure>", lambda event: self._layout())
+        self._draw_static()
+
+    def _size(self):
+        width = max(self.canvas.winfo_width(), int(self.canvas["width"]))
+        height = max(self.canvas.winfo_height(), int(self.canvas["height"]))
+        return width, height
+
+    def _step(self):
+        width, height = self._size()
+        if self.orientation == "vertical":
+            return (height - 40) / self.CAPACITY
+        return (width - 20) / self.CAPACITY
+
+    def _cell_box(self, slot):
+        width, height = self._size()
+        step = self._step()
+        k = slot - self.offset  # Position inside the view window
+        if self.orientation == "vertical":
+            # Cells stack upwards from the bottom of the canvas
+            y1 = height - 10 - k * step
+            return width * 0.2, y1 - step * 0.8, width * 0.8, y1
+        x0 = 10 + k * step
+        return x0, height * 0.3, x0 + step, height * 0.7
+
+    def _add_cell(self, slot, item, visible):
+        x0, y0, x1, y1 = self._cell_box(slot)
+        state = "normal" if visible else "hidden"
+        rect = self.canvas.create_rectangle(
+            x0,
+            y0,
+            x1,
+            y1,
+            fill=tk_color(self.FILL),
+            outline="black",
+            width=2,
+            state=state,
+            tags="cell",
+        )
+        text = self.canvas.create_text(
+            (x0 + x1) / 2,
+            (y0 + y1) / 2,
+            text=str(item),
+            font=("Helvetica", 12, "bold"),
+            state=state,
+            tags="cell",
+        )
+        return slot, rect, text
+
+    def _remove_cell(self, cell):
+        self.canvas.delete(cell[1], cell[2])
+
+    def _set_color(self, cell, color):
+        self.canvas.itemconfig(cell[1], fill=tk_color(color))
+
+    def _set_visible(self, cell, visible):
+        state = "normal" if visible else "hidden"
+        self.canvas.itemconfig(cell[1], state=state)
+        self.canvas.itemconfig(cell[2], state=state)
+
+    def _set_window(self, start):
+        distance = (start - self.offset) * self._step()
+        self.offset = start
+        if self.orientation == "vertical":
+            self.canvas.move("cell", 0, distance)
+        else:
+            self.canvas.move("cell", -distance, 0)
+
+    def _set_ends(self):
+        self.canvas.delete("end")
+        if not self.items:
+            return
+        slots = (self.first, self.rear_slot())
+        for slot, label in zip(slots, self.ends):
+            x0, _, x1, y1 = self._cell_box(slot)
+            self.canvas.create_text((x0 + x1) / 2, y1 + 15, text=label, tags="end")
+
+    def _render(self):
+        state = "hidden" if self.items else "normal"
+        self.canvas.itemconfig(self.empty_label, state=state)
+
+    def _layout(self):
+        """Place every cell for the current canvas size (after a resize)."""
+        for slot, rect, text in self.cells:
+            x0, y0, x1, y1 = self._cell_box(slot)
+            self.canvas.coords(rect, x0, y0, x1, y1)
+            self.canvas.coords(text, (x0 + x1) / 2, (y0 + y1) / 2)
+        if self.ends:
+            self._set_ends()
+        self._draw_static()
+
+    def _draw_static(self):
+        width, height = self._size()
+        self.canvas.delete("static")
+        self.canvas.create_text(
+            width / 2, 15, text=self.title, font=("Helvetica", 12), tags="static"
+        )
+        self.empty_label = self.canvas.create_text(
+            width / 2, height / 2, text=self.empty_text, tags="static"
+        )
+        self._render()
+
+
+class TkNodes:
+    """Linked-list nodes drawn as Canvas ovals joined by arrow lines."""
+
+    def __init__(self, master, title, arrow="->"):
+        self.canvas = create_canvas(master, 800, 400)
+        self.title = title
+        self.arrow = tk.BOTH if arrow == "<->" else tk.LAST
+        self.nodes = []  # (oval, text) item pairs
+        self.edges = []
+        self.values = []
+        self.highlight = set()
+        self.canvas.bind("<Configure>", lambda event: self._layout())
+
+    def update(self, values, highlight=None):
+        """Draw ``values`` as a chain of nodes, haloing the ``highlight`` indices."""
+        self.values = list(values)
+        self.highlight = set(highlight or [])
+
+        while len(self.nodes) < len(self.values):
+            oval = self.canvas.create_oval(0, 0, 0, 0, fill="lightblue", width=0)
+            text = self.canvas.create_text(0, 0, font=("Helvetica", 10, "bold"))
+            self.nodes.append((oval, text))
+        while len(self.nodes) > len(self.values):
+            for item in self.nodes.pop():
+                self.canvas.delete(item)
+        while len(self.edges) < len(self.values) - 1:
+            line = self.canvas.create_line(0, 0, 0, 0, fill="gray", arrow=self.arrow)
+            self.edges.append(line)
+        while len(self.edges) > max(len(self.values) - 1, 0):
+            self.canvas.delete(self.edges.pop())
+
+        for i, (oval, text) in enumerate(self.nodes):
+            halo = i in self.highlight
+            self.canvas.itemconfig(
+                oval, outline="yellow" if halo else "", width=4 if halo else 0
+            )
+            self.canvas.itemconfig(text, text=str(self.values[i]))
+        self._layout()
+
+    def _layout(self):
+        width = max(self.canvas.winfo_width(), int(self.canvas["width"]))
+        height = max(self.canvas.winfo_height(), int(self.canvas["height"]))
+        n = len(self.nodes)
+        step = width / max(n, 1)
+        radius = min(step * 0.3, 20)
+        y = height / 2
+
+        self.canvas.delete("static")
+        self.canvas.create_text(
+            width / 2, 15, text=self.title, font=("Helvetica", 12), tags="static"
+        )
+
+        for i, (oval, text) in enumerate(self.nodes):
+            x = step * (i + 0.5)
+            self.canvas.coords(oval, x - radius, y - radius, x + radius, y + radius)
+            self.canvas.coords(text, x, y)
+        for i, line in enumerate(self.edges):
+            x = step * (i + 0.5)
+            self.canvas.coords(line, x + radius, y, x + step - radius, y)
+
+
+class TkHeapTree(TreeRenderer):
+    """Binary heap drawn as Canvas ovals and labels joined by lines.
+
+    The items are created once per length; a resize only moves them with
+    ``coords()``, and an update only reconfigures the nodes that changed.
+    """
+
+    TOP = 30  # Pixels above the root, for the title
+    RADIUS = 18  # Largest node radius in pixels
+    MIN_LABEL = 7  # Nodes with a smaller radius are drawn unlabelled
+
+    def __init__(self, master, title):
+        super().__init__(title)
+        self.canvas = create_canvas(master, 400, 400)
+        self.nodes = []  # (oval, text) item pairs
+        self.edges = []
+        self.x = self.y = np.zeros(0)
+        self.canvas.bind("<Configure>", lambda event: self._layout(), add="+")
+
+    def set_title(self, title, legend=None):
+        self.title = title
+        self._layout()
+
+    def _create_nodes(self, x, y):
+        self.canvas.delete("all")
+        self.x, self.y = x, y
+        self.edges = [
+            self.canvas.create_line(0, 0, 0, 0, fill="gray") for _ in range(len(x) - 1)
+        ]
+        self.nodes = [
+            (
+                self.canvas.create_oval(0, 0, 0, 0, width=0),
+                self.canvas.create_text(0, 0, fill="white"),
+            )
+            for _ in range(len(x))
+        ]
+        self._layout()
+
+    def _layout(self):
+        width = max(self.canvas.winfo_width(), int(self.canvas["width"]))
+        height = max(self.canvas.winfo_height(), int(self.canvas["height"]))
+        self.canvas.delete("static")
+        self.canvas.create_text(
+            width / 2,
+            self.TOP / 2,
+            text=self.title,
+            font=("Helvetica", 12),
+            tags="static",
+        )
+        n = len(self.nodes)
+        if n == 0:
+            return
+
+        # The bottom level has the least room per node
+        levels = n.bit_length()
+        span = height - self.TOP
+        radius = min(self.RADIUS, 0.4 * width / 2 ** (levels - 1), 0.3 * span / levels)
+        font = ("Helvetica", max(int(radius * 0.6), 1), "bold")
+        label_state = "normal" if radius >= self.MIN_LABEL else "hidden"
+        x = self.x * width
+        y = self.TOP + self.y * span
+        for i, line in enumerate(self.edges, 1):
+            parent = (i - 1) // 2
+            self.canvas.coords(line, x[i], y[i], x[parent], y[parent])
+        for i, (oval, text) in enumerate(self.nodes):
+            self.canvas.coords(
+                oval, x[i] - radius, y[i] - radius, x[i] + radius, y[i] + radius
+            )
+            self.canvas.coords(text, x[i], y[i])
+            self.canvas.itemconfig(text, font=font, state=label_state)
+
+    def _set_label(self, i, label):
+        self.canvas.itemconfig(self.nodes[i][1], text=label)
+
+    def _set_color(self, i, color):
+        self.canvas.itemconfig(self.nodes[i][0], fill=tk_color(color))
+
+    def _render(self):
+        pass  # Canvas items redraw themselves
+
+
+RENDERERS = {
+    "bars": TkBarChart,
+    "cells": TkCells,
+    "nodes": TkNodes,
+    "tree": TkHeapTree,
+}
@@ -1,19 +1,17 @@
 import tkinter as tk
-from tkinter import ttk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import time
-import threading
+from rendering.backends import create_renderer, release_renderers
+from playback.scheduler import Scheduler, cancel_schedulers
+from codecrux.algorithms.arrays import insert_at
+from codecrux.algorithms.hooks import EventLog
+from components.speedControl import SpeedControl
 
 class InsertionAtASpecificPositionVisualization:
-    def __init__(self, root, prev_page):
+    def __init__(self, root, prev_page, backend=None):
         self.root = root
         self.prev_page = prev_page
-        self.is_paused = False
-        self.speed = 0.5
-        self.operation_thread = None
-        self.step_mode = False
-        self.step_event = threading.Event()
+        self.backend = backend
+        self.renderer = None
+        self.scheduler = None
         self.create_algorithm_page()
 
     def create_algorithm_page(self):
@@ -82,10 +80,8 @@ class InsertionAtASpecificPositionVisualization:
         # Speed control slider
         button_frame = tk.Frame(self.frame, bg="#1e1e1e")
         button_frame.pack(fill="x", padx=20, pady=10)
-        speed_label = tk.Label(button_frame, text="Speed:", fg="#ffffff", bg="#1e1e1e")
-        speed_label.pack(side="left")
-        self.speed_slider = ttk.Scale(button_frame, from_=0.1, to=2.0, orient="horizontal", length=200, value=0.5, command=self.update_speed)
-        self.speed_slider.pack(side="left", padx=(10, 0))
+        self.speed_control = SpeedControl(button_frame)
+        self.speed_control.pack(side="left")
 
         # Start button
         self.start_button = tk.Button(
@@ -170,81 +166,69 @@ class InsertionAtASpecificPositionVisualization:
             tk.messagebox.showerror("Error", str(e))
             return
 
-        # Clear previous visualization
-        for widget in self.viz_frame.winfo_children():
-            widget.destroy()
-
-        # Create matplotlib figure and axis
-        self.fig, self.ax = plt.subplots(figsize=(8, 4))
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.viz_frame)
-        self.canvas_widget = self.canvas.get_tk_widget()
-        self.canvas_widget.pack(fill=tk.BOTH, expand=True)
+        # Create the bar chart renderer on the first run and reuse it
+        if self.renderer is None:
+            self.renderer = create_renderer(
+                "bars",
+                self.viz_frame,
+                self.backend,
+                title='Insert Into Array Visualization',
+            )
+        self.renderer.reset(self.numbers)
 
         # Disable start button and enable pause button
         self.start_button.config(state="disabled")
         self.pause_button.config(state="normal")
 
-        # Start operation in a separate thread
-        self.operation_thread = threading.Thread(target=self.insertion_at_a_specific_position)
-        self.operation_thread.start()
+        # Stop what is left of the previous run
+        if self.scheduler is not None:
+            self.scheduler.cancel()
+
+        # Run the operation from the Tk thread, one step per tick
+        self.scheduler = Scheduler(
+            self.viz_frame,
+            self.insertion_at_a_specific_position(),
+            self.update_gui,
+            coalesce=("frame",),
+            on_finish=self.finish,
+        )
+        self.speed_control.attach(self.scheduler)
+        self.scheduler.play()
 
     def insertion_at_a_specific_position(self):
-        self.visualize(highlight=self.insert_position)
-        time.sleep(self.speed)
+        yield self.visualize(highlight=self.insert_position)
 
-        # Shift elements to make space for the new element
-        self.numbers.append(None)  # Add a placeholder at the end
-        for i in range(len(self.numbers) - 1, self.insert_position, -1):
-            if self.is_paused:
-                self.pause_event.wait()
-            if self.step_mode:
-                self.step_event.wait()
-                self.step_event.clear()
+        # Shift elements to make space for the new element, then insert it
+        log = EventLog()
+        values = self.numbers + [None]  # The array as each write leaves it
+        insert_at(self.numbers, self.insert_position, self.insert_value, log)
+        for _, i, value, _ in log.events:
+            values[i] = value
+            yield self.visualize(highlight=i, values=values)
 
-            self.numbers[i] = self.numbers[i - 1]
-            self.visualize(highlight=i)
-            time.sleep(self.speed)
+        yield self.visualize()  # Final state
 
-        # Insert the new element
-        self.numbers[self.insert_position] = self.insert_value
-        self.visualize(highlight=self.insert_position)
-        time.sleep(self.speed)
+    def visualize(self, highlight=None, values=None):
+        colors = {}
+        if highlight is not None:
+            colors[highlight] = 'r'
+        return "frame", (list(self.numbers if values is None else values), colors)
 
-        self.visualize()  # Final state
+    def update_gui(self, action, data):
+        """Apply an event yielded by the operation (runs on the Tk thread)."""
+        if action == "frame":
+            self.renderer.update(*data)
 
+    def finish(self):
         # Re-enable start button and disable pause button
         self.start_button.config(state="normal")
         self.pause_button.config(state="disabled")
 
-    def visualize(self, highlight=None):
-        self.ax.clear()
-        bars = self.ax.bar(range(len(self.numbers)), self.numbers)
-        
-        if highlight is not None:
-            bars[highlight].set_color('r')
-        
-        self.ax.set_xlabel('Index')
-        self.ax.set_ylabel('Value')
-        self.ax.set_title('Insert Into Array Visualization')
-        self.canvas.draw()
-        self.viz_frame.update()
-
     def toggle_pause(self):
-        if not hasattr(self, 'pause_event'):
-            self.pause_event = threading.Event()
-            self.pause_event.set()
-
-        if self.is_paused:
-            self.pause_event.set()
-            self.pause_button.config(text="Pause")
-            self.is_paused = False
-        else:
-            self.pause_event.clear()
-            self.pause_button.config(text="Resume")
-            self.is_paused = True
-
-    def update_speed(self, value):
-        self.speed = float(value)
+        if self.scheduler is None:
+            return
+        paused = self.scheduler.toggle()
+        self.pause_button.config(text="Resume" if paused else "Pause")
 
     def show_documentation(self):
         doc_window = tk.Toplevel(self.root)
@@ -315,15 +299,20 @@ class InsertionAtASpecificPositionVisualization:
         """Navigate back to the previous page."""
         from algorithmPage import AlgorithmPage  # Adjust import as necessary
 
+        # Stop the running visualization and free the figures of this page
+        # before its widgets go away
+        cancel_schedulers(self.root)
+        release_renderers(self.root)
+
         # Clear current widgets in the root window
         for widget in self.root.winfo_children():
             widget.destroy()
 
         AlgorithmPage(self.root, self.prev_page)  # Load the previous page
 
-def create_algorithm_page(root, prev_page):
+def create_algorithm_page(root, prev_page, backend=None):
     """Wrapper function to create the Insert Into Array visualization page."""
-    InsertionAtASpecificPositionVisualization(root, prev_page)
+    InsertionAtASpecificPositionVisualization(root, prev_page, backend)
 
 # If you want to run this file standalone for testing
 if __name__ == "__main__":
@@ -1,123 +1,19 @@
 import tkinter as tk
 from tkinter import ttk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import time
-import threading
-
-
-class Node:
-    def __init__(self, data):
-        self.data = data
-        self.prev = None
-        self.next = None
-
-
-class DoublyLinkedList:
-    def __init__(self):
-        self.head = None
-        self.tail = None
-
-    def insert_at_beginning(self, data):
-        new_node = Node(data)
-        if not self.head:
-            self.head = self.tail = new_node
-        else:
-            new_node.next = self.head
-            self.head.prev = new_node
-            self.head = new_node
-
-    def insert_at_end(self, data):
-        new_node = Node(data)
-        if not self.head:
-            self.head = self.tail = new_node
-        else:
-            new_node.prev = self.tail
-            self.tail.next = new_node
-            self.tail = new_node
-
-    def insert_at_position(self, data, position):
-        if position == 0:
-            self.insert_at_beginning(data)
-            return
-        new_node = Node(data)
-        current = self.head
-        for _ in range(position - 1):
-            if current is None:
-                raise IndexError("Position out of range")
-            current = current.next
-        if current.next:
-            new_node.next = current.next
-            new_node.prev = current
-            current.next.prev = new_node
-            current.next = new_node
-        else:
-            self.insert_at_end(data)
-
-    def delete_at_beginning(self):
-        if not self.head:
-            return
-        if self.head == self.tail:
-            self.head = self.tail = None
-        else:
-            self.head = self.head.next
-            self.head.prev = None
-
-    def delete_at_end(self):
-        if not self.head:
-            return
-        if self.head == self.tail:
-            self.head = self.tail = None
-        else:
-            self.tail = self.tail.prev
-            self.tail.next = None
-
-    def delete_at_position(self, position):
-        if not self.head:
-            return
-        if position == 0:
-            self.delete_at_beginning()
-            return
-        current = self.head
-        for _ in range(position):
-            if current is None:
-                raise IndexError("Position out of range")
-            current = current.next
-        if current == self.tail:
-            self.delete_at_end()
-        else:
-            current.prev.next = current.next
-            current.next.prev = current.prev
-
-    def traverse(self):
-        elements = []
-        current = self.head
-        while current:
-            elements.append(current.data)
-            current = current.next
-        return elements
-
-    def search(self, data):
-        current = self.head
-        position = 0
-        while current:
-            if current.data == data:
-                return position
-            current = current.next
-            position += 1
-        return -1
+from rendering.backends import create_renderer, release_renderers
+from playback.scheduler import Scheduler, cancel_schedulers
+from codecrux.algorithms.structures import DoublyLinkedList
+from components.speedControl import SpeedControl
 
 
 class DoublyLinkedListVisualization:
-    def __init__(self, root, prev_page):
+    def __init__(self, root, prev_page, backend=None):
         self.root = root
         self.prev_page = prev_page
+        self.backend = backend
+        self.renderer = None
         self.linked_list = DoublyLinkedList()
-        self.is_paused = False
-        self.speed = 0.5
-        self.operation_thread = None
-        self.step_mode = False
-        self.step_event = threading.Event()
+        self.scheduler = None
         self.create_algorithm_page()
 
     def create_algorithm_page(self):
@@ -198,18 +94,8 @@ class DoublyLinkedListVisualization:
         # Speed control slider
         button_frame = tk.Frame(self.frame, bg="#1e1e1e")
         button_frame.pack(fill="x", padx=20, pady=10)
-        speed_label = tk.Label(button_frame, text="Speed:", fg="#ffffff", bg="#1e1e1e")
-        speed_label.pack(side="left")
-        self.speed_slider = ttk.Scale(
-            button_frame,
-            from_=0.1,
-            to=2.0,
-            orient="horizontal",
-            length=200,
-            value=0.5,
-            command=self.update_speed,
-        )
-        self.speed_slider.pack(side="left", padx=(10, 0))
+        self.speed_control = SpeedControl(button_frame)
+        self.speed_control.pack(side="left")
 
         # Start button
         self.start_button = tk.Button(
@@ -327,25 +213,34 @@ class DoublyLinkedListVisualization:
             tk.messagebox.showerror("Error", "Please enter valid integer values.")
             return
 
-        # Clear previous visualization
-        for widget in self.viz_frame.winfo_children():
-            widget.destroy()
-
-        # Create matplotlib figure and axis
-        self.fig, self.ax = plt.subplots(figsize=(8, 4))
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.viz_frame)
-        self.canvas_widget = self.canvas.get_tk_widget()
-        self.canvas_widget.pack(fill=tk.BOTH, expand=True)
+        # Create the linked list renderer on the first run and reuse it
+        if self.renderer is None:
+            self.renderer = create_renderer(
+                "nodes",
+                self.viz_frame,
+                self.backend,
+                title="Doubly Linked List Visualization",
+                arrow="<->",
+            )
 
         # Disable start button and enable pause button
         self.start_button.config(state="disabled")
         self.pause_button.config(state="normal")
 
-        # Start operation in a separate thread
-        self.operation_thread = threading.Thread(
-            target=self.perform_operation, args=(operation,)
+        # Stop what is left of the previous run
+        if self.scheduler is not None:
+            self.scheduler.cancel()
+
+        # Run the operation from the Tk thread, one step per tick
+        self.scheduler = Scheduler(
+            self.viz_frame,
+            self.perform_operation(operation),
+            self.update_gui,
+            coalesce=("frame",),
+            on_finish=self.finish,
         )
-        self.operation_thread.start()
+        self.speed_control.attach(self.scheduler)
+        self.scheduler.play()
 
     def perform_operation(self, operation):
         if operation == "Insert at Beginning":
@@ -367,82 +262,39 @@ class DoublyLinkedListVisualization:
             self.linked_list.delete_at_position(position)
         elif operation == "Traverse":
             elements = self.linked_list.traverse()
-            self.visualize(elements, highlight=list(range(len(elements))))
+            yield self.visualize(elements, highlight=list(range(len(elements))))
         elif operation == "Search":
             value = int(self.value_entry.get())
             position = self.linked_list.search(value)
             elements = self.linked_list.traverse()
             if position != -1:
-                self.visualize(elements, highlight=[position])
+                yield self.visualize(elements, highlight=[position])
             else:
-                self.visualize(elements)
-                tk.messagebox.showinfo(
-                    "Search Result", f"Value {value} not found in the list."
-                )
-
-        self.visualize(self.linked_list.traverse())
+                yield self.visualize(elements)
+                yield "message", f"Value {value} not found in the list."
 
-        # Re-enable start button and disable pause button
-        self.start_button.config(state="normal")
-        self.pause_button.config(state="disabled")
+        yield self.visualize(self.linked_list.traverse())
 
     def visualize(self, elements, highlight=None):
-        self.ax.clear()
-        x = list(range(len(elements)))
-        y = [0] * len(elements)
-
-        # Plot nodes
-        self.ax.scatter(x, y, s=500, c="lightblue", zorder=2)
-
-        # Plot arrows
-        for i in range(len(elements) - 1):
-            self.ax.annotate(
-                "",
-                xy=(i + 1, 0),
-                xytext=(i, 0),
-                arrowprops=dict(arrowstyle="<->", color="gray"),
-            )
-
-        # Add node values
-        for i, val in enumerate(elements):
-            self.ax.text(i, 0, str(val), ha="center", va="center", fontweight="bold")
-
-        # Highlight specific nodes if needed
-        if highlight:
-            self.ax.scatter(
-                [x[i] for i in highlight],
-                [y[i] for i in highlight],
-                s=600,
-                c="yellow",
-                zorder=1,
-            )
+        return "frame", (list(elements), highlight)
 
-        self.ax.set_xlim(-0.5, len(elements) - 0.5)
-        self.ax.set_ylim(-0.5, 0.5)
-        self.ax.axis("off")
-        self.ax.set_title("Doubly Linked List Visualization")
-        self.canvas.draw()
-        self.viz_frame.update()
+    def update_gui(self, action, data):
+        """Apply an event yielded by the operation (runs on the Tk thread)."""
+        if action == "frame":
+            self.renderer.update(*data)
+        elif action == "message":
+            tk.messagebox.showinfo("Search Result", data)
 
-        if not self.step_mode:
-            time.sleep(self.speed)
+    def finish(self):
+        # Re-enable start button and disable pause button
+        self.start_button.config(state="normal")
+        self.pause_button.config(state="disabled")
 
     def toggle_pause(self):
-        if not hasattr(self, "pause_event"):
-            self.pause_event = threading.Event()
-            self.pause_event.set()
-
-        if self.is_paused:
-            self.pause_event.set()
-            self.pause_button.config(text="Pause")
-            self.is_paused = False
-        else:
-            self.pause_event.clear()
-            self.pause_button.config(text="Resume")
-            self.is_paused = True
-
-    def update_speed(self, value):
-        self.speed = float(value)
+        if self.scheduler is None:
+            return
+        paused = self.scheduler.toggle()
+        self.pause_button.config(text="Resume" if paused else "Pause")
 
     def show_documentation(self):
         doc_window = tk.Toplevel(self.root)
@@ -524,6 +376,11 @@ class DoublyLinkedListVisualization:
         """Navigate back to the previous page."""
         from algorithmPage import AlgorithmPage  # Adjust import as necessary
 
+        # Stop the running visualization and free the figures of this page
+        # before its widgets go away
+        cancel_schedulers(self.root)
+        release_renderers(self.root)
+
         # Clear current widgets in the root window
         for widget in self.root.winfo_children():
             widget.destroy()
@@ -531,9 +388,9 @@ class DoublyLinkedListVisualization:
         AlgorithmPage(self.root, self.prev_page)  # Load the previous page
 
 
-def create_algorithm_page(root, prev_page):
+def create_algorithm_page(root, prev_page, backend=None):
     """Wrapper function to create the Doubly Linked List visualization page."""
-    DoublyLinkedListVisualization(root, prev_page)
+    DoublyLinkedListVisualization(root, prev_page, backend)
 
 
 # If you want to run this file standalone for testing
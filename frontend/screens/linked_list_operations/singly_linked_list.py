@@ -1,107 +1,19 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import time
-import threading
-
-
-class Node:
-    def __init__(self, data):
-        self.data = data
-        self.next = None
-
-
-class SinglyLinkedList:
-    def __init__(self):
-        self.head = None
-
-    def insert_at_beginning(self, data):
-        new_node = Node(data)
-        new_node.next = self.head
-        self.head = new_node
-
-    def insert_at_end(self, data):
-        new_node = Node(data)
-        if not self.head:
-            self.head = new_node
-            return
-        current = self.head
-        while current.next:
-            current = current.next
-        current.next = new_node
-
-    def insert_at_position(self, data, position):
-        if position == 0:
-            self.insert_at_beginning(data)
-            return
-        new_node = Node(data)
-        current = self.head
-        for _ in range(position - 1):
-            if current is None:
-                raise IndexError("Position out of range")
-            current = current.next
-        new_node.next = current.next
-        current.next = new_node
-
-    def delete_at_beginning(self):
-        if not self.head:
-            return
-        self.head = self.head.next
-
-    def delete_at_end(self):
-        if not self.head:
-            return
-        if not self.head.next:
-            self.head = None
-            return
-        current = self.head
-        while current.next.next:
-            current = current.next
-        current.next = None
-
-    def delete_at_position(self, position):
-        if not self.head:
-            return
-        if position == 0:
-            self.head = self.head.next
-            return
-        current = self.head
-        for _ in range(position - 1):
-            if current is None or current.next is None:
-                raise IndexError("Position out of range")
-            current = current.next
-        current.next = current.next.next
-
-    def traverse(self):
-        elements = []
-        current = self.head
-        while current:
-            elements.append(current.data)
-            current = current.next
-        return elements
-
-    def search(self, data):
-        current = self.head
-        position = 0
-        while current:
-            if current.data == data:
-                return position
-            current = current.next
-            position += 1
-        return -1
+from rendering.backends import create_renderer, release_renderers
+from playback.scheduler import Scheduler, cancel_schedulers
+from codecrux.algorithms.structures import SinglyLinkedList
+from components.speedControl import SpeedControl
 
 
 class SinglyLinkedListVisualization:
-    def __init__(self, root, prev_page):
+    def __init__(self, root, prev_page, backend=None):
         self.root = root
         self.prev_page = prev_page
+        self.backend = backend
+        self.renderer = None
         self.linked_list = SinglyLinkedList()
-        self.is_paused = False
-        self.speed = 0.5
-        self.operation_thread = None
-        self.step_mode = False
-        self.step_event = threading.Event()
+        self.scheduler = None
         self.create_algorithm_page()
 
     def create_algorithm_page(self):
@@ -183,18 +95,8 @@ class SinglyLinkedListVisualization:
         button_frame.pack(fill="x", padx=20, pady=5)
 
         # Speed control slider
-        speed_label = tk.Label(button_frame, text="Speed:", fg="#ffffff", bg="#1e1e1e")
-        speed_label.pack(side="left")
-        self.speed_slider = ttk.Scale(
-            button_frame,
-            from_=0.1,
-            to=2.0,
-            orient="horizontal",
-            length=200,
-            value=0.5,
-            command=self.update_speed,
-        )
-        self.speed_slider.pack(side="left", padx=(10, 0))
+        self.speed_control = SpeedControl(button_frame)
+        self.speed_control.pack(side="left")
 
         # Start button
         self.start_button = tk.Button(
@@ -312,25 +214,34 @@ class SinglyLinkedListVisualization:
             messagebox.showerror("Error", "Please enter valid integer values.")
             return
 
-        # Clear previous visualization
-        for widget in self.viz_frame.winfo_children():
-            widget.destroy()
-
-        # Create matplotlib figure and axis
-        self.fig, self.ax = plt.subplots(figsize=(8, 4))
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.viz_frame)
-        self.canvas_widget = self.canvas.get_tk_widget()
-        self.canvas_widget.pack(fill=tk.BOTH, expand=True)
+        # Create the linked list renderer on the first run and reuse it
+        if self.renderer is None:
+            self.renderer = create_renderer(
+                "nodes",
+                self.viz_frame,
+                self.backend,
+                title="Singly Linked List Visualization",
+                arrow="->",
+            )
 
         # Disable start button and enable pause button
         self.start_button.config(state="disabled")
         self.pause_button.config(state="normal")
 
-        # Start operation in a separate thread
-        self.operation_thread = threading.Thread(
-            target=self.perform_operation, args=(operation,)
+        # Stop what is left of the previous run
+        if self.scheduler is not None:
+            self.scheduler.cancel()
+
+        # Run the operation from the Tk thread, one step per tick
+        self.scheduler = Scheduler(
+            self.viz_frame,
+            self.perform_operation(operation),
+            self.update_gui,
+            coalesce=("frame",),
+            on_finish=self.finish,
         )
-        self.operation_thread.start()
+        self.speed_control.attach(self.scheduler)
+        self.scheduler.play()
 
     def perform_operation(self, operation):
         if operation == "Insert at Beginning":
@@ -352,83 +263,40 @@ class SinglyLinkedListVisualization:
             self.linked_list.delete_at_position(position)
         elif operation == "Traverse":
             elements = self.linked_list.traverse()
-            self.visualize(elements, highlight=list(range(len(elements))))
+            yield self.visualize(elements, highlight=list(range(len(elements))))
         elif operation == "Search":
             value = int(self.value_entry.get())
             position = self.linked_list.search(value)
             elements = self.linked_list.traverse()
             if position != -1:
-                self.visualize(elements, highlight=[position])
+                yield self.visualize(elements, highlight=[position])
             else:
-                self.visualize(elements)
-                messagebox.showinfo(
-                    "Search Result", f"Value {value} not found in the list."
-                )
+                yield self.visualize(elements)
+                yield "message", f"Value {value} not found in the list."
 
-        self.visualize(self.linked_list.traverse())
-
-        # Re-enable start button and disable pause button
-        self.start_button.config(state="normal")
-        self.pause_button.config(state="disabled")
+        yield self.visualize(self.linked_list.traverse())
 
     # Rest of the methods remain the same as in the previous implementation
     def visualize(self, elements, highlight=None):
-        self.ax.clear()
-        x = list(range(len(elements)))
-        y = [0] * len(elements)
-
-        # Plot nodes
-        self.ax.scatter(x, y, s=500, c="lightblue", zorder=2)
-
-        # Plot arrows
-        for i in range(len(elements) - 1):
-            self.ax.annotate(
-                "",
-                xy=(i + 1, 0),
-                xytext=(i, 0),
-                arrowprops=dict(arrowstyle="->", color="gray"),
-            )
-
-        # Add node values
-        for i, val in enumerate(elements):
-            self.ax.text(i, 0, str(val), ha="center", va="center", fontweight="bold")
-
-        # Highlight specific nodes if needed
-        if highlight:
-            self.ax.scatter(
-                [x[i] for i in highlight],
-                [y[i] for i in highlight],
-                s=600,
-                c="yellow",
-                zorder=1,
-            )
+        return "frame", (list(elements), highlight)
 
-        self.ax.set_xlim(-0.5, len(elements) - 0.5)
-        self.ax.set_ylim(-0.5, 0.5)
-        self.ax.axis("off")
-        self.ax.set_title("Singly Linked List Visualization")
-        self.canvas.draw()
-        self.viz_frame.update()
+    def update_gui(self, action, data):
+        """Apply an event yielded by the operation (runs on the Tk thread)."""
+        if action == "frame":
+            self.renderer.update(*data)
+        elif action == "message":
+            messagebox.showinfo("Search Result", data)
 
-        if not self.step_mode:
-            time.sleep(self.speed)
+    def finish(self):
+        # Re-enable start button and disable pause button
+        self.start_button.config(state="normal")
+        self.pause_button.config(state="disabled")
 
     def toggle_pause(self):
-        if not hasattr(self, "pause_event"):
-            self.pause_event = threading.Event()
-            self.pause_event.set()
-
-        if self.is_paused:
-            self.pause_event.set()
-            self.pause_button.config(text="Pause")
-            self.is_paused = False
-        else:
-            self.pause_event.clear()
-            self.pause_button.config(text="Resume")
-            self.is_paused = True
-
-    def update_speed(self, value):
-        self.speed = float(value)
+        if self.scheduler is None:
+            return
+        paused = self.scheduler.toggle()
+        self.pause_button.config(text="Resume" if paused else "Pause")
 
     def show_documentation(self):
         doc_window = tk.Toplevel(self.root)
@@ -510,6 +378,11 @@ class SinglyLinkedListVisualization:
         """Navigate back to the previous page."""
         from algorithmPage import AlgorithmPage  # Adjust import as necessary
 
+        # Stop the running visualization and free the figures of this page
+        # before its widgets go away
+        cancel_schedulers(self.root)
+        release_renderers(self.root)
+
         # Clear current widgets in the root window
         for widget in self.root.winfo_children():
             widget.destroy()
@@ -517,9 +390,9 @@ class SinglyLinkedListVisualization:
         AlgorithmPage(self.root, self.prev_page)  # Load the previous page
 
 
-def create_algorithm_page(root, prev_page):
+def create_algorithm_page(root, prev_page, backend=None):
     """Wrapper function to create the Singly Linked List visualization page."""
-    SinglyLinkedListVisualization(root, prev_page)
+    SinglyLinkedListVisualization(root, prev_page, backend)
 
 
 # If you want to run this file standalone for testing
@@ -1,18 +1,21 @@
 import tkinter as tk
-from tkinter import ttk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import time
-import threading
+from rendering.backends import create_renderer, release_renderers
+from playback.player import Player
+from playback.recorder import Recorder
+from playback.scheduler import cancel_schedulers
+from components.metricsPanel import MetricsPanel
+from components.speedControl import SpeedControl
+from components.timelineBar import TimelineBar
 
 
 class BubbleSortVisualization:
-    def __init__(self, root, prev_page):
+    def __init__(self, root, prev_page, backend=None):
         self.root = root
         self.prev_page = prev_page
-        self.is_paused = False
-        self.speed = 0.5
-        self.sorting_thread = None
+        self.backend = backend
+        self.renderer = None
+        self.player = None
+        self.recorder = None
         self.create_algorithm_page()
 
     def create_algorithm_page(self):
@@ -57,18 +60,8 @@ class BubbleSortVisualization:
         # Speed control slider
         button_frame = tk.Frame(self.frame, bg="#1e1e1e")
         button_frame.pack(side="bottom", fill="x", padx=20, pady=10)
-        speed_label = tk.Label(button_frame, text="Speed:", fg="#ffffff", bg="#1e1e1e")
-        speed_label.pack(side="left")
-        self.speed_slider = ttk.Scale(
-            button_frame,
-            from_=0.1,
-            to=2.0,
-            orient="horizontal",
-            length=200,
-            value=0.5,
-            command=self.update_speed,
-        )
-        self.speed_slider.pack(side="left", padx=(10, 0))
+        self.speed_control = SpeedControl(button_frame)
+        self.speed_control.pack(side="left")
 
         # Start button
         self.start_button = tk.Button(
@@ -141,6 +134,14 @@ class BubbleSortVisualization:
         )
         back_button.pack(side="left", expand=True, fill="x", padx=5)
 
+        # Timeline of the recorded steps
+        self.timeline_bar = TimelineBar(self.frame)
+        self.timeline_bar.pack(side="bottom", fill="x", padx=20)
+
+        # Operation counts up to the step on screen
+        self.metrics_panel = MetricsPanel(self.frame)
+        self.metrics_panel.pack(side="bottom", fill="x", padx=20)
+
     def start_sorting(self):
         # Parse input
         try:
@@ -151,92 +152,79 @@ class BubbleSortVisualization:
             )
             return
 
-        # Clear previous visualization
-        for widget in self.viz_frame.winfo_children():
-            widget.destroy()
-
-        # Create matplotlib figure and axis
-        self.fig, self.ax = plt.subplots(figsize=(8, 4))
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.viz_frame)
-        self.canvas_widget = self.canvas.get_tk_widget()
-        self.canvas_widget.pack(fill=tk.BOTH, expand=True)
+        # Create the bar chart renderer on the first run and reuse it
+        if self.renderer is None:
+            self.renderer = create_renderer(
+                "bars",
+                self.viz_frame,
+                self.backend,
+                title="Bubble Sort Visualization",
+                legend=["Unsorted", "Comparing"],
+            )
+        else:
+            # The previous run left the chart titled "Sorted Array"
+            self.renderer.set_title(
+                "Bubble Sort Visualization", legend=["Unsorted", "Comparing"]
+            )
+        self.renderer.reset(self.numbers)
 
         # Disable start button and enable pause button
         self.start_button.config(state="disabled")
         self.pause_button.config(state="normal")
 
-        # Start sorting in a separate thread
-        self.sorting_thread = threading.Thread(target=self.bubble_sort)
-        self.sorting_thread.start()
-
-    def bubble_sort(self):
-        n = len(self.numbers)
-        for i in range(n):
-            for j in range(0, n - i - 1):
-                if self.is_paused:
-                    self.pause_event.wait()  # Wait until resumed
-
-                # Clear previous bars
-                self.ax.clear()
-
-                # Plot bars
-                bars = self.ax.bar(range(n), self.numbers)
-
-                # Highlight compared bars
-                bars[j].set_color("r")
-                bars[j + 1].set_color("r")
-
-                # Set labels and title
-                self.ax.set_xlabel("Index")
-                self.ax.set_ylabel("Value")
-                self.ax.set_title("Bubble Sort Visualization")
-
-                # Add legend
-                self.ax.legend(["Unsorted", "Comparing"], loc="upper right")
-
-                # Update canvas
-                self.canvas.draw()
-                self.viz_frame.update()
-
-                # Pause for visualization
-                time.sleep(self.speed)
-
-                if self.numbers[j] > self.numbers[j + 1]:
-                    # Swap elements
-                    self.numbers[j], self.numbers[j + 1] = (
-                        self.numbers[j + 1],
-                        self.numbers[j],
-                    )
-
-        # Final sorted array visualization
-        self.ax.clear()
-        self.ax.bar(range(n), self.numbers)
-        self.ax.set_xlabel("Index")
-        self.ax.set_ylabel("Value")
-        self.ax.set_title("Sorted Array")
-        self.ax.legend(["Sorted"], loc="upper right")
-        self.canvas.draw()
+        # Stop what is left of the previous run
+        for scheduler in (self.recorder, self.player):
+            if scheduler is not None:
+                scheduler.cancel()
+        self.player = None
+        self.timeline_bar.detach()
+        self.speed_control.detach()
+        self.metrics_panel.detach()
+
+        # Record the run in a worker process, then play it back
+        self.recorder = Recorder(
+            self.viz_frame,
+            "bubble_sort",
+            self.numbers,
+            on_finish=self.play,
+            on_error=self.recording_failed,
+        )
+        self.recorder.play()
+
+    def play(self):
+        """Play back the recorded run."""
+        self.timeline = self.recorder.timeline
+        self.timeline.trace.seal()
+        self.player = Player(
+            self.viz_frame,
+            self.renderer,
+            self.timeline,
+            on_step=self.timeline_bar.show_position,
+            on_finish=self.finish,
+        )
+        self.timeline_bar.attach(self.player)
+        self.speed_control.attach(self.player)
+        self.metrics_panel.attach(self.player)
+        self.player.play()
+
+    def finish(self):
+        # The last frame shows the result under a new title
+        self.renderer.set_title("Sorted Array", legend=["Sorted"])
 
         # Re-enable start button and disable pause button
         self.start_button.config(state="normal")
         self.pause_button.config(state="disabled")
 
-    def toggle_pause(self):
-        if not hasattr(self, "pause_event"):
-            self.pause_event = threading.Event()
-            self.pause_event.set()
-
-        if self.is_paused:
-            self.pause_event.set()
-            self.pause_button.config(text="Pause")
-            self.is_paused = False
-        else:
-            self.pause_event.clear()
-            self.pause_button.config(text="Resume")
-            self.is_paused = True
+    def recording_failed(self, error):
+        tk.messagebox.showerror("Error", f"The run could not be recorded: {error}")
+        self.start_button.config(state="normal")
+        self.pause_button.config(state="disabled")
 
-    def update_speed(self, value):
-        self.speed = float(value)
+    def toggle_pause(self):
+        if self.player is None:
+            return
+        paused = self.player.toggle()
+        self.pause_button.config(text="Resume" if paused else "Pause")
 
     def show_documentation(self):
         doc_window = tk.Toplevel(self.root)
@@ -305,6 +293,11 @@ class BubbleSortVisualization:
         """Navigate back to the previous page."""
         from algorithmPage import AlgorithmPage  # Adjust import as necessary
 
+        # Stop the running visualization and free the figures of this page
+        # before its widgets go away
+        cancel_schedulers(self.root)
+        release_renderers(self.root)
+
         # Clear current widgets in the root window
         for widget in self.root.winfo_children():
             widget.destroy()
@@ -312,9 +305,9 @@ class BubbleSortVisualization:
         AlgorithmPage(self.root, self.prev_page)  # Load the previous page
 
 
-def create_algorithm_page(root, prev_page):
+def create_algorithm_page(root, prev_page, backend=None):
     """Wrapper function to create the Bubble Sort visualization page."""
-    BubbleSortVisualization(root, prev_page)
+    BubbleSortVisualization(root, prev_page, backend)
 
 
 # If you want to run this file standalone for testing
@@ -1,18 +1,22 @@
 import tkinter as tk
-from tkinter import ttk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import time
-import threading
+from rendering.backends import create_renderer, release_renderers
+from rendering.buckets import BucketLayout
+from playback.player import Player
+from playback.recorder import Recorder
+from playback.scheduler import cancel_schedulers
+from components.metricsPanel import MetricsPanel
+from components.speedControl import SpeedControl
+from components.timelineBar import TimelineBar
 
 
 class BucketSortVisualization:
-    def __init__(self, root, prev_page):
+    def __init__(self, root, prev_page, backend=None):
         self.root = root
         self.prev_page = prev_page
-        self.is_paused = False
-        self.speed = 0.5
-        self.sorting_thread = None
+        self.backend = backend
+        self.renderer = None
+        self.player = None
+        self.recorder = None
         self.create_algorithm_page()
 
     def create_algorithm_page(self):
@@ -55,18 +59,8 @@ class BucketSortVisualization:
         button_frame.pack(side="bottom", fill="x", padx=20, pady=10)
 
         # Speed control slider
-        speed_label = tk.Label(button_frame, text="Speed:", fg="#ffffff", bg="#1e1e1e")
-        speed_label.pack(side="left")
-        self.speed_slider = ttk.Scale(
-            button_frame,
-            from_=0.1,
-            to=2.0,
-            orient="horizontal",
-            length=200,
-            value=0.5,
-            command=self.update_speed,
-        )
-        self.speed_slider.pack(side="left", padx=(10, 0))
+        self.speed_control = SpeedControl(button_frame)
+        self.speed_control.pack(side="left")
 
         # Start button
         self.start_button = tk.Button(
@@ -139,6 +133,14 @@ class BucketSortVisualization:
         )
         back_button.pack(side="left", expand=True, fill="x", padx=5)
 
+        # Timeline of the recorded steps
+        self.timeline_bar = TimelineBar(self.frame)
+        self.timeline_bar.pack(side="bottom", fill="x", padx=20)
+
+        # Operation counts up to the step on screen
+        self.metrics_panel = MetricsPanel(self.frame)
+        self.metrics_panel.pack(side="bottom", fill="x", padx=20)
+
     def start_sorting(self):
         # Parse input
         try:
@@ -149,113 +151,74 @@ class BucketSortVisualization:
             )
             return
 
-        # Clear previous visualization
-        for widget in self.viz_frame.winfo_children():
-            widget.destroy()
-
-        # Create matplotlib figure and axis
-        self.fig, self.ax = plt.subplots(figsize=(8, 4))
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.viz_frame)
-        self.canvas_widget = self.canvas.get_tk_widget()
-        self.canvas_widget.pack(fill=tk.BOTH, expand=True)
+        # Create the bar chart renderer on the first run and reuse it
+        if self.renderer is None:
+            self.renderer = create_renderer(
+                "bars",
+                self.viz_frame,
+                self.backend,
+                title="Bucket Sort Visualization",
+                xlabel="Buckets",
+            )
+        self.renderer.reset(self.numbers)
 
         # Disable start button and enable pause button
         self.start_button.config(state="disabled")
         self.pause_button.config(state="normal")
 
-        # Start sorting in a separate thread
-        self.sorting_thread = threading.Thread(target=self.bucket_sort)
-        self.sorting_thread.start()
-
-    def bucket_sort(self):
-        # Find range of values
-        min_val, max_val = min(self.numbers), max(self.numbers)
-
-        # Create buckets
-        bucket_range = (max_val - min_val) / 10
-        buckets = [[] for _ in range(10)]
-
-        # Distribute elements into buckets
-        for num in self.numbers:
-            if self.is_paused:
-                self.pause_event.wait()
-
-            index = int((num - min_val) // bucket_range)
-            if index != 10:
-                buckets[index].append(num)
-            else:
-                buckets[9].append(num)
-
-            self.visualize_buckets(buckets)
-            time.sleep(self.speed)
-
-        # Sort individual buckets
-        sorted_array = []
-        for bucket in buckets:
-            bucket.sort()
-            sorted_array.extend(bucket)
-            self.visualize_buckets(buckets, sorted_array)
-            time.sleep(self.speed)
-
-        self.numbers = sorted_array
-        self.visualize(self.numbers)
+        # Stop what is left of the previous run
+        for scheduler in (self.recorder, self.player):
+            if scheduler is not None:
+                scheduler.cancel()
+        self.player = None
+        self.timeline_bar.detach()
+        self.speed_control.detach()
+        self.metrics_panel.detach()
+
+        # Record the run in a worker process, then play it back
+        self.layout = BucketLayout(self.numbers, 10)
+        self.recorder = Recorder(
+            self.viz_frame,
+            "bucket_sort",
+            self.numbers,
+            on_finish=self.play,
+            on_error=self.recording_failed,
+        )
+        self.recorder.play()
+
+    def play(self):
+        """Play back the recorded run."""
+        self.timeline = self.recorder.timeline
+        self.timeline.trace.seal()
+        self.player = Player(
+            self.viz_frame,
+            self.renderer,
+            self.timeline,
+            colors=self.layout.stripes,
+            default=BucketLayout.COLORS[0],
+            on_step=self.timeline_bar.show_position,
+            on_finish=self.finish,
+        )
+        self.timeline_bar.attach(self.player)
+        self.speed_control.attach(self.player)
+        self.metrics_panel.attach(self.player)
+        self.player.play()
 
+    def finish(self):
         # Re-enable start button and disable pause button
         self.start_button.config(state="normal")
         self.pause_button.config(state="disabled")
 
-    def visualize_buckets(self, buckets, sorted_array=None):
-        self.ax.clear()
-
-        total_elements = sum(len(bucket) for bucket in buckets)
-        bar_width = 0.8 / total_elements
-
-        x = 0
-        for i, bucket in enumerate(buckets):
-            for element in bucket:
-                self.ax.bar(x, element, width=bar_width, color="b", align="edge")
-                x += bar_width
-
-            if i < len(buckets) - 1:
-                self.ax.axvline(x, color="r", linestyle="--")
-
-        if sorted_array:
-            sorted_x = [i * bar_width for i in range(len(sorted_array))]
-            self.ax.bar(
-                sorted_x, sorted_array, width=bar_width, color="g", align="edge"
-            )
-
-        self.ax.set_xlabel("Buckets")
-        self.ax.set_ylabel("Value")
-        self.ax.set_title("Bucket Sort Visualization")
-        self.canvas.draw()
-        self.viz_frame.update()
-
-    def visualize(self, data):
-        self.ax.clear()
-        self.ax.bar(range(len(data)), data)
-        self.ax.set_xlabel("Index")
-        self.ax.set_ylabel("Value")
-        self.ax.set_title("Bucket Sort Visualization")
-        self.canvas.draw()
-        self.viz_frame.update()
+    def recording_failed(self, error):
+        tk.messagebox.showerror("Error", f"The run could not be recorded: {error}")
+        self.start_button.config(state="normal")
+        self.pause_button.config(state="disabled")
 
     def toggle_pause(self):
-        if not hasattr(self, "pause_event"):
-            self.pause_event = threading.Event()
-            self.pause_event.set()
-
-        if self.is_paused:
-            self.pause_event.set()
-            self.pause_button.config(text="Pause")
-            self.is_paused = False
-        else:
-            self.pause_event.clear()
-            self.pause_button.config(text="Resume")
-            self.is_paused = True
-
-    def update_speed(self, value):
-        self.speed = float(value)
+        if self.player is None:
+            return
+        paused = self.player.toggle()
+        self.pause_button.config(text="Resume" if paused else "Pause")
 
     def show_documentation(self):
         doc_window = tk.Toplevel(self.root)
@@ -286,8 +249,7 @@ class BucketSortVisualization:
         - Requires linked lists or dynamic arrays for bucket storage
 
         Visualization Guide:
-        - Blue bars: Elements in buckets
-        - Red lines: Bucket separators
+        - Blue and cyan bars: Elements in alternating buckets
         - Green bars: Sorted elements
 
         Use the speed slider to adjust the visualization speed.
@@ -324,6 +286,11 @@ class BucketSortVisualization:
         """Navigate back to the previous page."""
         from algorithmPage import AlgorithmPage  # Adjust import as necessary
 
+        # Stop the running visualization and free the figures of this page
+        # before its widgets go away
+        cancel_schedulers(self.root)
+        release_renderers(self.root)
+
         # Clear current widgets in the root window
         for widget in self.root.winfo_children():
             widget.destroy()
@@ -331,9 +298,9 @@ class BucketSortVisualization:
         AlgorithmPage(self.root, self.prev_page)  # Load the previous page
 
 
-def create_algorithm_page(root, prev_page):
+def create_algorithm_page(root, prev_page, backend=None):
     """Wrapper function to create the Bucket Sort visualization page."""
-    BucketSortVisualization(root, prev_page)
+    BucketSortVisualization(root, prev_page, backend)
 
 
 # If you want to run this file standalone for testing
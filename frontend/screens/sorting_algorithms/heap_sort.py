@@ -1,20 +1,25 @@
 import tkinter as tk
 from tkinter import ttk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import time
-import threading
+from rendering.backends import create_renderer, release_renderers
+from playback.player import Player
+from playback.recorder import Recorder
+from playback.scheduler import cancel_schedulers
+from components.metricsPanel import MetricsPanel
+from components.speedControl import SpeedControl
+from components.timelineBar import TimelineBar
+
+VARIANTS = ("Sift-down", "Floyd (down to a leaf, then up)")
 
 
 class HeapSortVisualization:
-    def __init__(self, root, prev_page):
+    def __init__(self, root, prev_page, backend=None):
         self.root = root
         self.prev_page = prev_page
-        self.is_paused = False
-        self.speed = 0.5
-        self.sorting_thread = None
-        self.step_mode = False
-        self.step_event = threading.Event()
+        self.backend = backend
+        self.renderer = None
+        self.tree_renderer = None
+        self.player = None
+        self.recorder = None
         self.create_algorithm_page()
 
     def create_algorithm_page(self):
@@ -48,10 +53,29 @@ class HeapSortVisualization:
         self.input_entry = tk.Entry(self.frame, width=40)
         self.input_entry.pack(pady=(0, 10))
 
+        # How an element is sifted through the heap
+        variant_frame = tk.Frame(self.frame, bg="#1e1e1e")
+        variant_frame.pack(pady=(0, 5))
+        variant_label = tk.Label(
+            variant_frame, text="Variant:", fg="#ffffff", bg="#1e1e1e"
+        )
+        variant_label.pack(side="left")
+        self.variant_choice = ttk.Combobox(
+            variant_frame, values=VARIANTS, state="readonly", width=30
+        )
+        self.variant_choice.set(VARIANTS[0])
+        self.variant_choice.pack(side="left", padx=5)
+
         # Visualization frame
         self.viz_frame = tk.Frame(self.frame, bg="#1e1e1e")
         self.viz_frame.pack(expand=True, fill="both", padx=20, pady=20)
 
+        # The array as bars, and next to it the heap it encodes as a tree
+        self.bars_frame = tk.Frame(self.viz_frame, bg="#1e1e1e")
+        self.bars_frame.pack(side="left", expand=True, fill="both")
+        self.tree_frame = tk.Frame(self.viz_frame, bg="#1e1e1e")
+        self.tree_frame.pack(side="left", expand=True, fill="both")
+
         # Buttons frame
         button_frame = tk.Frame(self.frame, bg="#1e1e1e")
         button_frame.pack(fill="x", padx=20, pady=10)
@@ -59,18 +83,8 @@ class HeapSortVisualization:
         # Speed control slider
         button_frame = tk.Frame(self.frame, bg="#1e1e1e")
         button_frame.pack(fill="x", padx=20, pady=10)
-        speed_label = tk.Label(button_frame, text="Speed:", fg="#ffffff", bg="#1e1e1e")
-        speed_label.pack(side="left")
-        self.speed_slider = ttk.Scale(
-            button_frame,
-            from_=0.1,
-            to=2.0,
-            orient="horizontal",
-            length=200,
-            value=0.5,
-            command=self.update_speed,
-        )
-        self.speed_slider.pack(side="left", padx=(10, 0))
+        self.speed_control = SpeedControl(button_frame)
+        self.speed_control.pack(side="left")
 
         # Start button
         self.start_button = tk.Button(
@@ -143,6 +157,14 @@ class HeapSortVisualization:
         )
         back_button.pack(side="left",expand=True, fill="x", padx=5)
 
+        # Timeline of the recorded steps
+        self.timeline_bar = TimelineBar(self.frame)
+        self.timeline_bar.pack(side="bottom", fill="x", padx=20)
+
+        # Operation counts up to the step on screen
+        self.metrics_panel = MetricsPanel(self.frame)
+        self.metrics_panel.pack(side="bottom", fill="x", padx=20)
+
     def start_sorting(self):
         # Parse input
         try:
@@ -153,106 +175,76 @@ class HeapSortVisualization:
             )
             return
 
-        # Clear previous visualization
-        for widget in self.viz_frame.winfo_children():
-            widget.destroy()
-
-        # Create matplotlib figure and axis
-        self.fig, self.ax = plt.subplots(figsize=(8, 4))
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.viz_frame)
-        self.canvas_widget = self.canvas.get_tk_widget()
-        self.canvas_widget.pack(fill=tk.BOTH, expand=True)
+        # Create the bar chart and tree renderers on the first run and reuse them
+        if self.renderer is None:
+            self.renderer = create_renderer(
+                "bars",
+                self.bars_frame,
+                self.backend,
+                title="Heap Sort Visualization",
+            )
+            self.tree_renderer = create_renderer(
+                "tree", self.tree_frame, self.backend, title="Heap"
+            )
+        self.renderer.reset(self.numbers)
+        self.tree_renderer.reset(self.numbers)
 
         # Disable start button and enable pause button
         self.start_button.config(state="disabled")
         self.pause_button.config(state="normal")
 
-        # Start sorting in a separate thread
-        self.sorting_thread = threading.Thread(target=self.heap_sort)
-        self.sorting_thread.start()
-
-    def heap_sort(self):
-        def heapify(n, i):
-            largest = i
-            left = 2 * i + 1
-            right = 2 * i + 2
-
-            if left < n and self.numbers[left] > self.numbers[largest]:
-                largest = left
-
-            if right < n and self.numbers[right] > self.numbers[largest]:
-                largest = right
-
-            if largest != i:
-                self.numbers[i], self.numbers[largest] = (
-                    self.numbers[largest],
-                    self.numbers[i],
-                )
-                self.visualize(highlight=[i, largest])
-                time.sleep(self.speed)
-                heapify(n, largest)
-
-        n = len(self.numbers)
-
-        # Build max heap
-        for i in range(n // 2 - 1, -1, -1):
-            if self.is_paused:
-                self.pause_event.wait()
-            if self.step_mode:
-                self.step_event.wait()
-                self.step_event.clear()
-            heapify(n, i)
-
-        # Extract elements from heap one by one
-        for i in range(n - 1, 0, -1):
-            if self.is_paused:
-                self.pause_event.wait()
-            if self.step_mode:
-                self.step_event.wait()
-                self.step_event.clear()
-            self.numbers[0], self.numbers[i] = self.numbers[i], self.numbers[0]
-            self.visualize(highlight=[0, i])
-            time.sleep(self.speed)
-            heapify(i, 0)
-
-        self.visualize(sorted=True)
+        # Stop what is left of the previous run
+        for scheduler in (self.recorder, self.player):
+            if scheduler is not None:
+                scheduler.cancel()
+        self.player = None
+        self.timeline_bar.detach()
+        self.speed_control.detach()
+        self.metrics_panel.detach()
+
+        # Record the run in a worker process, then play it back
+        self.recorder = Recorder(
+            self.viz_frame,
+            "heap_sort",
+            self.numbers,
+            on_finish=self.play,
+            on_error=self.recording_failed,
+            floyd=self.variant_choice.get() == VARIANTS[1],
+        )
+        self.recorder.play()
+
+    def play(self):
+        """Play back the recorded run."""
+        self.timeline = self.recorder.timeline
+        self.timeline.trace.seal()
+        self.player = Player(
+            self.viz_frame,
+            self.renderer,
+            self.timeline,
+            on_step=self.timeline_bar.show_position,
+            on_finish=self.finish,
+            heap_renderer=self.tree_renderer,
+        )
+        self.timeline_bar.attach(self.player)
+        self.speed_control.attach(self.player)
+        self.metrics_panel.attach(self.player)
+        self.player.play()
 
+    def finish(self):
         # Re-enable start button and disable pause button
         self.start_button.config(state="normal")
         self.pause_button.config(state="disabled")
 
-    def visualize(self, highlight=[], sorted=False):
-        self.ax.clear()
-        bars = self.ax.bar(range(len(self.numbers)), self.numbers)
-
-        for i, bar in enumerate(bars):
-            if i in highlight:
-                bar.set_color("r")
-            elif sorted:
-                bar.set_color("g")
-
-        self.ax.set_xlabel("Index")
-        self.ax.set_ylabel("Value")
-        self.ax.set_title("Heap Sort Visualization")
-        self.canvas.draw()
-        self.viz_frame.update()
+    def recording_failed(self, error):
+        tk.messagebox.showerror("Error", f"The run could not be recorded: {error}")
+        self.start_button.config(state="normal")
+        self.pause_button.config(state="disabled")
 
     def toggle_pause(self):
-        if not hasattr(self, "pause_event"):
-            self.pause_event = threading.Event()
-            self.pause_event.set()
-
-        if self.is_paused:
-            self.pause_event.set()
-            self.pause_button.config(text="Pause")
-            self.is_paused = False
-        else:
-            self.pause_event.clear()
-            self.pause_button.config(text="Resume")
-            self.is_paused = True
-
-    def update_speed(self, value):
-        self.speed = float(value)
+        if self.player is None:
+            return
+        paused = self.player.toggle()
+        self.pause_button.config(text="Resume" if paused else "Pause")
 
     def show_documentation(self):
         doc_window = tk.Toplevel(self.root)
@@ -274,6 +266,13 @@ class HeapSortVisualization:
 
         Space Complexity: O(1)
 
+        Variants:
+        - Sift-down: at every level the element is compared with both of its
+          children and swapped with the larger one, two comparisons per level.
+        - Floyd: the larger child is moved up at every level without looking
+          at the element, which then sinks to a leaf and is sifted back up a
+          short way. This takes about half the comparisons.
+
         Advantages:
         - Efficient for large datasets
         - In-place sorting algorithm
@@ -287,6 +286,9 @@ class HeapSortVisualization:
         - Red bars: Elements being compared or swapped
         - Blue bars: Unsorted elements
         - Green bars: Sorted elements (final state)
+        - The tree on the right shows the array as a heap (its top seven
+          levels): the children of element i are elements 2i + 1 and 2i + 2.
+          Gray nodes have left the heap for the sorted end of the array.
 
         Use the speed slider to adjust the visualization speed.
         Use the Step-by-Step mode to go through the algorithm one step at a time.
@@ -328,6 +330,11 @@ class HeapSortVisualization:
         """Navigate back to the previous page."""
         from algorithmPage import AlgorithmPage  # Adjust import as necessary
 
+        # Stop the running visualization and free the figures of this page
+        # before its widgets go away
+        cancel_schedulers(self.root)
+        release_renderers(self.root)
+
         # Clear current widgets in the root window
         for widget in self.root.winfo_children():
             widget.destroy()
@@ -335,9 +342,9 @@ class HeapSortVisualization:
         AlgorithmPage(self.root, self.prev_page)  # Load the previous page
 
 
-def create_algorithm_page(root, prev_page):
+def create_algorithm_page(root, prev_page, backend=None):
     """Wrapper function to create the Quick Sort visualization page."""
-    HeapSortVisualization(root, prev_page)
+    HeapSortVisualization(root, prev_page, backend)
 
 
 # If you want to run this file standalone for testing
@@ -1,20 +1,25 @@
 import tkinter as tk
 from tkinter import ttk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import time
-import threading
+from rendering.backends import create_renderer, release_renderers
+from playback.player import Player
+from playback.recorder import Recorder
+from playback.scheduler import cancel_schedulers
+from components.metricsPanel import MetricsPanel
+from components.speedControl import SpeedControl
+from components.timelineBar import TimelineBar
+
+VARIANTS = ("Top-down", "Bottom-up", "Bottom-up, natural runs")
 
 
 class MergeSortVisualization:
-    def __init__(self, root, prev_page):
+    def __init__(self, root, prev_page, backend=None):
         self.root = root
         self.prev_page = prev_page
-        self.is_paused = False
-        self.speed = 0.5
-        self.sorting_thread = None
-        self.step_mode = False
-        self.step_event = threading.Event()
+        self.backend = backend
+        self.renderer = None
+        self.aux_renderer = None  # Second row, created for the first bottom-up run
+        self.player = None
+        self.recorder = None
         self.create_algorithm_page()
 
     def create_algorithm_page(self):
@@ -48,10 +53,26 @@ class MergeSortVisualization:
         self.input_entry = tk.Entry(self.frame, width=40)
         self.input_entry.pack(pady=(0, 10))
 
+        # Top-down or bottom-up merging
+        variant_frame = tk.Frame(self.frame, bg="#1e1e1e")
+        variant_frame.pack(pady=(0, 5))
+        variant_label = tk.Label(
+            variant_frame, text="Variant:", fg="#ffffff", bg="#1e1e1e"
+        )
+        variant_label.pack(side="left")
+        self.variant_choice = ttk.Combobox(
+            variant_frame, values=VARIANTS, state="readonly", width=24
+        )
+        self.variant_choice.set(VARIANTS[0])
+        self.variant_choice.pack(side="left", padx=5)
+
         # Visualization frame
         self.viz_frame = tk.Frame(self.frame, bg="#1e1e1e")
         self.viz_frame.pack(expand=True, fill="both", padx=20, pady=20)
 
+        # Room for the auxiliary buffer, only shown for the bottom-up variants
+        self.aux_frame = tk.Frame(self.viz_frame, bg="#1e1e1e")
+
         # Buttons frame
         button_frame = tk.Frame(self.frame, bg="#1e1e1e")
         button_frame.pack(fill="x", padx=20, pady=10)
@@ -59,18 +80,8 @@ class MergeSortVisualization:
         # Speed control slider
         button_frame = tk.Frame(self.frame, bg="#1e1e1e")
         button_frame.pack(fill="x", padx=20, pady=10)
-        speed_label = tk.Label(button_frame, text="Speed:", fg="#ffffff", bg="#1e1e1e")
-        speed_label.pack(side="left")
-        self.speed_slider = ttk.Scale(
-            button_frame,
-            from_=0.1,
-            to=2.0,
-            orient="horizontal",
-            length=200,
-            value=0.5,
-            command=self.update_speed,
-        )
-        self.speed_slider.pack(side="left", padx=(10, 0))
+        self.speed_control = SpeedControl(button_frame)
+        self.speed_control.pack(side="left")
 
         # Start button
         self.start_button = tk.Button(
@@ -143,6 +154,14 @@ class MergeSortVisualization:
         )
         back_button.pack(side="left", expand=True, fill="x", padx=5)
 
+        # Timeline of the recorded steps
+        self.timeline_bar = TimelineBar(self.frame)
+        self.timeline_bar.pack(side="bottom", fill="x", padx=20)
+
+        # Operation counts up to the step on screen
+        self.metrics_panel = MetricsPanel(self.frame)
+        self.metrics_panel.pack(side="bottom", fill="x", padx=20)
+
     def start_sorting(self):
         # Parse input
         try:
@@ -153,122 +172,84 @@ class MergeSortVisualization:
             )
             return
 
-        # Clear previous visualization
-        for widget in self.viz_frame.winfo_children():
-            widget.destroy()
-
-        # Create matplotlib figure and axis
-        self.fig, self.ax = plt.subplots(figsize=(8, 4))
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.viz_frame)
-        self.canvas_widget = self.canvas.get_tk_widget()
-        self.canvas_widget.pack(fill=tk.BOTH, expand=True)
+        # Create the bar chart renderer on the first run and reuse it
+        if self.renderer is None:
+            self.renderer = create_renderer(
+                "bars", self.viz_frame, self.backend, title="Merge Sort Visualization"
+            )
+        self.renderer.reset(self.numbers)
 
         # Disable start button and enable pause button
         self.start_button.config(state="disabled")
         self.pause_button.config(state="normal")
 
-        # Start sorting in a separate thread
-        self.sorting_thread = threading.Thread(target=self.merge_sort)
-        self.sorting_thread.start()
-
-    def merge_sort(self):
-        def merge(arr, l, m, r):
-            left = arr[l : m + 1]
-            right = arr[m + 1 : r + 1]
-            i = j = 0
-            k = l
-
-            while i < len(left) and j < len(right):
-                if self.is_paused:
-                    self.pause_event.wait()
-
-                if self.step_mode:
-                    self.step_event.wait()
-                    self.step_event.clear()
-
-                if left[i] <= right[j]:
-                    arr[k] = left[i]
-                    i += 1
-                else:
-                    arr[k] = right[j]
-                    j += 1
-                k += 1
-                self.visualize(highlight=[k - 1])
-                if not self.step_mode:
-                    time.sleep(self.speed)
-
-            while i < len(left):
-                if self.is_paused:
-                    self.pause_event.wait()
-
-                if self.step_mode:
-                    self.step_event.wait()
-                    self.step_event.clear()
-
-                arr[k] = left[i]
-                i += 1
-                k += 1
-                self.visualize(highlight=[k - 1])
-                if not self.step_mode:
-                    time.sleep(self.speed)
-
-            while j < len(right):
-                if self.is_paused:
-                    self.pause_event.wait()
-
-                if self.step_mode:
-                    self.step_event.wait()
-                    self.step_event.clear()
-
-                arr[k] = right[j]
-                j += 1
-                k += 1
-                self.visualize(highlight=[k - 1])
-                if not self.step_mode:
-                    time.sleep(self.speed)
-
-        def merge_sort_recursive(arr, l, r):
-            if l < r:
-                m = (l + r) // 2
-                merge_sort_recursive(arr, l, m)
-                merge_sort_recursive(arr, m + 1, r)
-                merge(arr, l, m, r)
-
-        merge_sort_recursive(self.numbers, 0, len(self.numbers) - 1)
-        self.visualize()  # Final visualization
+        # Stop what is left of the previous run
+        for scheduler in (self.recorder, self.player):
+            if scheduler is not None:
+                scheduler.cancel()
+        self.player = None
+        self.timeline_bar.detach()
+        self.speed_control.detach()
+        self.metrics_panel.detach()
+
+        # Record the run in a worker process, then play it back
+        self.variant = self.variant_choice.get()
+        if self.variant == "Top-down":
+            self.aux_frame.pack_forget()
+            algorithm, second, options = "merge_sort", None, {}
+        else:
+            # The auxiliary array is drawn under the input
+            self.aux_frame.pack(expand=True, fill="both")
+            if self.aux_renderer is None:
+                self.aux_renderer = create_renderer(
+                    "bars", self.aux_frame, self.backend, title="Auxiliary buffer"
+                )
+            self.aux_renderer.reset([0] * len(self.numbers))
+            algorithm, second = "bottom_up_merge_sort", 1
+            options = {"natural": self.variant == "Bottom-up, natural runs"}
+        self.recorder = Recorder(
+            self.viz_frame,
+            algorithm,
+            self.numbers,
+            second=second,
+            on_finish=self.play,
+            on_error=self.recording_failed,
+            **options,
+        )
+        self.recorder.play()
+
+    def play(self):
+        """Play back the recorded run."""
+        self.timeline = self.recorder.timeline
+        self.timeline.trace.seal()
+        self.player = Player(
+            self.viz_frame,
+            self.renderer,
+            self.timeline,
+            on_step=self.timeline_bar.show_position,
+            on_finish=self.finish,
+            second_renderer=None if self.variant == "Top-down" else self.aux_renderer,
+        )
+        self.timeline_bar.attach(self.player)
+        self.speed_control.attach(self.player)
+        self.metrics_panel.attach(self.player)
+        self.player.play()
 
+    def finish(self):
         # Re-enable start button and disable pause button
         self.start_button.config(state="normal")
         self.pause_button.config(state="disabled")
 
-    def visualize(self, highlight=[]):
-        self.ax.clear()
-        bars = self.ax.bar(range(len(self.numbers)), self.numbers)
-        for i in highlight:
-            if 0 <= i < len(self.numbers):
-                bars[i].set_color("r")
-        self.ax.set_xlabel("Index")
-        self.ax.set_ylabel("Value")
-        self.ax.set_title("Merge Sort Visualization")
-        self.canvas.draw()
-        self.viz_frame.update()
+    def recording_failed(self, error):
+        tk.messagebox.showerror("Error", f"The run could not be recorded: {error}")
+        self.start_button.config(state="normal")
+        self.pause_button.config(state="disabled")
 
     def toggle_pause(self):
-        if not hasattr(self, "pause_event"):
-            self.pause_event = threading.Event()
-            self.pause_event.set()
-
-        if self.is_paused:
-            self.pause_event.set()
-            self.pause_button.config(text="Pause")
-            self.is_paused = False
-        else:
-            self.pause_event.clear()
-            self.pause_button.config(text="Resume")
-            self.is_paused = True
-
-    def update_speed(self, value):
-        self.speed = float(value)
+        if self.player is None:
+            return
+        paused = self.player.toggle()
+        self.pause_button.config(text="Resume" if paused else "Pause")
 
     def show_documentation(self):
         doc_window = tk.Toplevel(self.root)
@@ -290,6 +271,15 @@ class MergeSortVisualization:
 
         Space Complexity: O(n)
 
+        Variants:
+        - Top-down: splits the list recursively and copies both halves out
+          before every merge.
+        - Bottom-up: merges runs of 1, 2, 4, ... elements back and forth
+          between the list and one auxiliary array of the same length, drawn
+          as the second chart, without recursion or further allocation.
+        - Bottom-up, natural runs: starts from the ascending stretches already
+          in the list, so sorted input takes a single pass of comparisons.
+
         Advantages:
         - Stable sort (doesn't change the relative order of elements with equal keys)
         - Guaranteed O(n log n) performance
@@ -344,6 +334,11 @@ class MergeSortVisualization:
         """Navigate back to the previous page."""
         from algorithmPage import AlgorithmPage  # Adjust import as necessary
 
+        # Stop the running visualization and free the figures of this page
+        # before its widgets go away
+        cancel_schedulers(self.root)
+        release_renderers(self.root)
+
         # Clear current widgets in the root window
         for widget in self.root.winfo_children():
             widget.destroy()
@@ -351,9 +346,9 @@ class MergeSortVisualization:
         AlgorithmPage(self.root, self.prev_page)  # Load the previous page
 
 
-def create_algorithm_page(root, prev_page):
+def create_algorithm_page(root, prev_page, backend=None):
     """Wrapper function to create the Merge Sort visualization page."""
-    MergeSortVisualization(root, prev_page)
+    MergeSortVisualization(root, prev_page, backend)
 
 
 # If you want to run this file standalone for testing
@@ -1,21 +1,24 @@
 import tkinter as tk
 from tkinter import ttk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import time
-import threading
 import random
+from rendering.backends import create_renderer, release_renderers
+from playback.player import Player
+from playback.recorder import Recorder
+from playback.scheduler import cancel_schedulers
+from codecrux.algorithms.sorting import PIVOTS
+from components.metricsPanel import MetricsPanel
+from components.speedControl import SpeedControl
+from components.timelineBar import TimelineBar
 
 
 class QuickSortVisualization:
-    def __init__(self, root, prev_page):
+    def __init__(self, root, prev_page, backend=None):
         self.root = root
         self.prev_page = prev_page
-        self.is_paused = False
-        self.speed = 0.5
-        self.sorting_thread = None
-        self.step_mode = False
-        self.step_event = threading.Event()
+        self.backend = backend
+        self.renderer = None
+        self.player = None
+        self.recorder = None
         self.create_algorithm_page()
 
     def create_algorithm_page(self):
@@ -49,6 +52,33 @@ class QuickSortVisualization:
         self.input_entry = tk.Entry(self.frame, width=40)
         self.input_entry.pack(pady=(0, 10))
 
+        # Pivot strategy and partition options
+        options_frame = tk.Frame(self.frame, bg="#1e1e1e")
+        options_frame.pack(pady=(0, 5))
+        pivot_label = tk.Label(options_frame, text="Pivot:", fg="#ffffff", bg="#1e1e1e")
+        pivot_label.pack(side="left")
+        self.pivot_choice = ttk.Combobox(
+            options_frame, values=PIVOTS, state="readonly", width=16
+        )
+        self.pivot_choice.set(PIVOTS[0])
+        self.pivot_choice.pack(side="left", padx=(5, 15))
+        self.three_way = tk.BooleanVar(value=False)
+        self.fallback = tk.BooleanVar(value=False)
+        for text, variable in (
+            ("3-way partition", self.three_way),
+            ("Heap sort fallback", self.fallback),
+        ):
+            tk.Checkbutton(
+                options_frame,
+                text=text,
+                variable=variable,
+                fg="#ffffff",
+                bg="#1e1e1e",
+                selectcolor="#2e2e2e",
+                activebackground="#1e1e1e",
+                activeforeground="#ffffff",
+            ).pack(side="left", padx=5)
+
         # Visualization frame
         self.viz_frame = tk.Frame(self.frame, bg="#1e1e1e")
         self.viz_frame.pack(expand=True, fill="both", padx=20, pady=20)
@@ -60,18 +90,8 @@ class QuickSortVisualization:
         # Speed control slider
         button_frame = tk.Frame(self.frame, bg="#1e1e1e")
         button_frame.pack(fill="x", padx=20, pady=10)
-        speed_label = tk.Label(button_frame, text="Speed:", fg="#ffffff", bg="#1e1e1e")
-        speed_label.pack(side="left")
-        self.speed_slider = ttk.Scale(
-            button_frame,
-            from_=0.1,
-            to=2.0,
-            orient="horizontal",
-            length=200,
-            value=0.5,
-            command=self.update_speed,
-        )
-        self.speed_slider.pack(side="left", padx=(10, 0))
+        self.speed_control = SpeedControl(button_frame)
+        self.speed_control.pack(side="left")
 
         # Start button
         self.start_button = tk.Button(
@@ -144,6 +164,14 @@ class QuickSortVisualization:
         )
         back_button.pack(side="left", expand=True, fill="x", padx=5)
 
+        # Timeline of the recorded steps
+        self.timeline_bar = TimelineBar(self.frame)
+        self.timeline_bar.pack(side="bottom", fill="x", padx=20)
+
+        # Operation counts up to the step on screen
+        self.metrics_panel = MetricsPanel(self.frame)
+        self.metrics_panel.pack(side="bottom", fill="x", padx=20)
+
     def start_sorting(self):
         # Parse input
         try:
@@ -154,95 +182,70 @@ class QuickSortVisualization:
             )
             return
 
-        # Clear previous visualization
-        for widget in self.viz_frame.winfo_children():
-            widget.destroy()
-
-        # Create matplotlib figure and axis
-        self.fig, self.ax = plt.subplots(figsize=(8, 4))
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.viz_frame)
-        self.canvas_widget = self.canvas.get_tk_widget()
-        self.canvas_widget.pack(fill=tk.BOTH, expand=True)
+        # Create the bar chart renderer on the first run and reuse it
+        if self.renderer is None:
+            self.renderer = create_renderer(
+                "bars", self.viz_frame, self.backend, title="Quick Sort Visualization"
+            )
+        self.renderer.reset(self.numbers)
 
         # Disable start button and enable pause button
         self.start_button.config(state="disabled")
         self.pause_button.config(state="normal")
 
-        # Start sorting in a separate thread
-        self.sorting_thread = threading.Thread(target=self.quick_sort)
-        self.sorting_thread.start()
-
-    def quick_sort(self):
-        def partition(low, high):
-            pivot = self.numbers[high]
-            i = low - 1
-            for j in range(low, high):
-                if self.is_paused:
-                    self.pause_event.wait()
-                if self.step_mode:
-                    self.step_event.wait()
-                    self.step_event.clear()
-
-                self.visualize(highlight=[j, high], pivot_index=high)
-                time.sleep(self.speed)
-
-                if self.numbers[j] < pivot:
-                    i += 1
-                    self.numbers[i], self.numbers[j] = self.numbers[j], self.numbers[i]
-
-            self.numbers[i + 1], self.numbers[high] = (
-                self.numbers[high],
-                self.numbers[i + 1],
-            )
-            return i + 1
-
-        def quick_sort_helper(low, high):
-            if low < high:
-                pi = partition(low, high)
-                quick_sort_helper(low, pi - 1)
-                quick_sort_helper(pi + 1, high)
-
-        quick_sort_helper(0, len(self.numbers) - 1)
-        self.visualize(sorted=True)
+        # Stop what is left of the previous run
+        for scheduler in (self.recorder, self.player):
+            if scheduler is not None:
+                scheduler.cancel()
+        self.player = None
+        self.timeline_bar.detach()
+        self.speed_control.detach()
+        self.metrics_panel.detach()
+
+        # Record the run in a worker process, then play it back
+        self.recorder = Recorder(
+            self.viz_frame,
+            "quick_sort",
+            self.numbers,
+            on_finish=self.play,
+            on_error=self.recording_failed,
+            pivot=self.pivot_choice.get(),
+            three_way=self.three_way.get(),
+            fallback=self.fallback.get(),
+        )
+        self.recorder.play()
+
+    def play(self):
+        """Play back the recorded run."""
+        self.timeline = self.recorder.timeline
+        self.timeline.trace.seal()
+        self.player = Player(
+            self.viz_frame,
+            self.renderer,
+            self.timeline,
+            on_step=self.timeline_bar.show_position,
+            on_finish=self.finish,
+        )
+        self.timeline_bar.attach(self.player)
+        self.speed_control.attach(self.player)
+        self.metrics_panel.attach(self.player)
+        self.player.play()
 
+    def finish(self):
         # Re-enable start button and disable pause button
         self.start_button.config(state="normal")
         self.pause_button.config(state="disabled")
 
-    def visualize(self, highlight=[], pivot_index=None, sorted=False):
-        self.ax.clear()
-        bars = self.ax.bar(range(len(self.numbers)), self.numbers)
-
-        for i, bar in enumerate(bars):
-            if i in highlight:
-                bar.set_color("r")
-            elif i == pivot_index:
-                bar.set_color("g")
-            elif sorted:
-                bar.set_color("g")
-
-        self.ax.set_xlabel("Index")
-        self.ax.set_ylabel("Value")
-        self.ax.set_title("Quick Sort Visualization")
-        self.canvas.draw()
-        self.viz_frame.update()
+    def recording_failed(self, error):
+        tk.messagebox.showerror("Error", f"The run could not be recorded: {error}")
+        self.start_button.config(state="normal")
+        self.pause_button.config(state="disabled")
 
     def toggle_pause(self):
-        if not hasattr(self, "pause_event"):
-            self.pause_event = threading.Event()
-            self.pause_event.set()
-
-        if self.is_paused:
-            self.pause_event.set()
-            self.pause_button.config(text="Pause")
-            self.is_paused = False
-        else:
-            self.pause_event.clear()
-            self.pause_button.config(text="Resume")
-            self.is_paused = True
-
-    def update_speed(self, value):
-        self.speed = float(value)
+        if self.player is None:
+            return
+        paused = self.player.toggle()
+        self.pause_button.config(text="Resume" if paused else "Pause")
 
     def show_documentation(self):
         doc_window = tk.Toplevel(self.root)
@@ -264,6 +267,18 @@ class QuickSortVisualization:
 
         Space Complexity: O(log n)
 
+        Options:
+        - Pivot: the last element, the median of the first, middle and last
+          elements, or a random element. The last element makes already
+          sorted input the worst case.
+        - 3-way partition: elements equal to the pivot are gathered in the
+          middle and never looked at again, so many duplicates sort fast.
+        - Heap sort fallback: a part still unsorted after 2 log n partitions
+          is heap sorted instead (introsort), so the worst case is O(n log n).
+
+        Only the smaller part is sorted recursively and the larger one in a
+        loop, so the recursion is at most log n deep.
+
         Advantages:
         - Efficient for large datasets
         - In-place sorting (doesn't require much additional memory)
@@ -316,6 +331,11 @@ class QuickSortVisualization:
         """Navigate back to the previous page."""
         from algorithmPage import AlgorithmPage  # Adjust import as necessary
 
+        # Stop the running visualization and free the figures of this page
+        # before its widgets go away
+        cancel_schedulers(self.root)
+        release_renderers(self.root)
+
         # Clear current widgets in the root window
         for widget in self.root.winfo_children():
             widget.destroy()
@@ -323,9 +343,9 @@ class QuickSortVisualization:
         AlgorithmPage(self.root, self.prev_page)  # Load the previous page
 
 
-def create_algorithm_page(root, prev_page):
+def create_algorithm_page(root, prev_page, backend=None):
     """Wrapper function to create the Quick Sort visualization page."""
-    QuickSortVisualization(root, prev_page)
+    QuickSortVisualization(root, prev_page, backend)
 
 
 # If you want to run this file standalone for testing
@@ -0,0 +1,366 @@
+import math
+import multiprocessing
+import os
+import random
+import tkinter as tk
+
+from rendering.backends import create_renderer, release_renderers
+from playback.player import Player
+from playback.race import MAX_LANES, Race
+from playback.recorder import record
+from playback.scheduler import cancel_schedulers
+from components.metricsPanel import MetricsPanel
+from components.speedControl import SpeedControl
+
+POLL = 50  # Milliseconds between two looks at the traces being recorded
+RANDOM_SIZE = 100  # Default length of a random input
+
+
+class SortingRaceVisualization:
+    """Races 2 to 6 sorting algorithms on the same input.
+
+    The traces are recorded in a process pool, one worker per algorithm,
+    while the page keeps polling for them from the Tk thread; then every
+    algorithm gets a panel in a grid and a ``playback.race.Race`` plays them
+    all on one clock. Leaving or restarting while the runs are recorded
+    terminates the workers, so none of them keeps running in the background.
+    """
+
+    def __init__(self, root, prev_page, backend=None):
+        self.root = root
+        self.prev_page = prev_page
+        self.backend = backend
+        self.race = None
+        self.pool = None
+        self.results = None
+        self.poll_id = None
+        self.create_algorithm_page()
+
+    def create_algorithm_page(self):
+        """Set up the Sorting Race page."""
+        from algorithmPage import AlgorithmPage  # Local import, avoids a cycle
+
+        # Clear current widgets in the root window
+        for widget in self.root.winfo_children():
+            widget.destroy()
+
+        # Create a new frame for the algorithm page
+        self.frame = tk.Frame(self.root, bg="#1e1e1e")
+        self.frame.pack(expand=True, fill="both")
+
+        # Heading
+        algo_label = tk.Label(
+            self.frame,
+            text="Sorting Race",
+            font=("Helvetica", 20, "bold"),
+            fg="#ffffff",
+            bg="#1e1e1e",
+        )
+        algo_label.pack(pady=(20, 10))
+
+        # One check box per sorting algorithm
+        choice_label = tk.Label(
+            self.frame,
+            text=f"Pick 2 to {MAX_LANES} algorithms:",
+            fg="#ffffff",
+            bg="#1e1e1e",
+        )
+        choice_label.pack(pady=(5, 0))
+        choice_frame = tk.Frame(self.frame, bg="#1e1e1e")
+        choice_frame.pack(pady=(0, 5))
+        self.choices = {}
+        for name in AlgorithmPage.get_algo_options("Sorting Algorithms"):
+            selected = tk.BooleanVar(value=len(self.choices) < 2)
+            tk.Checkbutton(
+                choice_frame,
+                text=name,
+                variable=selected,
+                fg="#ffffff",
+                bg="#1e1e1e",
+                selectcolor="#2e2e2e",
+                activebackground="#1e1e1e",
+                activeforeground="#ffffff",
+            ).pack(side="left")
+            self.choices[name] = selected
+
+        # Input field for numbers, or a random input of a given length
+        input_label = tk.Label(
+            self.frame,
+            text="Enter numbers (comma-separated) or generate random ones:",
+            fg="#ffffff",
+            bg="#1e1e1e",
+        )
+        input_label.pack(pady=(5, 5))
+        input_frame = tk.Frame(self.frame, bg="#1e1e1e")
+        input_frame.pack(pady=(0, 5))
+        self.input_entry = tk.Entry(input_frame, width=40)
+        self.input_entry.pack(side="left", padx=5)
+        self.size_entry = tk.Entry(input_frame, width=8)
+        self.size_entry.insert(0, str(RANDOM_SIZE))
+        self.size_entry.pack(side="left", padx=5)
+        random_button = tk.Button(
+            input_frame,
+            text="Random",
+            font=("Helvetica", 12),
+            bg="#ffcc00",
+            fg="#1e1e1e",
+            activebackground="#ffcc00",
+            activeforeground="#1e1e1e",
+            cursor="hand2",
+            command=self.fill_random,
+        )
+        random_button.pack(side="left", padx=5)
+
+        self.status_label = tk.Label(self.frame, text="", fg="#aaaaaa", bg="#1e1e1e")
+        self.status_label.pack()
+
+        # Grid of lanes, rebuilt for every race
+        self.lanes_frame = None
+        self.viz_frame = tk.Frame(self.frame, bg="#1e1e1e")
+        self.viz_frame.pack(expand=True, fill="both", padx=20, pady=10)
+
+        # Buttons frame
+        button_frame = tk.Frame(self.frame, bg="#1e1e1e")
+        button_frame.pack(side="bottom", fill="x", padx=20, pady=10)
+        self.speed_control = SpeedControl(button_frame)
+        self.speed_control.pack(side="left")
+
+        # Start button
+        self.start_button = tk.Button(
+            button_frame,
+            text="Start Race",
+            font=("Helvetica", 12),
+            bg="#ffcc00",
+            fg="#1e1e1e",
+            activebackground="#ffcc00",
+            activeforeground="#1e1e1e",
+            cursor="hand2",
+            command=self.start_race,
+        )
+        self.start_button.pack(side="left", expand=True, fill="x", padx=5)
+
+        # Pause/Resume button
+        self.pause_button = tk.Button(
+            button_frame,
+            text="Pause",
+            font=("Helvetica", 12),
+            bg="#ffcc00",
+            fg="#1e1e1e",
+            activebackground="#ffcc00",
+            activeforeground="#1e1e1e",
+            cursor="hand2",
+            command=self.toggle_pause,
+            state="disabled",
+        )
+        self.pause_button.pack(side="left", expand=True, fill="x", padx=5)
+
+        # Back button
+        back_button = tk.Button(
+            button_frame,
+            text="Go Back",
+            font=("Helvetica", 12),
+            bg="#ffcc00",
+            fg="#1e1e1e",
+            activebackground="#ffcc00",
+            activeforeground="#1e1e1e",
+            cursor="hand2",
+            command=self.go_back,
+        )
+        back_button.pack(side="left", expand=True, fill="x", padx=5)
+
+    def fill_random(self):
+        try:
+            size = int(self.size_entry.get())
+        except ValueError:
+            size = 0
+        if size < 2:
+            tk.messagebox.showerror("Error", "Please enter a length of at least 2.")
+            return
+        numbers = [random.randint(1, max(size, 100)) for _ in range(size)]
+        self.input_entry.delete(0, tk.END)
+        self.input_entry.insert(0, ", ".join(map(str, numbers)))
+
+    def start_race(self):
+        # Parse input
+        try:
+            self.numbers = [int(x.strip()) for x in self.input_entry.get().split(",")]
+        except ValueError:
+            tk.messagebox.showerror(
+                "Error", "Invalid input. Please enter comma-separated numbers."
+            )
+            return
+        self.names = [name for name, selected in self.choices.items() if selected.get()]
+        if not 2 <= len(self.names) <= MAX_LANES:
+            tk.messagebox.showerror(
+                "Error", f"Please pick between 2 and {MAX_LANES} algorithms."
+            )
+            return
+
+        # Stop what is left of the previous race
+        self.stop_race()
+        self.start_button.config(state="disabled")
+        self.status_label.config(text="Recording the runs...")
+
+        # Record every run in its own process; the workers exit once the last
+        # trace is back, or are terminated by stop_race
+        workers = min(len(self.names), os.cpu_count() or 1)
+        self.pool = multiprocessing.Pool(processes=workers)
+        self.results = [
+            self.pool.apply_async(
+                record, (name.lower().replace(" ", "_"), self.numbers)
+            )
+            for name in self.names
+        ]
+        self.pool.close()
+        self.poll_id = self.root.after(POLL, self.collect)
+
+    def collect(self):
+        """Start the race once every trace has been recorded."""
+        self.poll_id = None
+        if not all(result.ready() for result in self.results):
+            self.poll_id = self.root.after(POLL, self.collect)
+            return
+        results, self.results = self.results, None
+        self.pool.join()
+        self.pool = None
+        try:
+            timelines = [result.get() for result in results]
+        except Exception as error:
+            tk.messagebox.showerror("Error", f"The race could not be recorded: {error}")
+            self.status_label.config(text="")
+            self.start_button.config(state="normal")
+            return
+        self.status_label.config(text="")
+        self.create_lanes(timelines)
+        self.pause_button.config(state="normal", text="Pause")
+        self.speed_control.attach(self.race)
+        self.race.play()
+
+    def create_lanes(self, timelines):
+        """Lay out one panel per algorithm and the race that drives them."""
+        release_renderers(self.root)
+        self.lanes_frame = tk.Frame(self.viz_frame, bg="#1e1e1e")
+        self.lanes_frame.pack(expand=True, fill="both")
+        columns = 2 if len(timelines) <= 4 else 3
+        rows = math.ceil(len(timelines) / columns)
+        for column in range(columns):
+            self.lanes_frame.columnconfigure(column, weight=1, uniform="lane")
+        for row in range(rows):
+            self.lanes_frame.rowconfigure(row, weight=1, uniform="lane")
+
+        players = []
+        for index, (name, timeline) in enumerate(zip(self.names, timelines)):
+            lane = tk.Frame(self.lanes_frame, bg="#2e2e2e")
+            lane.grid(
+                row=index // columns,
+                column=index % columns,
+                sticky="nsew",
+                padx=5,
+                pady=5,
+            )
+            status = tk.Label(lane, fg="#ffffff", bg="#2e2e2e")
+            status.pack(side="top")
+
+            # The chart takes whatever room the grid leaves it
+            chart_frame = tk.Frame(lane, bg="#2e2e2e", width=1, height=1)
+            chart_frame.pack_propagate(False)
+            chart_frame.pack(side="top", expand=True, fill="both")
+            renderer = create_renderer("bars", chart_frame, self.backend, title=name)
+            renderer.reset(self.numbers)
+
+            metrics_panel = MetricsPanel(
+                lane,
+                names=("Comparisons", "Swaps", "Writes", "Aux memory"),
+                columns=2,
+                bg="#2e2e2e",
+            )
+            metrics_panel.pack(side="bottom", fill="x")
+
+            timeline.trace.seal()
+            player = Player(
+                chart_frame,
+                renderer,
+                timeline,
+                on_step=self.progress(status),
+                on_finish=self.lane_finish(status, timeline.steps, timelines),
+            )
+            metrics_panel.attach(player)
+            player.seek(0)
+            players.append(player)
+
+        self.race = Race(self.viz_frame, players, on_finish=self.finish)
+
+    def progress(self, status):
+        def show(position, total):
+            if position < total:
+                status.config(text=f"{position / max(total, 1):.0%}")
+
+        return show
+
+    def lane_finish(self, status, steps, timelines):
+        # Lanes that need fewer steps finish first
+        place = 1 + sum(timeline.steps < steps for timeline in timelines)
+
+        def finish():
+            status.config(text=f"Finished #{place} in {steps:,} steps")
+
+        return finish
+
+    def finish(self):
+        self.start_button.config(state="normal")
+        self.pause_button.config(state="disabled", text="Pause")
+
+    def stop_race(self):
+        """Cancel the race on screen, or the one being recorded, and clear it."""
+        if self.poll_id is not None:
+            self.root.after_cancel(self.poll_id)
+            self.poll_id = None
+        if self.pool is not None:
+            self.pool.terminate()  # Also stops the runs still being recorded
+            self.pool.join()
+            self.pool = None
+            self.results = None
+        if self.race is not None:
+            self.race.cancel()
+            self.race = None
+        self.speed_control.detach()
+        if self.lanes_frame is not None:
+            release_renderers(self.root)
+            self.lanes_frame.destroy()
+            self.lanes_frame = None
+
+    def toggle_pause(self):
+        if self.race is None:
+            return
+        paused = self.race.toggle()
+        self.pause_button.config(text="Resume" if paused else "Pause")
+
+    def go_back(self):
+        """Navigate back to the previous page."""
+        from algorithmPage import AlgorithmPage  # Adjust import as necessary
+
+        # Stop the race and free the figures of this page before its widgets
+        # go away
+        self.stop_race()
+        cancel_schedulers(self.root)
+        release_renderers(self.root)
+
+        # Clear current widgets in the root window
+        for widget in self.root.winfo_children():
+            widget.destroy()
+
+        AlgorithmPage(self.root, self.prev_page)  # Load the previous page
+
+
+def create_algorithm_page(root, prev_page, backend=None):
+    """Wrapper function to create the Sorting Race page."""
+    SortingRaceVisualization(root, prev_page, backend)
+
+
+# If you want to run this file standalone for testing
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.title("Sorting Race")
+    root.geometry("1000x700")
+    SortingRaceVisualization(root, "Sorting Algorithms")
+    root.mainloop()
@@ -1,50 +1,18 @@
 import tkinter as tk
 from tkinter import ttk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import time
-import threading
-import queue
-
-
-class Stack:
-    def __init__(self):
-        self.items = []
-
-    def push(self, item):
-        self.items.append(item)
-
-    def pop(self):
-        if not self.is_empty():
-            return self.items.pop()
-        return None
-
-    def peek(self):
-        if not self.is_empty():
-            return self.items[-1]
-        return None
-
-    def is_empty(self):
-        return len(self.items) == 0
-
-    def size(self):
-        return len(self.items)
-
-    def get_items(self):
-        return self.items.copy()
+from rendering.backends import create_renderer, release_renderers
+from playback.scheduler import Scheduler, cancel_schedulers
+from codecrux.algorithms.structures import Stack
+from components.speedControl import SpeedControl
 
 
 class StackVisualization:
-    def __init__(self, root, prev_page):
+    def __init__(self, root, prev_page, backend=None):
         self.root = root
         self.prev_page = prev_page
+        self.backend = backend
         self.stack = Stack()
-        self.is_paused = False
-        self.speed = 0.5
-        self.operation_thread = None
-        self.step_mode = False
-        self.step_event = threading.Event()
-        self.update_queue = queue.Queue()
+        self.scheduler = None
         self.create_algorithm_page()
 
     def create_algorithm_page(self):
@@ -99,18 +67,8 @@ class StackVisualization:
         button_frame.pack(fill="x", padx=20, pady=10)
 
         # Speed control slider
-        speed_label = tk.Label(button_frame, text="Speed:", fg="#ffffff", bg="#1e1e1e")
-        speed_label.pack(side="left")
-        self.speed_slider = ttk.Scale(
-            button_frame,
-            from_=0.1,
-            to=2.0,
-            orient="horizontal",
-            length=200,
-            value=0.5,
-            command=self.update_speed,
-        )
-        self.speed_slider.pack(side="left", padx=(10, 0))
+        self.speed_control = SpeedControl(button_frame)
+        self.speed_control.pack(side="left")
 
         # Operation button
         self.operation_button = tk.Button(
@@ -183,12 +141,19 @@ class StackVisualization:
         )
         back_button.pack(side="left", expand=True, fill="x", padx=5)
 
+        # Create the stack renderer
+        self.renderer = create_renderer(
+            "cells",
+            self.viz_frame,
+            self.backend,
+            title="Stack Visualization",
+            orientation="vertical",
+            empty_text="Stack is empty",
+        )
+
         # Create initial visualization
         self.visualize()
 
-        # Start the update loop
-        self.root.after(100, self.update_gui)
-
     def update_input_visibility(self, *args):
         if self.operation_var.get() == "Push":
             self.input_frame.pack(pady=(0, 10))
@@ -215,108 +180,56 @@ class StackVisualization:
         self.operation_button.config(state="disabled")
         self.pause_button.config(state="normal")
 
-        # Start operation in a separate thread
-        self.operation_thread = threading.Thread(
-            target=self.perform_operation, args=(operation,)
+        # Stop what is left of the previous run
+        if self.scheduler is not None:
+            self.scheduler.cancel()
+
+        # Run the operation from the Tk thread, one step per tick
+        self.scheduler = Scheduler(
+            self.viz_frame,
+            self.perform_operation(operation),
+            self.update_gui,
+            coalesce=("highlight",),
+            on_finish=self.finish,
         )
-        self.operation_thread.start()
+        self.speed_control.attach(self.scheduler)
+        self.scheduler.play()
 
     def perform_operation(self, operation):
         if operation == "Push":
             value = int(self.value_entry.get())
             self.stack.push(value)
-            self.update_queue.put(("highlight", len(self.stack.get_items()) - 1))
+            yield "highlight", len(self.stack.get_items()) - 1
         elif operation == "Pop":
             popped_value = self.stack.pop()
-            self.update_queue.put(("highlight", len(self.stack.get_items())))
-            self.update_queue.put(("message", f"Popped value: {popped_value}"))
+            yield "highlight", len(self.stack.get_items())
+            yield "message", f"Popped value: {popped_value}"
         elif operation == "Peek":
             peeked_value = self.stack.peek()
-            self.update_queue.put(("highlight", len(self.stack.get_items()) - 1))
-            self.update_queue.put(("message", f"Top element: {peeked_value}"))
-
-        time.sleep(self.speed)
-        self.update_queue.put(("enable_buttons", None))
-
-    def update_gui(self):
-        try:
-            while True:
-                action, data = self.update_queue.get_nowait()
-                if action == "highlight":
-                    self.visualize(highlight=data)
-                elif action == "message":
-                    tk.messagebox.showinfo("Operation Result", data)
-                elif action == "enable_buttons":
-                    self.operation_button.config(state="normal")
-                    self.pause_button.config(state="disabled")
-        except queue.Empty:
-            pass
-        finally:
-            self.root.after(100, self.update_gui)
+            yield "highlight", len(self.stack.get_items()) - 1
+            yield "message", f"Top element: {peeked_value}"
 
-    def visualize(self, highlight=None):
-        # Clear previous visualization
-        for widget in self.viz_frame.winfo_children():
-            widget.destroy()
+    def update_gui(self, action, data):
+        if action == "highlight":
+            self.visualize(highlight=data)
+        elif action == "message":
+            tk.messagebox.showinfo("Operation Result", data)
 
-        # Create matplotlib figure and axis
-        fig, ax = plt.subplots(figsize=(6, 8))
-        canvas = FigureCanvasTkAgg(fig, master=self.viz_frame)
-        canvas_widget = canvas.get_tk_widget()
-        canvas_widget.pack(fill=tk.BOTH, expand=True)
-        canvas_widget.configure(height=400, width=400)
+    def visualize(self, highlight=None):
+        colors = {}
+        if highlight is not None:
+            colors[highlight] = "yellow"
+        self.renderer.update(self.stack.get_items(), colors)
 
-        items = self.stack.get_items()
-        n = len(items)
-
-        if n == 0:
-            ax.text(0.5, 0.5, "Stack is empty", ha="center", va="center", fontsize=12)
-        else:
-            for i, item in enumerate(items):
-                color = "lightblue" if i != highlight else "yellow"
-                ax.add_patch(
-                    plt.Rectangle(
-                        (0.2, i),
-                        0.6,
-                        0.8,
-                        fill=True,
-                        facecolor=color,
-                        edgecolor="black",
-                        linewidth=2,
-                    )
-                )
-                ax.text(
-                    0.5,
-                    i + 0.4,
-                    str(item),
-                    ha="center",
-                    va="center",
-                    fontsize=12,
-                    fontweight="bold",
-                )
-
-        ax.set_xlim(0, 1)
-        ax.set_ylim(0, max(n, 1))
-        ax.axis("off")
-        ax.set_title("Stack Visualization")
-        canvas.draw()
+    def finish(self):
+        self.operation_button.config(state="normal")
+        self.pause_button.config(state="disabled")
 
     def toggle_pause(self):
-        if not hasattr(self, "pause_event"):
-            self.pause_event = threading.Event()
-            self.pause_event.set()
-
-        if self.is_paused:
-            self.pause_event.set()
-            self.pause_button.config(text="Pause")
-            self.is_paused = False
-        else:
-            self.pause_event.clear()
-            self.pause_button.config(text="Resume")
-            self.is_paused = True
-
-    def update_speed(self, value):
-        self.speed = float(value)
+        if self.scheduler is None:
+            return
+        paused = self.scheduler.toggle()
+        self.pause_button.config(text="Resume" if paused else "Pause")
 
     def show_documentation(self):
         doc_window = tk.Toplevel(self.root)
@@ -396,6 +309,11 @@ class StackVisualization:
         """Navigate back to the previous page."""
         from algorithmPage import AlgorithmPage  # Adjust import as necessary
 
+        # Stop the running visualization and free the figures of this page
+        # before its widgets go away
+        cancel_schedulers(self.root)
+        release_renderers(self.root)
+
         # Clear current widgets in the root window
         for widget in self.root.winfo_children():
             widget.destroy()
@@ -403,9 +321,9 @@ class StackVisualization:
         AlgorithmPage(self.root, self.prev_page)  # Load the previous page
 
 
-def create_algorithm_page(root, prev_page):
+def create_algorithm_page(root, prev_page, backend=None):
     """Wrapper function to create the Stack operations visualization page."""
-    StackVisualization(root, prev_page)
+    StackVisualization(root, prev_page, backend)
 
 
 # If you want to run this file standalone for testing
@@ -0,0 +1,211 @@
+import gc
+import tkinter as tk
+import tracemalloc
+
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from rendering import figure_pool
+from rendering.figure_pool import FigurePool, pool_for, release
+
+PAGES = 10
+
+
+class StubWidget:
+    """Stands in for the Tk widget of a canvas: records how it is packed."""
+
+    def __init__(self):
+        self.manager = ""
+        self.packed_in = None
+        self.size = None
+        self.exists = True
+
+    def configure(self, width, height):
+        self.size = (width, height)
+
+    def pack(self, in_, **options):
+        self.manager = "pack"
+        self.packed_in = in_
+
+    def pack_forget(self):
+        self.manager = ""
+        self.packed_in = None
+
+    def lift(self):
+        pass
+
+    def winfo_exists(self):
+        return self.exists
+
+    def winfo_manager(self):
+        return self.manager
+
+    def destroy(self):
+        self.exists = False
+
+
+class StubCanvas(FigureCanvasAgg):
+    """An Agg canvas with a stub widget, so that no display is needed."""
+
+    def __init__(self, figure, master):
+        super().__init__(figure)
+        self.master = master
+        self.widget = StubWidget()
+
+    def get_tk_widget(self):
+        return self.widget
+
+
+class StubWindow:
+    def __init__(self, name):
+        self.name = name
+
+    def __str__(self):
+        return self.name
+
+    def winfo_toplevel(self):
+        return self
+
+
+class StubFrame:
+    def __init__(self, window):
+        self.window = window
+
+    def winfo_toplevel(self):
+        return self.window
+
+
+@pytest.fixture
+def pool():
+    return FigurePool(StubCanvas)
+
+
+def show_page(pool, frame, figures=3):
+    """Acquire the figures of a page of bar charts and draw them."""
+    canvases = []
+    for _ in range(figures):
+        fig, ax, canvas = pool.acquire(frame, figsize=(4, 2))
+        assert len(fig.axes) == 1 and not ax.patches
+        canvas.mpl_connect("resize_event", lambda event: None)
+        ax.bar(range(20), range(20))
+        canvas.draw()
+        canvases.append(canvas)
+    return canvases
+
+
+def test_acquire_packs_into_the_frame(pool):
+    window = StubWindow(".")
+    frame = StubFrame(window)
+    fig, ax, canvas = pool.acquire(frame, figsize=(4, 2), size=(300, 200))
+    assert canvas.master is window  # Child of the window, not of the frame
+    assert canvas.widget.packed_in is frame
+    assert canvas.widget.size == (300, 200)
+    assert pool.figures == [(fig, canvas, figure_pool._connections(canvas))]
+
+
+def test_release_keeps_canvases_for_reuse(pool):
+    window = StubWindow(".")
+    canvases = show_page(pool, StubFrame(window))
+    pool.release()
+    assert pool.figures == []
+    assert [canvas for _, canvas, _ in pool.idle] == canvases
+    assert all(canvas.widget.winfo_manager() == "" for canvas in canvases)
+    assert all(not fig.axes for fig, _, _ in pool.idle)
+
+    frame = StubFrame(window)
+    again = show_page(pool, frame)
+    assert set(map(id, again)) == set(map(id, canvases))
+    assert all(canvas.widget.packed_in is frame for canvas in again)
+    assert pool.idle == []
+
+
+def test_reused_figures_take_the_new_size(pool):
+    frame = StubFrame(StubWindow("."))
+    pool.acquire(frame, figsize=(4, 2))
+    pool.release()
+    fig, _, canvas = pool.acquire(frame, figsize=(8, 4))
+    assert tuple(fig.get_size_inches()) == (8, 4)
+    assert canvas.widget.size == (int(fig.bbox.width), int(fig.bbox.height))
+
+
+def test_release_drops_renderer_callbacks(pool):
+    frame = StubFrame(StubWindow("."))
+    (canvas,) = show_page(pool, frame, figures=1)
+    pool.release()
+    (_, _, builtin) = pool.idle[0]
+    for _ in range(PAGES):
+        show_page(pool, frame, figures=1)
+        pool.release()
+    assert figure_pool._connections(canvas) == builtin
+
+
+def test_destroyed_canvases_are_dropped(pool):
+    frame = StubFrame(StubWindow("."))
+    canvases = show_page(pool, frame)
+    canvases[0].widget.destroy()
+    pool.release()
+    assert len(pool.idle) == 2
+    for canvas in canvases:
+        canvas.widget.destroy()
+    fig, ax, canvas = pool.acquire(frame, figsize=(4, 2))
+    assert canvas not in canvases
+    assert pool.idle == []
+
+
+def test_one_pool_per_window(monkeypatch):
+    monkeypatch.setattr(figure_pool, "_pools", {})
+    first, second = StubWindow(".first"), StubWindow(".second")
+    pool = pool_for(StubFrame(first))
+    assert pool_for(StubFrame(first)) is pool
+    assert pool_for(second) is not pool
+
+    pool.canvas_class = StubCanvas
+    show_page(pool, StubFrame(first), figures=2)
+    release(StubFrame(second))  # Another window's figures stay in use
+    assert len(pool.figures) == 2
+    release(StubFrame(first))
+    assert (len(pool.figures), len(pool.idle)) == (0, 2)
+    release(StubWindow(".unknown"))  # A window without figures
+
+
+def test_repeated_pages_keep_memory_flat(pool):
+    frame = StubFrame(StubWindow("."))
+    show_page(pool, frame, figures=1)
+    pool.release()
+    tracemalloc.start()
+    try:
+        show_page(pool, frame, figures=1)
+        pool.release()
+        gc.collect()
+        baseline = tracemalloc.get_traced_memory()[0]
+        for _ in range(PAGES):
+            show_page(pool, frame, figures=1)
+            pool.release()
+        gc.collect()
+        growth = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+    assert growth < 512 * 1024, f"figures are leaking: {growth / 1024:.0f} KiB"
+
+
+def test_tk_canvases_are_reused():
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("no display")
+    root.withdraw()
+    try:
+        for _ in range(2):
+            frame = tk.Frame(root)
+            frame.pack()
+            show_page(pool_for(frame), frame)
+            release(frame)
+            frame.destroy()
+        idle = pool_for(root).idle
+        assert len(idle) == 3
+        widgets = [canvas.get_tk_widget() for _, canvas, _ in idle]
+        assert all(widget.winfo_manager() == "" for widget in widgets)
+        assert len(root.winfo_children()) == 3  # The canvases, no frame left over
+    finally:
+        release(root)
+        root.destroy()
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from codecrux.algorithms import sorting
+from codecrux.algorithms.hooks import EventLog
+from rendering.base import BASE_COLOR, DIM_COLOR, TreeRenderer, tree_layout
+from rendering.buckets import BucketLayout
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 7, 10, 127])
+def test_tree_layout(count):
+    x, y = tree_layout(count)
+    assert len(x) == len(y) == count
+    assert ((0 < x) & (x < 1) & (0 < y) & (y < 1)).all()
+    level = np.floor(np.log2(np.arange(count) + 1))
+    for i in range(1, count):
+        parent = (i - 1) // 2
+        assert y[i] > y[parent]  # One level further down
+        assert (x[i] < x[parent]) == (i % 2 == 1)  # Left child to the left
+    # A level is spread evenly over the width, in index order
+    for depth in np.unique(level):
+        row = x[level == depth]
+        assert np.allclose(row, (np.arange(len(row)) + 0.5) / 2**depth)
+    assert not x.flags.writeable
+
+
+def test_tree_layout_is_shared():
+    assert tree_layout(15)[0] is tree_layout(15)[0]
+
+
+class StubTree(TreeRenderer):
+    """Records what the backend would be asked to draw."""
+
+    def _create_nodes(self, x, y):
+        self.created = len(x)
+        self.drawn_labels = [None] * len(x)
+        self.drawn_colors = [None] * len(x)
+
+    def _set_label(self, i, label):
+        self.drawn_labels[i] = label
+
+    def _set_color(self, i, color):
+        self.drawn_colors[i] = color
+
+    def _render(self):
+        pass
+
+
+def test_tree_draws_the_top_levels_only():
+    tree = StubTree("Heap")
+    tree.reset(list(range(300)))
+    assert tree.created == TreeRenderer.MAX_NODES
+    assert tree.drawn_labels[:3] == ["0", "1", "2"]
+
+
+def test_tree_dims_nodes_past_the_heap():
+    tree = StubTree("Heap")
+    data = [9, 7, 8, 1, 2, 3]
+    tree.reset(data)
+    tree.update(data, {0: "r", 4: "g"}, size=4)
+    expected = ["r", BASE_COLOR, BASE_COLOR, BASE_COLOR, DIM_COLOR, DIM_COLOR]
+    assert tree.drawn_colors == expected
+    # Only the node that changed is handed to the backend
+    tree.update(data, {0: "r", 4: "g"}, size=3)
+    assert tree.touched == 1
+    assert tree.drawn_colors[3] == DIM_COLOR
+
+
+def test_bucket_layout_matches_bucket_sort():
+    values = [0.42, 0.32, 0.23, 0.52, 0.25, 0.47, 0.51, 0.0, 1.0, -3, 7, 7]
+    layout = BucketLayout(values, 5)
+    log = EventLog()
+    sorting.bucket_sort(list(values), log, count=5)
+    # The slot every element is first dropped into lies in its bucket's run
+    drops = [event[1] for event in log.events if event[0] == "write"][: len(values)]
+    for k, slot in zip(layout.index, drops):
+        assert layout.offsets[k] <= slot < layout.offsets[k + 1]
+    assert layout.offsets[-1] == len(values)
+    assert set(layout.stripes) == {
+        slot for slot, k in zip(drops, layout.index) if k % 2 == 1
+    }
@@ -0,0 +1,236 @@
+import inspect
+import itertools
+import math
+import random
+import sys
+
+import pytest
+
+from codecrux.algorithms import searching, sorting
+from codecrux.algorithms.hooks import EventLog, OperationCounter
+
+# Every sort and variant the screens and the benchmark run: (name, options)
+SORTS = [
+    ("bubble_sort", {}),
+    ("selection_sort", {}),
+    ("insertion_sort", {}),
+    ("merge_sort", {}),
+    ("bottom_up_merge_sort", {}),
+    ("bottom_up_merge_sort", {"natural": True}),
+    ("heap_sort", {}),
+    ("heap_sort", {"floyd": True}),
+    ("counting_sort", {}),
+    ("radix_sort", {}),
+    ("bucket_sort", {}),
+] + [
+    ("quick_sort", {"pivot": pivot, "three_way": three_way, "fallback": fallback})
+    for pivot, three_way, fallback in itertools.product(
+        sorting.PIVOTS, (False, True), (False, True)
+    )
+]
+
+INPUTS = {
+    "empty": [],
+    "single": [7],
+    "duplicates": [3, 1, 3, 3, 0, 1, 3, 0],
+    "sorted": list(range(20)),
+    "reversed": list(range(20, 0, -1)),
+    "negative": [-5, 3, -1, 0, -5, 2, -12],
+    "random": random.Random(0).choices(range(100), k=200),
+}
+
+NON_NEGATIVE = {"radix_sort"}  # Sorts of non-negative integers only
+
+
+def sort_id(case):
+    name, options = case
+    return name + "".join(f"-{key}={value}" for key, value in options.items())
+
+
+@pytest.mark.parametrize("case", SORTS, ids=sort_id)
+@pytest.mark.parametrize("shape", INPUTS)
+def test_sorts_match_sorted(case, shape):
+    name, options = case
+    values = list(INPUTS[shape])
+    if name in NON_NEGATIVE and min(values, default=0) < 0:
+        pytest.skip(f"{name} sorts non-negative integers")
+    if options.get("pivot") == "random":
+        options = dict(options, rng=random.Random(0))
+    result = getattr(sorting, name)(values, OperationCounter(), **options)
+    assert result is values
+    assert values == sorted(INPUTS[shape])
+
+
+def test_bucket_sort_floats():
+    values = [0.42, 0.32, 0.23, 0.52, 0.25, 0.47, 0.51, 0.0, 1.0]
+    assert sorting.bucket_sort(list(values)) == sorted(values)
+
+
+@pytest.mark.parametrize(
+    "name, counts",
+    [
+        ("bubble_sort", (3, 2, 10, 4, 0, 0)),
+        ("selection_sort", (3, 3, 12, 6, 0, 0)),
+        ("insertion_sort", (3, 0, 5, 4, 0, 0)),
+        ("merge_sort", (3, 0, 8, 5, 5, 3)),
+    ],
+)
+def test_operation_counts(name, counts):
+    counter = OperationCounter()
+    getattr(sorting, name)([3, 1, 2], counter)
+    assert counter.counts() == dict(
+        zip(("comparisons", "swaps", "reads", "writes", "allocated", "peak"), counts)
+    )
+
+
+def test_counts_start_at_zero():
+    assert set(OperationCounter().counts().values()) == {0}
+
+
+def test_frees_balance_allocations():
+    counter = OperationCounter()
+    sorting.counting_sort([4, -2, 4, 0, 9], counter)
+    assert counter.allocated == counter.peak == 17  # 12 counts and 5 outputs
+    assert counter.live == 0
+
+
+def quick_sort_shapes(n):
+    """Inputs that defeat simple pivot choices, ``n`` elements each."""
+    return {
+        "sorted": list(range(n)),
+        "reversed": list(range(n, 0, -1)),
+        "all-equal": [5] * n,
+        "organ-pipe": list(range(n // 2)) + list(range(n - n // 2, 0, -1)),
+    }
+
+
+@pytest.mark.parametrize("shape", ["sorted", "reversed", "all-equal"])
+def test_three_way_median_of_three_stays_n_log_n(shape):
+    n = 2048
+    values = quick_sort_shapes(n)[shape]
+    counter = OperationCounter()
+    sorting.quick_sort(values, counter, pivot="median-of-three", three_way=True)
+    assert values == sorted(values)
+    assert counter.comparisons <= 2 * n * math.log2(n)
+
+
+@pytest.mark.parametrize("pivot", sorting.PIVOTS)
+@pytest.mark.parametrize("three_way", [False, True])
+@pytest.mark.parametrize("shape", ["sorted", "reversed", "all-equal", "organ-pipe"])
+def test_fallback_bounds_comparisons(pivot, three_way, shape):
+    n = 2048
+    values = quick_sort_shapes(n)[shape]
+    expected = sorted(values)
+    counter = OperationCounter()
+    sorting.quick_sort(
+        values,
+        counter,
+        pivot=pivot,
+        three_way=three_way,
+        fallback=True,
+        rng=random.Random(0),
+    )
+    assert values == expected
+    assert counter.comparisons <= 5 * n * math.log2(n)
+
+
+def test_recursion_depth_is_logarithmic():
+    # Sorted input with the last element as pivot splits off one element per
+    # partition; recursing on that side rather than looping would go n deep
+    n = 1024
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(len(inspect.stack()) + n.bit_length() + 20)
+    try:
+        values = sorting.quick_sort(list(range(n, 0, -1)), pivot="last")
+    finally:
+        sys.setrecursionlimit(limit)
+    assert values == list(range(1, n + 1))
+
+
+@pytest.mark.parametrize("three_way", [False, True])
+def test_pivot_highlight_never_moves(three_way):
+    log = EventLog()
+    values = random.Random(1).choices(range(20), k=300)
+    sorting.quick_sort(values, log, pivot="median-of-three", three_way=three_way)
+    lit = -1
+    for event in log.events:
+        if event[0] == "pivot":
+            lit = event[1]
+        elif event[0] == "swap":
+            assert lit not in event[1:3], "the pivot moved while highlighted"
+
+
+@pytest.mark.parametrize("search", [searching.linear_search, searching.binary_search])
+def test_searches(search):
+    values = [1, 3, 4, 8, 9, 12]
+    for index, value in enumerate(values):
+        assert search(values, value) == index
+    assert search(values, 5) == -1
+    assert search([], 5) == -1
+
+
+def test_search_comparisons():
+    counter = OperationCounter()
+    searching.linear_search([5, 3, 9, 1], 9, counter)
+    assert counter.comparisons == 3
+    counter = OperationCounter()
+    searching.binary_search(list(range(1024)), -1, counter)
+    assert counter.comparisons == 10
+
+
+@pytest.mark.parametrize("natural", [False, True])
+@pytest.mark.parametrize("shape", INPUTS)
+def test_bottom_up_merge_sort_allocates_once(natural, shape):
+    values = list(INPUTS[shape])
+    log = EventLog()
+    sorting.bottom_up_merge_sort(values, log, natural=natural)
+    assert values == sorted(INPUTS[shape])
+    allocations = [event for event in log.events if event[0] == "allocate"]
+    assert allocations == [("allocate", len(values), 1)]
+    assert [event for event in log.events if event[0] == "free"] == [
+        ("free", len(values))
+    ]
+
+
+def is_max_heap(values, size):
+    return all(values[(i - 1) // 2] >= values[i] for i in range(1, size))
+
+
+@pytest.mark.parametrize("sift", [sorting.sift_down, sorting.floyd_sift_down])
+def test_sifts_build_valid_heaps(sift):
+    rng = random.Random(3)
+    for n in range(1, 70):
+        values = rng.choices(range(20), k=n)
+        for root in range(n // 2 - 1, -1, -1):
+            sift(values, 0, root, n, OperationCounter())
+        assert is_max_heap(values, n)
+        # A small element sifted down from the root, as in the sort's
+        # extraction phase, leaves a heap again
+        values[0] = -1
+        sift(values, 0, 0, n, OperationCounter())
+        assert is_max_heap(values, n)
+
+
+def test_floyd_sift_down_compares_less():
+    values = random.Random(4).sample(range(10000), 2000)
+    counts = {}
+    for floyd in (False, True):
+        counter = OperationCounter()
+        assert sorting.heap_sort(list(values), counter, floyd=floyd) == sorted(values)
+        counts[floyd] = counter.comparisons
+    assert counts[True] < 0.75 * counts[False]
+
+
+def test_heap_sort_marks_the_shrinking_heap():
+    log = EventLog()
+    values = random.Random(5).choices(range(50), k=40)
+    sorting.heap_sort(values, log)
+    marked = [event[1:] for event in log.events if event[0] == "sorted_range"]
+    assert marked == [(i, i + 1) for i in range(39, 0, -1)] + [(0, 40)]
+
+
+def test_bucket_indices():
+    assert sorting.bucket_indices([], 4) == []
+    assert sorting.bucket_indices([3, 3, 3], 4) == [0, 0, 0]
+    assert sorting.bucket_indices([0, 1, 2, 3, 4, 7, 8], 4) == [0, 0, 1, 1, 2, 3, 3]
+    assert sorting.bucket_indices([-1.0, 0.5, 1.0], 2) == [0, 1, 1]
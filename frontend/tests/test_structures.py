@@ -0,0 +1,82 @@
+import pytest
+
+from codecrux.algorithms.hooks import EventLog
+from codecrux.algorithms.structures import (
+    DoublyLinkedList,
+    Queue,
+    SinglyLinkedList,
+    Stack,
+)
+
+
+def test_stack_positions():
+    log = EventLog()
+    stack = Stack(log)
+    stack.push(4)
+    stack.push(7)
+    assert stack.peek() == 7
+    assert stack.pop() == 7
+    assert stack.pop() == 4
+    assert stack.pop() is None
+    assert log.events == [
+        ("write", 0, 4, 0),
+        ("write", 1, 7, 0),
+        ("read", 1, 0),
+        ("read", 1, 0),
+        ("read", 0, 0),
+    ]
+
+
+def test_queue_positions():
+    log = EventLog()
+    queue = Queue(log)
+    for item in (4, 7, 9):
+        queue.enqueue(item)
+    assert (queue.front(), queue.rear()) == (4, 9)
+    assert queue.dequeue() == 4
+    assert queue.get_items() == [7, 9]
+    assert log.events == [
+        ("write", 0, 4, 0),
+        ("write", 1, 7, 0),
+        ("write", 2, 9, 0),
+        ("read", 0, 0),
+        ("read", 2, 0),
+        ("read", 0, 0),
+    ]
+
+
+@pytest.mark.parametrize("cls", [SinglyLinkedList, DoublyLinkedList])
+def test_linked_list_positions(cls):
+    log = EventLog()
+    linked = cls(log)
+    linked.insert_at_end(1)
+    linked.insert_at_end(2)
+    linked.insert_at_beginning(0)
+    linked.insert_at_position(5, 2)
+    assert linked.traverse() == [0, 1, 5, 2]
+    writes = [event for event in log.events if event[0] == "write"]
+    assert writes == [
+        ("write", 0, 1, 0),
+        ("write", 1, 2, 0),
+        ("write", 0, 0, 0),
+        ("write", 2, 5, 0),
+    ]
+
+    log.events.clear()
+    assert linked.search(5) == 2
+    assert linked.search(8) == -1
+    compares = [event[1] for event in log.events]
+    assert compares == [0, 1, 2, 0, 1, 2, 3]
+
+
+@pytest.mark.parametrize("cls", [SinglyLinkedList, DoublyLinkedList])
+def test_linked_list_deletes(cls):
+    linked = cls()
+    for item in range(5):
+        linked.insert_at_end(item)
+    linked.delete_at_beginning()
+    linked.delete_at_end()
+    linked.delete_at_position(1)
+    assert linked.traverse() == [1, 3]
+    with pytest.raises(IndexError):
+        linked.insert_at_position(9, 6)
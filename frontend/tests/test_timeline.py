@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from codecrux.algorithms import sorting
+from codecrux.algorithms.hooks import OperationCounter
+from playback.timeline import ArrayState, Timeline
+from playback.trace import Trace, TraceHooks
+
+NUMBERS = random.Random(2).choices(range(-50, 50), k=60)
+
+# Runs that exercise every kind of event: auxiliary buffers on display and on
+# a second row, memory that is never displayed, pivots and sorted ranges
+RUNS = [
+    ("quick_sort", None, {"pivot": "median-of-three"}),
+    ("heap_sort", None, {}),
+    ("counting_sort", None, {}),
+    ("bottom_up_merge_sort", 1, {"natural": True}),
+    ("merge_sort", None, {}),
+]
+
+
+def recorded(algorithm, second, options, every=16):
+    timeline = Timeline(Trace(NUMBERS), every)
+    hooks = TraceHooks(timeline.append, second=second)
+    getattr(sorting, algorithm)(list(NUMBERS), hooks, **options)
+    return timeline
+
+
+def replay(trace, position):
+    """State and highlight after the first ``position`` events, from scratch."""
+    state = ArrayState(trace.initial)
+    highlight = ()
+    for index in range(position):
+        highlight = state.apply(*trace[index])
+    return state, highlight
+
+
+@pytest.mark.parametrize("run", RUNS, ids=[run[0] for run in RUNS])
+def test_seek_matches_replay(run):
+    timeline = recorded(*run)
+    positions = random.Random(0).sample(range(len(timeline) + 1), 50)
+    positions += [0, 1, len(timeline), timeline.every, timeline.every + 1]
+    state = ArrayState(())
+    for position in positions:
+        highlight = timeline.seek(state, position)
+        expected, expected_highlight = replay(timeline.trace, position)
+        assert state.snapshot() == expected.snapshot(), position
+        assert highlight == expected_highlight, position
+
+
+@pytest.mark.parametrize("run", RUNS, ids=[run[0] for run in RUNS])
+def test_previous_step(run):
+    timeline = recorded(*run)
+    state = ArrayState(timeline.trace.initial)
+    ends = [0]  # Position just after each step
+    for index in range(len(timeline)):
+        if state.apply(*timeline.trace[index]) is not None:
+            ends.append(index + 1)
+    assert len(ends) - 1 == timeline.steps
+    for position in range(len(timeline) + 1):
+        before = max(end for end in ends if end < position) if position else 0
+        assert timeline.previous_step(position) == before, position
+
+
+def test_keyframes_match_a_timeline_built_at_once():
+    # Keyframes added while appending are those of the finished trace
+    timeline = recorded("heap_sort", None, {})
+    rebuilt = Timeline(timeline.trace, timeline.every)
+    assert rebuilt.keyframes == timeline.keyframes
+    assert rebuilt.steps == timeline.steps
+    assert rebuilt.state.snapshot() == timeline.state.snapshot()
+
+
+@pytest.mark.parametrize("run", RUNS, ids=[run[0] for run in RUNS])
+def test_counts_match_operation_counter(run):
+    algorithm, second, options = run
+    timeline = recorded(*run)
+    counter = OperationCounter()
+    getattr(sorting, algorithm)(list(NUMBERS), counter, **options)
+    comparisons, swaps, writes, allocated, live, peak = timeline.state.counts()
+    assert (comparisons, swaps, writes) == (
+        counter.comparisons,
+        counter.swaps,
+        counter.writes,
+    )
+    assert (allocated, live, peak) == (counter.allocated, 0, counter.peak)
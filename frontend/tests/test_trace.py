@@ -0,0 +1,67 @@
+import pytest
+
+from codecrux.algorithms import sorting
+from playback import trace as trace_module
+from playback.timeline import Timeline
+from playback.trace import Trace, TraceHooks
+
+# Floats and a big integer are written as constants rather than operands
+NUMBERS = [0.42, 3, -7, 2**40, 0.42, 19, -1.5, 3, 8, 0.0]
+
+
+def recorded(algorithm="bucket_sort", numbers=NUMBERS):
+    trace = Trace(numbers)
+    getattr(sorting, algorithm)(list(numbers), TraceHooks(trace.append))
+    return trace
+
+
+def events(trace):
+    return [trace[index] for index in range(len(trace))]
+
+
+def test_constants_round_trip_in_memory():
+    trace = recorded()
+    assert trace.constants
+    written = [b for op, a, b in events(trace) if op == trace_module.WRITE]
+    assert 2**40 in written and -1.5 in written
+
+
+def test_save_and_open(tmp_path):
+    trace = recorded()
+    path = tmp_path / "run.cctrace"
+    trace.save(path)
+    opened = Trace.open(path)
+    assert opened.mapping is not None
+    assert opened.initial == trace.initial
+    assert opened.constants == trace.constants
+    assert len(opened) == len(trace)
+    assert events(opened) == events(trace)
+    # The opened trace plays back as the recorded one
+    assert Timeline(opened).state.snapshot() == Timeline(trace).state.snapshot()
+
+
+def test_open_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a trace at all")
+    with pytest.raises(ValueError):
+        Trace.open(path)
+
+
+def test_short_trace_stays_in_memory():
+    trace = recorded()
+    expected = events(trace)
+    trace.seal()
+    assert trace.mapping is None
+    assert events(trace) == expected
+
+
+def test_long_trace_spills_when_sealed(monkeypatch):
+    trace = recorded("heap_sort", list(range(40, 0, -1)))
+    monkeypatch.setattr(trace_module, "SPILL_EVENTS", len(trace) - 1)
+    expected = events(trace)
+    trace.seal()
+    assert trace.mapping is not None
+    assert isinstance(trace.ops, memoryview)
+    assert len(trace) == len(expected)
+    assert events(trace) == expected
+    assert trace[-1] == expected[-1]